@@ -1,4 +1,23 @@
 order = [
     'artellapipe.tools.playblastmanager.core.defines',
-    'artellapipe.tools.playblastmanager.core.plugin'
+    'artellapipe.tools.playblastmanager.core.timings',
+    'artellapipe.tools.playblastmanager.core.profiler',
+    'artellapipe.tools.playblastmanager.core.plugin',
+    'artellapipe.tools.playblastmanager.core.discovery',
+    'artellapipe.tools.playblastmanager.core.naming',
+    'artellapipe.tools.playblastmanager.core.snapshot',
+    'artellapipe.tools.playblastmanager.core.streaming',
+    'artellapipe.tools.playblastmanager.core.stamper',
+    'artellapipe.tools.playblastmanager.core.incremental',
+    'artellapipe.tools.playblastmanager.core.trackerindex',
+    'artellapipe.tools.playblastmanager.core.uploads',
+    'artellapipe.tools.playblastmanager.core.outputscache',
+    'artellapipe.tools.playblastmanager.core.changebus',
+    'artellapipe.tools.playblastmanager.core.presetindex',
+    'artellapipe.tools.playblastmanager.core.previewcache',
+    'artellapipe.tools.playblastmanager.core.viewportgrab',
+    'artellapipe.tools.playblastmanager.core.engine',
+    'artellapipe.tools.playblastmanager.core.worker',
+    'artellapipe.tools.playblastmanager.core.batch',
+    'artellapipe.tools.playblastmanager.core.chunks'
 ]
@@ -0,0 +1,293 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains implementation for batch playblast captures using a pool of standalone DCC processes
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import os
+import sys
+import json
+import shutil
+import logging
+import tempfile
+import threading
+import subprocess
+from multiprocessing.pool import ThreadPool
+
+import artellapipe
+from artellapipe.tools.playblastmanager.core import engine
+
+LOGGER = logging.getLogger()
+
+WORKER_MODULE = 'artellapipe.tools.playblastmanager.core.worker'
+
+# Options that depend on the scene where they were retrieved. They are not shared by batch shots, so each worker
+# resolves them from the scene of its shot, unless the shot overrides them
+SCENE_OPTIONS = ('start_frame', 'end_frame', 'frame', 'camera', 'sound')
+
+
+def get_mayapy_path():
+    """
+    Returns path of the mayapy executable of the current Maya session
+    :return: str or None
+    """
+
+    exe_name = 'mayapy.exe' if sys.platform == 'win32' else 'mayapy'
+    search_dirs = [os.path.dirname(sys.executable)]
+    maya_location = os.environ.get('MAYA_LOCATION', None)
+    if maya_location:
+        search_dirs.append(os.path.join(maya_location, 'bin'))
+    for search_dir in search_dirs:
+        mayapy_path = os.path.join(search_dir, exe_name)
+        if os.path.isfile(mayapy_path):
+            return mayapy_path
+
+    return None
+
+
+class BatchShot(object):
+    """
+    Stores the state of a shot captured by a batch
+    """
+
+    def __init__(self, shot_name, scene, sequence_name=None, options=None):
+        """
+        :param shot_name: str
+        :param scene: str, scene file that is opened to capture the shot
+        :param sequence_name: str
+        :param options: dict, options that override batch shared options for this shot
+        """
+
+        self.shot_name = shot_name
+        self.scene = scene
+        self.sequence_name = sequence_name
+        self.options = options or dict()
+
+        self.status = engine.JobStatus.PENDING
+        self.attempts = 0
+        self.filename = None
+        self.errors = list()
+
+    def __repr__(self):
+        return u"%s.%s(%r, %r)" % (__name__, type(self).__name__, self.shot_name, self.status)
+
+
+class BatchCapture(object):
+    """
+    Captures multiple shots. Each shot is captured by a standalone DCC process (mayapy) and N processes run
+    in parallel. All shots share the same playblast options, stored once in disk. Scene options (frame range,
+    camera and sound) are not shared, so they are resolved from the scene of each shot
+    """
+
+    def __init__(self, options, output_dir, workers=2, retries=1, executable=None, bootstrap=None, timeout=None):
+        """
+        :param options: dict, merged playblast options shared by all shots
+        :param output_dir: str, folder where playblasts are stored
+        :param workers: int, number of processes that capture shots in parallel
+        :param retries: int, number of times a failed shot is captured again
+        :param executable: str, standalone DCC executable (mayapy by default)
+        :param bootstrap: str, module imported by workers to initialize the project in the standalone session
+        :param timeout: int, maximum number of seconds a worker can take to capture a shot
+        """
+
+        self._options = dict(
+            (key, value) for key, value in (options or dict()).items() if key not in SCENE_OPTIONS)
+        self._output_dir = output_dir
+        self._workers = max(1, int(workers))
+        self._retries = max(0, int(retries))
+        self._executable = executable or get_mayapy_path()
+        self._bootstrap = bootstrap
+        self._timeout = timeout
+        self._shots = list()
+        self._lock = threading.Lock()
+        self._batch_dir = None
+
+    @property
+    def shots(self):
+        return self._shots
+
+    @property
+    def output_dir(self):
+        return self._output_dir
+
+    def add_shot(self, shot_name, scene, sequence_name=None, **options):
+        """
+        Adds a new shot to capture
+        :param shot_name: str
+        :param scene: str
+        :param sequence_name: str
+        :param options: dict, options that override the shared ones for this shot
+        :return: BatchShot
+        """
+
+        shot_options = {
+            'filename': os.path.join(self._output_dir, shot_name),
+            'shot_name': shot_name,
+            'sequence_name': sequence_name,
+        }
+        shot_options.update(options)
+        batch_shot = BatchShot(shot_name, scene, sequence_name=sequence_name, options=shot_options)
+        self._shots.append(batch_shot)
+
+        return batch_shot
+
+    def add_sequence(self, sequence_name, scene_getter):
+        """
+        Adds all the shots of the given sequence
+        :param sequence_name: str
+        :param scene_getter: fn, function that receives a shot and returns the scene file used to capture it
+        :return: list(BatchShot)
+        """
+
+        added_shots = list()
+        sequence_shots = artellapipe.ShotsMgr().get_shots_from_sequence(sequence_name) or list()
+        for shot in sequence_shots:
+            scene = scene_getter(shot)
+            if not scene:
+                LOGGER.warning('No scene found for shot "{}". Skipping it ...'.format(shot.get_name()))
+                continue
+            added_shots.append(self.add_shot(shot.get_name(), scene, sequence_name=sequence_name))
+
+        return added_shots
+
+    def run(self, callback=None):
+        """
+        Captures all batch shots
+        :param callback: fn, function called with a BatchShot each time its status changes. Called from worker threads
+        :return: list(BatchShot)
+        """
+
+        if not self._executable:
+            raise RuntimeError('No standalone executable found to run batch playblasts!')
+        if not self._shots:
+            return list()
+
+        # Shots can be captured again, so the state of previous runs is not kept
+        for batch_shot in self._shots:
+            batch_shot.status = engine.JobStatus.PENDING
+            batch_shot.attempts = 0
+            batch_shot.filename = None
+            batch_shot.errors = list()
+
+        options_file = os.path.join(self._get_batch_dir(), 'options.json')
+        with open(options_file, 'w') as fh:
+            json.dump(self._options, fh, indent=4)
+
+        pool = ThreadPool(min(self._workers, len(self._shots)))
+        try:
+            pool.map(lambda batch_shot: self._capture_shot(batch_shot, options_file, callback), self._shots)
+        finally:
+            pool.close()
+            pool.join()
+            self.cleanup()
+
+        return self._shots
+
+    def cleanup(self):
+        """
+        Removes the folder where worker job files are stored
+        """
+
+        if self._batch_dir and os.path.isdir(self._batch_dir):
+            shutil.rmtree(self._batch_dir, ignore_errors=True)
+        self._batch_dir = None
+
+    def get_status(self):
+        """
+        Returns the status of all shots of the batch
+        :return: dict
+        """
+
+        with self._lock:
+            return dict((batch_shot.shot_name, batch_shot.status) for batch_shot in self._shots)
+
+    def run_worker(self, job_data, job_name):
+        """
+        Runs a worker process with given job data and returns its result
+        :param job_data: dict
+        :param job_name: str, name used to store worker job files
+        :return: dict
+        """
+
+        job_data = dict(job_data)
+        job_data['output_dir'] = self._output_dir
+        if self._bootstrap:
+            job_data['bootstrap'] = self._bootstrap
+        batch_dir = self._get_batch_dir()
+        job_file = os.path.join(batch_dir, '{}.json'.format(job_name))
+        result_file = os.path.join(batch_dir, '{}_result.json'.format(job_name))
+        if os.path.isfile(result_file):
+            os.remove(result_file)
+        with open(job_file, 'w') as fh:
+            json.dump(job_data, fh, indent=4)
+
+        cmd = [self._executable, '-m', WORKER_MODULE, job_file, '--result', result_file]
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        timer = None
+        if self._timeout:
+            timer = threading.Timer(self._timeout, process.kill)
+            timer.start()
+        try:
+            output = process.communicate()[0]
+        finally:
+            if timer:
+                timer.cancel()
+
+        if not os.path.isfile(result_file):
+            return {
+                'status': engine.JobStatus.FAILED, 'filename': None,
+                'errors': ['Worker exited with code {}: {}'.format(process.returncode, output)]}
+        with open(result_file, 'r') as fh:
+            return json.load(fh)
+
+    def _get_batch_dir(self):
+        """
+        Internal function that returns the folder where worker job files are stored
+        :return: str
+        """
+
+        with self._lock:
+            if not self._batch_dir:
+                self._batch_dir = tempfile.mkdtemp(prefix='playblast_batch_')
+
+        return self._batch_dir
+
+    def _capture_shot(self, batch_shot, options_file, callback=None):
+        """
+        Internal function that captures given shot, retrying it if necessary
+        :param batch_shot: BatchShot
+        :param options_file: str
+        :param callback: fn
+        """
+
+        job_data = {'scene': batch_shot.scene, 'options_file': options_file, 'options': batch_shot.options}
+        while batch_shot.attempts <= self._retries:
+            with self._lock:
+                batch_shot.attempts += 1
+                batch_shot.status = engine.JobStatus.RUNNING
+            if callback:
+                callback(batch_shot)
+            try:
+                result = self.run_worker(job_data, batch_shot.shot_name)
+            except Exception as exc:
+                result = {'status': engine.JobStatus.FAILED, 'filename': None, 'errors': [str(exc)]}
+            with self._lock:
+                batch_shot.status = result.get('status', engine.JobStatus.FAILED)
+                batch_shot.filename = result.get('filename', None)
+                batch_shot.errors.extend(result.get('errors', list()))
+            if callback:
+                callback(batch_shot)
+            if batch_shot.status == engine.JobStatus.FINISHED:
+                break
+            LOGGER.warning('Shot "{}" capture failed (attempt {}/{})'.format(
+                batch_shot.shot_name, batch_shot.attempts, self._retries + 1))
+
+        return batch_shot
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains implementation for the bus that debounces options changes of playblast plugins
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import time
+import logging
+from functools import partial
+
+from Qt.QtCore import *
+
+LOGGER = logging.getLogger()
+
+
+class OptionsChangeBus(QObject, object):
+    """
+    Collects optionsChanged signals of playblast plugins and emits a single optionsChanged signal, with the ids of all
+    the plugins that changed, once no more changes are notified during the debounce interval. While changes keep
+    being notified (for example, while a spinbox is being dragged), they are emitted at least once every max_wait
+    """
+
+    optionsChanged = Signal(list)
+
+    def __init__(self, interval=150, max_wait=500, parent=None):
+        """
+        :param interval: int, milliseconds without changes before changes are emitted
+        :param max_wait: int, maximum milliseconds changes are retained while changes keep being notified
+        :param parent: QObject
+        """
+
+        super(OptionsChangeBus, self).__init__(parent)
+
+        self._max_wait = max_wait
+        self._pending = list()
+        self._first_change_time = None
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval)
+        self._timer.timeout.connect(self.flush)
+
+    def register_plugin(self, playblast_plugin):
+        """
+        Registers given plugin, so its optionsChanged signals are collected by the bus
+        :param playblast_plugin: PlayblastPlugin
+        """
+
+        playblast_plugin.optionsChanged.connect(partial(self.notify, playblast_plugin.id))
+
+    def has_pending(self):
+        """
+        Returns whether there are changes that are not emitted yet
+        :return: bool
+        """
+
+        return bool(self._pending)
+
+    def notify(self, plugin_id, *args):
+        """
+        Notifies that the options of the given plugin changed
+        :param plugin_id: str
+        """
+
+        if plugin_id not in self._pending:
+            self._pending.append(plugin_id)
+
+        now = time.time()
+        if self._first_change_time is None:
+            self._first_change_time = now
+        elif (now - self._first_change_time) * 1000 >= self._max_wait:
+            self.flush()
+            return
+
+        self._timer.start()
+
+    def flush(self):
+        """
+        Emits pending changes immediately
+        """
+
+        self._timer.stop()
+        self._first_change_time = None
+        if not self._pending:
+            return
+
+        plugin_ids, self._pending = self._pending, list()
+        self.optionsChanged.emit(plugin_ids)
@@ -0,0 +1,240 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains implementation to capture long frame ranges splitting them in chunks captured in parallel
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import os
+import math
+import shutil
+import logging
+
+from artellapipe.tools.playblastmanager.core import engine, batch, streaming
+from artellapipe.tools.playblastmanager.core.streaming import get_frame_number
+
+LOGGER = logging.getLogger()
+
+
+def split_frame_range(start_frame, end_frame, chunk_size=None, chunks=None):
+    """
+    Splits given frame range in consecutive chunks
+    :param start_frame: int
+    :param end_frame: int
+    :param chunk_size: int, number of frames of each chunk
+    :param chunks: int, number of chunks to generate. Only used if chunk_size is not given
+    :return: list(tuple(int, int))
+    """
+
+    start_frame = int(start_frame)
+    end_frame = int(end_frame)
+    total_frames = end_frame - start_frame + 1
+    if total_frames <= 0:
+        return list()
+    if not chunk_size:
+        chunk_size = int(math.ceil(total_frames / float(max(1, chunks or 1))))
+    chunk_size = max(1, int(chunk_size))
+
+    return [(chunk_start, min(chunk_start + chunk_size - 1, end_frame))
+            for chunk_start in range(start_frame, end_frame + 1, chunk_size)]
+
+
+def stitch_segments(segments, target_dir, name, padding=4):
+    """
+    Merges captured image segments in a single image sequence, in frame order.
+    Each segment only contributes the frames of its own range, so overlapping frames are discarded
+    :param segments: list(tuple(list(str), int, int)), list of segment files and the frame range that segment owns
+    :param target_dir: str, folder where merged image sequence is stored
+    :param name: str, base name of the merged image sequence
+    :param padding: int
+    :return: list(str), merged image sequence files sorted by frame
+    """
+
+    if not os.path.isdir(target_dir):
+        os.makedirs(target_dir)
+
+    frames = dict()
+    for segment_files, start_frame, end_frame in segments:
+        for segment_file in segment_files or list():
+            frame = get_frame_number(segment_file)
+            if frame is None or frame < start_frame or frame > end_frame:
+                continue
+            frames[frame] = segment_file
+
+    stitched_files = list()
+    for frame in sorted(frames.keys()):
+        ext = os.path.splitext(frames[frame])[-1]
+        target_file = os.path.join(target_dir, '{}.{}{}'.format(name, str(frame).zfill(padding), ext))
+        shutil.move(frames[frame], target_file)
+        stitched_files.append(target_file)
+
+    return stitched_files
+
+
+class ChunkedCapture(object):
+    """
+    Captures the frame range of a scene splitting it in chunks. Each chunk is captured as an image sequence by a
+    standalone worker process and segments are merged back into a single sequence or movie
+    """
+
+    def __init__(self, options, scene, output_dir, chunk_size=100, workers=4, overlap=0, retries=1,
+                 executable=None, bootstrap=None, ffmpeg=None, fps=None):
+        """
+        :param options: dict, merged playblast options. start_frame and end_frame define the range to capture
+        :param scene: str, scene file to capture
+        :param output_dir: str, folder where playblast is stored
+        :param chunk_size: int, number of frames captured by each worker
+        :param workers: int, number of workers that capture chunks in parallel
+        :param overlap: int, number of frames each chunk captures before its range so evaluation settles. Overlapped
+            frames are discarded when segments are merged
+        :param retries: int, number of times a failed chunk is captured again
+        :param executable: str, standalone DCC executable (mayapy by default)
+        :param bootstrap: str, module imported by workers to initialize the project in the standalone session
+        :param ffmpeg: str, FFmpeg executable used to encode merged movie
+        :param fps: float, frame rate of the merged movie. If not given, fps option or scene frame rate is used
+        """
+
+        self._options = dict(options or dict())
+        self._scene = scene
+        self._output_dir = output_dir
+        self._chunk_size = chunk_size
+        self._overlap = max(0, int(overlap))
+        self._ffmpeg = ffmpeg
+        self._fps = fps or self._options.get('fps', None)
+        self._segments_dir = os.path.join(output_dir, '_segments')
+        self._batch = batch.BatchCapture(
+            self._get_chunk_options(), self._segments_dir, workers=workers, retries=retries,
+            executable=executable, bootstrap=bootstrap)
+
+    @property
+    def batch(self):
+        return self._batch
+
+    def get_chunks(self):
+        """
+        Returns the frame ranges that will be captured by each worker. If a list of frames is captured, ranges only
+        contain the chunks with frames to capture
+        :return: list(tuple(int, int))
+        """
+
+        frames = self._get_frames()
+        if frames:
+            return [(start_frame, end_frame) for start_frame, end_frame in split_frame_range(
+                frames[0], frames[-1], chunk_size=self._chunk_size)
+                if self._get_chunk_frames(frames, start_frame, end_frame)]
+
+        start_frame = self._options.get('start_frame', None)
+        end_frame = self._options.get('end_frame', None)
+        if start_frame is None or end_frame is None:
+            raise ValueError('Chunked captures need a start and an end frame!')
+
+        return split_frame_range(start_frame, end_frame, chunk_size=self._chunk_size)
+
+    def run(self, callback=None):
+        """
+        Captures all the chunks and merges them. Movies are encoded with the codec of the options, so chunked
+        captures of codecs that FFmpeg can not encode are not supported
+        :param callback: fn, function called with a BatchShot each time a chunk changes its status
+        :return: list(str), generated files
+        """
+
+        movie_codec = None
+        if self._options.get('format', None) != 'image':
+            movie_codec = streaming.get_movie_codec(self._options)
+            if not movie_codec:
+                raise ValueError('Chunked captures can not encode "{} | {}" movies with FFmpeg!'.format(
+                    self._options.get('format', None), self._options.get('compression', None)))
+            if self._options.get('sound', None):
+                raise ValueError('Chunked captures can not encode movies with sound "{}" with FFmpeg!'.format(
+                    self._options['sound']))
+
+        name = os.path.basename(self._options.get('filename', None) or 'playblast').replace('.', '_')
+        chunks = self.get_chunks()
+        frames = self._get_frames()
+        for i, (start_frame, end_frame) in enumerate(chunks):
+            chunk_name = 'chunk_{}'.format(str(i).zfill(3))
+            # Each chunk only captures the frames of the list that are inside its own range
+            chunk_frames = self._get_chunk_frames(frames, start_frame, end_frame) if frames else None
+            # Scene options are not shared by batch shots, but all chunks capture the scene with the same ones
+            scene_options = dict(
+                (key, self._options[key]) for key in batch.SCENE_OPTIONS if key in self._options)
+            scene_options.update({
+                'start_frame': start_frame - self._overlap,
+                'end_frame': end_frame,
+                'frame': chunk_frames,
+                'filename': os.path.join(self._segments_dir, chunk_name, name)
+            })
+            self._batch.add_shot(chunk_name, self._scene, **scene_options)
+
+        self._batch.run(callback=callback)
+
+        failed_chunks = [chunk.shot_name for chunk in self._batch.shots if chunk.status != engine.JobStatus.FINISHED]
+        if failed_chunks:
+            LOGGER.warning('Chunks {} failed. Segments are kept in: "{}"'.format(failed_chunks, self._segments_dir))
+            return list()
+
+        segments = [(chunk.filename, start_frame, end_frame)
+                    for chunk, (start_frame, end_frame) in zip(self._batch.shots, chunks)]
+        sequence_dir = os.path.join(self._output_dir, name)
+        output_files = stitch_segments(segments, sequence_dir, name)
+        shutil.rmtree(self._segments_dir, ignore_errors=True)
+
+        if movie_codec:
+            extension, codec_args = movie_codec
+            movie_file = streaming.encode_sequence(
+                output_files, os.path.join(self._output_dir, '{}{}'.format(name, extension)), codec_args,
+                fps=self._fps or engine.get_scene_fps(), ffmpeg=self._ffmpeg)
+            if movie_file:
+                shutil.rmtree(sequence_dir, ignore_errors=True)
+                output_files = [movie_file]
+
+        return output_files
+
+    def _get_chunk_options(self):
+        """
+        Internal function that returns options used to capture chunks. Chunks are always captured as image sequences
+        with raw frame numbers so they can be merged without quality loss
+        :return: dict
+        """
+
+        chunk_options = dict(self._options)
+        chunk_options.update({
+            'format': 'image',
+            'compression': 'png',
+            'raw_frame_numbers': True,
+            'viewer': False,
+            'enable_stamp': False,
+            'tracker_enable': False
+        })
+
+        return chunk_options
+
+    def _get_frames(self):
+        """
+        Internal function that returns the sorted list of frames to capture, if a list of frames is captured
+        :return: list(int) or None
+        """
+
+        frames = self._options.get('frame', None)
+        if not frames:
+            return None
+
+        return sorted(set(int(frame) for frame in frames))
+
+    def _get_chunk_frames(self, frames, start_frame, end_frame):
+        """
+        Internal function that returns the frames of the given list that are inside the given chunk range
+        :param frames: list(int)
+        :param start_frame: int
+        :param end_frame: int
+        :return: list(int)
+        """
+
+        return [frame for frame in frames if start_frame <= frame <= end_frame]
@@ -0,0 +1,261 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains implementation for playblast plugins discovery. Discovered plugins are stored in a manifest file,
+so plugin modules are only scanned again when their files change
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import os
+import sys
+import json
+import inspect
+import logging
+import pkgutil
+
+LOGGER = logging.getLogger()
+
+MANIFEST_VERSION = 1
+
+
+def get_default_manifest_file():
+    """
+    Returns default file where discovered plugins are stored
+    :return: str
+    """
+
+    return os.path.join(os.path.expanduser('~'), '.artellapipe', 'playblast_plugins_manifest.json')
+
+
+def get_plugins(plugins_paths, base_class, plugin_ids=None, manifest_file=None):
+    """
+    Returns plugins located in the given paths
+    :param plugins_paths: list(str), folders where plugins are located
+    :param base_class: type, base class of the plugins
+    :param plugin_ids: list(str), if given, only modules that define plugins with these ids are imported
+    :param manifest_file: str, file where discovered plugins are stored. Default manifest file is used if not given
+    :return: dict(str, type), plugin classes by class name
+    """
+
+    manifest = PluginsManifest(manifest_file or get_default_manifest_file())
+
+    return manifest.get_plugins(plugins_paths, base_class, plugin_ids=plugin_ids)
+
+
+class PluginsManifest(object):
+    """
+    Stores the plugin classes defined in each module of a plugins folder. A folder is only scanned again when one of
+    its modules is added, removed or modified
+    """
+
+    def __init__(self, manifest_file):
+        """
+        :param manifest_file: str
+        """
+
+        self._manifest_file = manifest_file
+
+    @property
+    def manifest_file(self):
+        return self._manifest_file
+
+    def get_plugins(self, plugins_paths, base_class, plugin_ids=None):
+        """
+        Returns plugins located in the given paths. Only modules that define the requested plugins are imported
+        :param plugins_paths: list(str), folders where plugins are located
+        :param base_class: type, base class of the plugins
+        :param plugin_ids: list(str), if given, only modules that define plugins with these ids are imported
+        :return: dict(str, type), plugin classes by class name
+        """
+
+        manifest = self._read()
+        folders = manifest.setdefault('folders', dict())
+        plugins_found = dict()
+        updated = False
+
+        for plugin_path in plugins_paths:
+            if not plugin_path or not os.path.isdir(plugin_path):
+                LOGGER.warning('Plugin Path "{}" does not exist!'.format(plugin_path))
+                continue
+
+            modules = get_plugin_modules(plugin_path)
+            folder_manifest = folders.get(plugin_path, None)
+            if not self._is_valid(folder_manifest, modules):
+                folder_manifest = scan_folder(modules, base_class)
+                folders[plugin_path] = folder_manifest
+                updated = True
+
+            for module_path, module_info in sorted(folder_manifest['modules'].items()):
+                class_names = [
+                    class_info['name'] for class_info in module_info['classes']
+                    if plugin_ids is None or class_info['id'] in plugin_ids]
+                if not class_names:
+                    continue
+                module = load_module(module_info['name'], module_path)
+                for class_name in class_names:
+                    plugin_class = getattr(module, class_name, None)
+                    if not inspect.isclass(plugin_class) or not issubclass(plugin_class, base_class):
+                        LOGGER.warning('Playblast Plugin "{}" not found in "{}"'.format(class_name, module_path))
+                        continue
+                    if class_name in plugins_found:
+                        LOGGER.warning(
+                            'Playblast Plugin with name "{}" is already registered! Overriding ...'.format(class_name))
+                    plugins_found[class_name] = plugin_class
+
+        if updated:
+            self._write(manifest)
+
+        return plugins_found
+
+    def _is_valid(self, folder_manifest, modules):
+        """
+        Internal function that returns whether given folder manifest is still valid for the given modules
+        :param folder_manifest: dict or None
+        :param modules: dict(str, dict), module info by module path
+        :return: bool
+        """
+
+        if not folder_manifest or folder_manifest.get('version', None) != MANIFEST_VERSION:
+            return False
+
+        manifest_modules = folder_manifest.get('modules', dict())
+        if set(manifest_modules.keys()) != set(modules.keys()):
+            return False
+
+        for module_path, module_info in modules.items():
+            if manifest_modules[module_path].get('mtime', None) != module_info['mtime']:
+                return False
+
+        return True
+
+    def _read(self):
+        """
+        Internal function that reads manifest from disk
+        :return: dict
+        """
+
+        if not os.path.isfile(self._manifest_file):
+            return dict()
+        try:
+            with open(self._manifest_file, 'r') as fh:
+                return json.load(fh)
+        except Exception as exc:
+            LOGGER.warning('Impossible to read playblast plugins manifest "{}": {}'.format(self._manifest_file, exc))
+            return dict()
+
+    def _write(self, manifest):
+        """
+        Internal function that writes manifest into disk. Manifest is replaced atomically, so sessions reading it
+        never find a partially written manifest
+        :param manifest: dict
+        """
+
+        manifest_dir = os.path.dirname(self._manifest_file)
+        try:
+            if manifest_dir and not os.path.isdir(manifest_dir):
+                os.makedirs(manifest_dir)
+            temp_file = '{}.{}'.format(self._manifest_file, os.getpid())
+            with open(temp_file, 'w') as fh:
+                json.dump(manifest, fh, indent=4, sort_keys=True)
+            if hasattr(os, 'replace'):
+                os.replace(temp_file, self._manifest_file)
+            else:
+                # Python 2 cannot rename a file over an existing one in Windows
+                if os.path.isfile(self._manifest_file):
+                    os.remove(self._manifest_file)
+                os.rename(temp_file, self._manifest_file)
+        except Exception as exc:
+            LOGGER.warning('Impossible to write playblast plugins manifest "{}": {}'.format(self._manifest_file, exc))
+
+
+def get_plugin_modules(plugin_path):
+    """
+    Returns modules located in the given folder. Modules are not imported
+    :param plugin_path: str
+    :return: dict(str, dict), module name and modification time by module path
+    """
+
+    modules = dict()
+    for _, module_name, is_package in pkgutil.iter_modules([plugin_path]):
+        if is_package:
+            module_path = os.path.join(plugin_path, module_name, '__init__.py')
+        else:
+            module_path = os.path.join(plugin_path, '{}.py'.format(module_name))
+        if not os.path.isfile(module_path):
+            continue
+        modules[module_path] = {'name': module_name, 'mtime': os.path.getmtime(module_path)}
+
+    return modules
+
+
+def scan_folder(modules, base_class):
+    """
+    Imports given modules and returns the manifest of the plugins they define
+    :param modules: dict(str, dict), module info by module path
+    :param base_class: type, base class of the plugins
+    :return: dict
+    """
+
+    folder_manifest = {'version': MANIFEST_VERSION, 'modules': dict()}
+    for module_path, module_info in modules.items():
+        module = load_module(module_info['name'], module_path, reload_module=True)
+        if not module:
+            continue
+        classes = list()
+        for class_name, obj in inspect.getmembers(module, inspect.isclass):
+            if issubclass(obj, base_class) and obj.__module__ == module.__name__:
+                classes.append({'name': class_name, 'id': obj.id})
+        folder_manifest['modules'][module_path] = dict(module_info, classes=classes)
+
+    return folder_manifest
+
+
+def load_module(module_name, module_path, reload_module=False):
+    """
+    Imports module located in the given path. Modules already imported are reused
+    :param module_name: str
+    :param module_path: str
+    :param reload_module: bool, whether module should be imported again if it is already imported
+    :return: module or None
+    """
+
+    module = sys.modules.get(module_name, None)
+    if module and not reload_module and _is_same_file(getattr(module, '__file__', None), module_path):
+        return module
+
+    try:
+        if sys.version_info[0] < 3:
+            import imp
+            return imp.load_source(module_name, module_path)
+
+        import importlib.util
+        spec = importlib.util.spec_from_file_location(module_name, module_path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+        return module
+    except Exception as exc:
+        sys.modules.pop(module_name, None)
+        LOGGER.warning('Impossible to load Playblast Plugin module "{}": {}'.format(module_path, exc))
+        return None
+
+
+def _is_same_file(file_path, module_path):
+    """
+    Internal function that returns whether given module file is the source file of the given module path
+    :param file_path: str or None
+    :param module_path: str
+    :return: bool
+    """
+
+    if not file_path:
+        return False
+
+    return os.path.splitext(os.path.abspath(file_path))[0] == os.path.splitext(os.path.abspath(module_path))[0]
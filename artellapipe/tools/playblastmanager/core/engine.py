@@ -0,0 +1,739 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains headless implementation of the playblast capture pipeline
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import os
+import re
+import shutil
+import logging
+import traceback
+
+import tpDcc as tp
+from tpDcc.libs.python import path as path_utils, folder, osplatform
+
+import artellapipe
+from artellapipe.tools.playblastmanager.core import naming, streaming, incremental, stamper, uploads, trackerindex
+from artellapipe.tools.playblastmanager.core import timings, snapshot
+
+if tp.is_maya():
+    import tpDcc.dccs.maya as maya
+
+LOGGER = logging.getLogger()
+
+DEFAULT_FPS = 24
+
+# Frame rate of the named Maya time units. The rest of units are named by their frame rate (23.976fps, 29.97df, ...)
+TIME_UNIT_FPS = {
+    'game': 15,
+    'film': 24,
+    'pal': 25,
+    'ntsc': 30,
+    'show': 48,
+    'palf': 50,
+    'ntscf': 60
+}
+TIME_UNIT_REGEX = re.compile(r'^(\d+(?:\.\d+)?)(?:fps|df)$')
+
+
+class JobStatus(object):
+    PENDING = 'pending'
+    RUNNING = 'running'
+    FINISHED = 'finished'
+    FAILED = 'failed'
+    CANCELLED = 'cancelled'
+
+
+class PlayblastJob(object):
+    """
+    Stores the state of a single playblast capture. A job is created from the merged outputs of all playblast plugins
+    (PlayblastManager.get_outputs) so it can be created and executed without any UI
+    """
+
+    def __init__(self, options, output_dir=None):
+        """
+        :param options: dict or PlayblastOptions, merged playblast options
+        :param output_dir: str, folder where playblasts are stored when no filename is defined in the options
+        """
+
+        # Stages update job options while the job is executed, so they are stored in a mutable copy of the snapshot
+        self._snapshot = snapshot.PlayblastOptions(options)
+        self._options = self._snapshot.to_dict()
+        self._output_dir = output_dir
+
+        self.status = JobStatus.PENDING
+        self.filename = None
+        self.fps = None
+        self.open_viewer = False
+        self.temp_dir = None
+        self.capture_path = None
+        self.output_files = list()
+        self.uploaded = False
+        self.errors = list()
+        self.timings = list()
+        self._cancelled = False
+
+    def __repr__(self):
+        return u"%s.%s(%r, %r)" % (__name__, type(self).__name__, self.filename, self.status)
+
+    @property
+    def options(self):
+        return self._options
+
+    @property
+    def snapshot(self):
+        """
+        Returns immutable snapshot of the options the job was created with. It can be used as key of caches and queues
+        :return: PlayblastOptions
+        """
+
+        return self._snapshot
+
+    @property
+    def output_dir(self):
+        return self._output_dir
+
+    @property
+    def succeeded(self):
+        return self.status == JobStatus.FINISHED
+
+    @property
+    def cancelled(self):
+        return self._cancelled
+
+    def cancel(self):
+        """
+        Requests the cancellation of the job. Job stops before starting its next stage
+        """
+
+        self._cancelled = True
+
+    def add_error(self, msg):
+        """
+        Registers an error message in the job
+        :param msg: str
+        """
+
+        LOGGER.warning(msg)
+        self.errors.append(msg)
+
+
+def get_scene_fps():
+    """
+    Returns the frame rate of the current scene. Movies encoded with FFmpeg use it, so they play at the same speed
+    than the ones captured by the DCC
+    :return: float
+    """
+
+    if not tp.is_maya():
+        return DEFAULT_FPS
+
+    time_unit = maya.cmds.currentUnit(query=True, time=True)
+    if time_unit in TIME_UNIT_FPS:
+        return TIME_UNIT_FPS[time_unit]
+    time_unit_match = TIME_UNIT_REGEX.match(time_unit or '')
+    if not time_unit_match:
+        LOGGER.warning('Impossible to retrieve frame rate of time unit "{}". Using {} fps ...'.format(
+            time_unit, DEFAULT_FPS))
+        return DEFAULT_FPS
+
+    return float(time_unit_match.group(1))
+
+
+class PlayblastEngine(object):
+    """
+    Runs playblast jobs. Capture, stamp, file move, temp folder cleanup and tracker upload are executed as separated
+    stages so they can be driven from a standalone session (mayapy) without instancing PlayblastManager widget
+    """
+
+    STAGES = ('prepare', 'capture', 'stamp', 'move', 'cleanup', 'upload')
+    CAPTURE_STAGES = ('prepare', 'capture')
+    POST_CAPTURE_STAGES = ('stamp', 'move', 'cleanup', 'upload')
+
+    def __init__(self, playblasts_mgr=None, media_mgr=None, shots_mgr=None, tracker=None, fingerprinter=None,
+                 upload_queue=None, tracker_index=None):
+        """
+        Managers are resolved from artellapipe when they are not given.
+        If an upload queue is given, upload stage queues the upload instead of waiting for it.
+        Tracker tasks are found using the session tracker index, unless other managers or index are given
+        """
+
+        self._playblasts_mgr = playblasts_mgr
+        self._media_mgr = media_mgr
+        self._shots_mgr = shots_mgr
+        self._tracker = tracker
+        self._fingerprinter = fingerprinter or incremental.FrameFingerprinter()
+        self._upload_queue = upload_queue
+        if not tracker_index and (shots_mgr or tracker):
+            tracker_index = trackerindex.TrackerIndex(tracker=tracker, shots_mgr=shots_mgr)
+        self._tracker_index = tracker_index
+
+    @property
+    def playblasts_mgr(self):
+        return self._playblasts_mgr or artellapipe.PlayblastsMgr()
+
+    @property
+    def media_mgr(self):
+        return self._media_mgr or artellapipe.MediaMgr()
+
+    @property
+    def shots_mgr(self):
+        return self._shots_mgr or artellapipe.ShotsMgr()
+
+    @property
+    def tracker(self):
+        return self._tracker or artellapipe.Tracker()
+
+    @property
+    def tracker_index(self):
+        return self._tracker_index or trackerindex.get_tracker_index()
+
+    def run(self, job, stages=None, stage_callback=None):
+        """
+        Executes the stages of the given job. If the job is cancelled, it stops before starting next stage.
+        Temporary files are always removed if cleanup stage was requested
+        :param job: PlayblastJob
+        :param stages: list(str), stages to execute. All stages are executed by default
+        :param stage_callback: fn, function called with the job, stage name, stage index and total of stages before
+            executing each stage
+        :return: PlayblastJob
+        """
+
+        stages = stages or self.STAGES
+        job.status = JobStatus.RUNNING
+        for i, stage_name in enumerate(stages):
+            if job.cancelled:
+                job.status = JobStatus.CANCELLED
+                break
+            if stage_callback:
+                stage_callback(job, stage_name, i, len(stages))
+            try:
+                with timings.measure(job.timings, stage_name):
+                    valid = getattr(self, stage_name)(job)
+            except Exception as exc:
+                LOGGER.error('{} | {}'.format(exc, traceback.format_exc()))
+                job.add_error('Error while executing playblast stage "{}": {}'.format(stage_name, exc))
+                valid = False
+            if valid is False:
+                job.status = JobStatus.FAILED
+                break
+        else:
+            job.status = JobStatus.FINISHED
+
+        if job.status != JobStatus.FINISHED and 'cleanup' in stages:
+            self.cleanup(job)
+
+        return job
+
+    def prepare(self, job):
+        """
+        Resolves the final file name and the frame rate of the playblast
+        :param job: PlayblastJob
+        :return: bool
+        """
+
+        # Frame rate is resolved from the scene being captured, so batch shots use the frame rate of their own scene
+        job.fps = job.options.get('fps', None) or get_scene_fps()
+
+        filename = job.options.get('filename', None)
+        if not filename:
+            if not job.output_dir:
+                job.add_error('Impossible to capture playblast because output directory is not defined!')
+                return False
+            filename = self.get_output_filename(job.output_dir)
+
+        dir_name = os.path.dirname(filename)
+        base_filename = os.path.basename(filename).replace('.', '_')
+        job.filename = path_utils.clean_path(os.path.join(dir_name, base_filename))
+
+        return True
+
+    def capture(self, job):
+        """
+        Captures the playblast into a temporary folder
+        :param job: PlayblastJob
+        :return: bool
+        """
+
+        job.temp_dir = self.media_mgr.create_temp_path('playblast')
+        temp_filename = path_utils.clean_path(os.path.join(job.temp_dir, os.path.basename(job.filename)))
+        job.options['filename'] = temp_filename
+
+        if job.options.get('incremental_capture', False) and self._can_capture_incremental(job):
+            frames = self._get_frames(job)
+            fingerprints = self._fingerprinter.get_fingerprints(frames, job.options)
+            if len(fingerprints) == len(frames):
+                return self._capture_incremental(job, frames, fingerprints)
+            LOGGER.warning('Impossible to fingerprint all frames. Capturing all frames ...')
+
+        frame_stream = self.create_frame_stream(job) if job.options.get('stream_capture', False) else None
+        if not frame_stream:
+            if self._is_burnin_enabled(job):
+                return self._capture_burnin(job)
+            job.capture_path = self._capture_scene(job, job.options)
+            job.options['filename'] = job.capture_path
+            return True
+
+        capture_options = dict(job.options)
+        self._defer_viewer(job, capture_options)
+        if capture_options.get('format', None) != 'image':
+            capture_options['format'] = 'image'
+            capture_options['compression'] = streaming.STREAM_COMPRESSION
+        frame_stream.start()
+        try:
+            self._capture_scene(job, capture_options)
+        finally:
+            stream_files = frame_stream.finish()
+
+        if job.options.get('format', None) == 'image':
+            # Frames are already in their final location
+            job.capture_path = None
+            job.output_files = stream_files
+            job.filename = None
+        else:
+            job.capture_path = stream_files[0] if stream_files else None
+        job.options['filename'] = job.capture_path
+
+        return True
+
+    def stamp(self, job):
+        """
+        Stamps captured playblast file into its final location, if stamp is enabled
+        :param job: PlayblastJob
+        :return: bool
+        """
+
+        if not self._has_capture_file(job) or not self._is_project_stamp_enabled(job):
+            return True
+
+        out_ext = os.path.splitext(job.capture_path)[-1]
+        filename = '{}{}'.format(os.path.splitext(job.filename)[0], out_ext)
+        job.filename = self.playblasts_mgr.stamp_playblast(job.capture_path, filename, extra_dict=job.options)
+        job.output_files = [job.filename]
+
+        return True
+
+    def move(self, job):
+        """
+        Moves captured files into their final location, if they were not stamped
+        :param job: PlayblastJob
+        :return: bool
+        """
+
+        if not self._has_capture_file(job) or self._is_project_stamp_enabled(job):
+            return True
+
+        out_dir = os.path.dirname(job.capture_path)
+        target_dir = os.path.dirname(job.filename)
+        if target_dir and not os.path.isdir(target_dir):
+            os.makedirs(target_dir)
+        all_files = folder.get_files(out_dir, full_path=True) or list()
+        job.output_files = list()
+        moved_capture = None
+        for out_file in all_files:
+            file_dir, file_name, file_ext = path_utils.split_path(out_file)
+            target_file = path_utils.join_path(target_dir, '{}{}'.format(file_name, file_ext))
+            shutil.move(out_file, target_file)
+            job.output_files.append(target_file)
+            if path_utils.clean_path(out_file) == path_utils.clean_path(job.capture_path):
+                moved_capture = target_file
+
+        # Movies whose frames were already stamped are final playblasts, so they can be uploaded to production
+        # tracker. For now we set the rest to None, to avoid to upload to production tracker non video files
+        if self._is_burnin_stamped(job) and job.options.get('format', None) != 'image':
+            job.filename = moved_capture
+        else:
+            job.filename = None
+
+        return True
+
+    def cleanup(self, job):
+        """
+        Removes capture temporary folder
+        :param job: PlayblastJob
+        :return: bool
+        """
+
+        if job.temp_dir:
+            try:
+                shutil.rmtree(job.temp_dir)
+            except Exception:
+                pass
+
+        job.options['filename'] = job.filename if job.filename else (job.output_files or None)
+
+        # Cleanup is also executed when the job fails or is cancelled, but then there is nothing to view
+        if job.open_viewer and job.status == JobStatus.RUNNING:
+            self._open_viewer(job)
+
+        return True
+
+    def upload(self, job):
+        """
+        Uploads final playblast file into production tracker, if upload is enabled. If the engine has an upload queue,
+        the upload is queued and the job does not wait for it. In that case, upload stage of the job only measures the
+        time spent queueing the upload and the queue logs the time spent uploading it
+        :param job: PlayblastJob
+        :return: bool
+        """
+
+        if not job.options.get('tracker_enable', False):
+            return True
+
+        file_to_upload = job.filename
+        if not file_to_upload or not os.path.isfile(file_to_upload):
+            LOGGER.warning('Preview file to upload does not exists: "{}"'.format(file_to_upload))
+            return True
+
+        sequence_name = job.options.get('sequence_name', None)
+        shot_name = job.options.get('shot_name', None)
+        task_name = job.options.get('task_name', None)
+        comment = job.options.get('task_comment', '')
+        status = job.options.get('task_status', '')
+        if self._upload_queue:
+            self._upload_queue.enqueue(file_to_upload, sequence_name, shot_name, task_name, comment, status)
+            return True
+
+        job.uploaded = uploads.upload_preview(
+            file_to_upload, sequence_name, shot_name, task_name, comment=comment, status=status,
+            tracker_index=self.tracker_index)
+
+        if not job.uploaded:
+            job.add_error('It was not possible to upload "{}" to "{}". Please upload it manually!'.format(
+                file_to_upload, self.tracker.get_name()))
+            return False
+
+        return True
+
+    def create_frame_stream(self, job):
+        """
+        Returns the stream used to process frames while given job is being captured.
+        Image sequences are moved to their final location frame by frame and movies are encoded by FFmpeg
+        :param job: PlayblastJob
+        :return: streaming.FrameStream or None
+        """
+
+        if job.options.get('format', None) == 'image':
+            sink = streaming.MoveFrameSink(os.path.dirname(job.filename))
+        else:
+            encoding_error = self._get_encoding_error(job)
+            if encoding_error:
+                LOGGER.warning('{}. Streaming capture is disabled!'.format(encoding_error))
+                return None
+            extension, codec_args = streaming.get_movie_codec(job.options)
+            movie_file = '{}{}'.format(job.options['filename'], extension)
+            sink = streaming.EncoderFrameSink(movie_file, codec_args, fps=self._get_fps(job))
+
+        if self._is_burnin_enabled(job):
+            frames = self._get_frames(job)
+            sink = stamper.BurnInFrameSink(self.create_stamper(job, frames), sink, frame_numbers=frames)
+
+        return streaming.FrameStream(job.temp_dir, sink)
+
+    def create_stamper(self, job, frames):
+        """
+        Returns the stamper used to burn-in given job frames
+        :param job: PlayblastJob
+        :param frames: list(int)
+        :return: stamper.BurnInStamper
+        """
+
+        return stamper.BurnInStamper.from_options(job.options, frames)
+
+    def get_output_filename(self, output_dir):
+        """
+        Returns a new playblast file name inside given directory
+        :param output_dir: str
+        :return: str
+        """
+
+        return path_utils.clean_path(naming.FilenameAllocator(output_dir).allocate())
+
+    def _get_frames(self, job):
+        """
+        Internal function that returns the list of frames captured by the given job
+        :param job: PlayblastJob
+        :return: list(int)
+        """
+
+        frames = job.options.get('frame', None)
+        if frames:
+            return [int(frame) for frame in frames]
+        start_frame = job.options.get('start_frame', None)
+        end_frame = job.options.get('end_frame', None)
+        if start_frame is None or end_frame is None:
+            return list()
+
+        return list(range(int(start_frame), int(end_frame) + 1))
+
+    def _can_capture_incremental(self, job):
+        """
+        Internal function that returns whether given job can reuse cached frames
+        :param job: PlayblastJob
+        :return: bool
+        """
+
+        if not self._get_frames(job):
+            LOGGER.warning('Incremental capture needs a frame range. Capturing all frames ...')
+            return False
+        if job.options.get('format', None) != 'image':
+            encoding_error = self._get_encoding_error(job)
+            if encoding_error:
+                LOGGER.warning('{}. Capturing all frames ...'.format(encoding_error))
+                return False
+
+        return True
+
+    def _capture_incremental(self, job, frames, fingerprints):
+        """
+        Internal function that only captures frames whose fingerprint changed since last capture.
+        The rest of frames are restored from the cache
+        :param job: PlayblastJob
+        :param frames: list(int)
+        :param fingerprints: dict(int, str), fingerprint of each frame
+        :return: bool
+        """
+
+        self._defer_viewer(job)
+        cache_key = '{}|{}'.format(tp.Dcc.scene_name(), job.options.get('camera', None))
+        frame_cache = incremental.FrameCache(
+            job.options.get('cache_dir', None) or incremental.get_default_cache_dir(), cache_key)
+        changed_frames = frame_cache.get_changed_frames(fingerprints)
+        LOGGER.info('Incremental capture: capturing {} of {} frames'.format(len(changed_frames), len(frames)))
+
+        temp_filename = job.options['filename']
+        if changed_frames:
+            changed_dir = os.path.join(job.temp_dir, '_changed')
+            os.makedirs(changed_dir)
+            capture_options = dict(job.options)
+            capture_options.update({
+                'filename': os.path.join(changed_dir, os.path.basename(temp_filename)),
+                'frame': changed_frames,
+                'start_frame': changed_frames[0],
+                'end_frame': changed_frames[-1],
+                'raw_frame_numbers': True,
+                'viewer': False
+            })
+            if capture_options.get('format', None) != 'image':
+                capture_options['format'] = 'image'
+                capture_options['compression'] = streaming.STREAM_COMPRESSION
+            self._capture_scene(job, capture_options)
+            for file_name in os.listdir(changed_dir):
+                frame = streaming.get_frame_number(file_name)
+                if frame in fingerprints:
+                    frame_cache.store(frame, fingerprints[frame], os.path.join(changed_dir, file_name))
+            shutil.rmtree(changed_dir, ignore_errors=True)
+        # Manifest is written even if no frame changed, so the cache of this shot is kept as recently used
+        frame_cache.save()
+
+        missing_frames = frame_cache.get_changed_frames(fingerprints)
+        if missing_frames:
+            job.add_error('Frames {} were not captured!'.format(missing_frames))
+            return False
+
+        sequence_files = [frame_cache.restore(frame, '{}.{}'.format(temp_filename, str(frame).zfill(4)))
+                          for frame in frames]
+
+        return self._finish_sequence(job, sequence_files, frames)
+
+    def _defer_viewer(self, job, capture_options=None):
+        """
+        Internal function that prevents the DCC from opening its viewer when the captured files are not the final
+        ones. If the viewer was requested, final files are opened once they are in their final location
+        :param job: PlayblastJob
+        :param capture_options: dict, options used to capture the scene
+        """
+
+        job.open_viewer = bool(job.options.get('viewer', False))
+        if capture_options is not None:
+            capture_options['viewer'] = False
+
+    def _open_viewer(self, job):
+        """
+        Internal function that opens the final movie, or the first frame of the final image sequence, of the given job
+        :param job: PlayblastJob
+        """
+
+        file_to_open = job.filename
+        if not file_to_open:
+            capture_name = os.path.basename(job.capture_path) if job.capture_path else None
+            for output_file in job.output_files:
+                if not capture_name or os.path.basename(output_file) == capture_name:
+                    file_to_open = output_file
+                    break
+        if not file_to_open or not os.path.isfile(file_to_open):
+            LOGGER.warning('Impossible to open playblast viewer because playblast file does not exists: "{}"'.format(
+                file_to_open))
+            return
+
+        osplatform.open_file(file_to_open)
+
+    def _capture_scene(self, job, capture_options):
+        """
+        Internal function that captures the scene with the given options, measuring the time spent by the DCC
+        :param job: PlayblastJob
+        :param capture_options: dict
+        :return: str, captured file path
+        """
+
+        with timings.measure(job.timings, 'capture_scene', parent='capture'):
+            return self.playblasts_mgr.capture_scene(**capture_options)
+
+    def _capture_burnin(self, job):
+        """
+        Internal function that captures given job as an image sequence, so stamp can be burned into the frames
+        before they are encoded
+        :param job: PlayblastJob
+        :return: bool
+        """
+
+        capture_options = dict(job.options)
+        self._defer_viewer(job, capture_options)
+        if capture_options.get('format', None) != 'image':
+            capture_options['format'] = 'image'
+            capture_options['compression'] = streaming.STREAM_COMPRESSION
+        self._capture_scene(job, capture_options)
+
+        frame_files = list()
+        for file_name in os.listdir(job.temp_dir):
+            frame = streaming.get_frame_number(file_name)
+            if frame is not None:
+                frame_files.append((frame, os.path.join(job.temp_dir, file_name)))
+        frame_files.sort()
+        sequence_files = [frame_file for _, frame_file in frame_files]
+        if not sequence_files:
+            job.add_error('No frames were captured!')
+            return False
+
+        # If frames were not captured with their raw frame numbers, we use the scene frames
+        frames = self._get_frames(job)
+        if len(frames) != len(sequence_files):
+            frames = [frame for frame, _ in frame_files]
+
+        return self._finish_sequence(job, sequence_files, frames)
+
+    def _finish_sequence(self, job, sequence_files, frames):
+        """
+        Internal function that burns the stamp into the given captured frames, if enabled, and encodes them when
+        the job captures a movie
+        :param job: PlayblastJob
+        :param sequence_files: list(str), captured frame files sorted by frame
+        :param frames: list(int), scene frame of each frame file
+        :return: bool
+        """
+
+        if self._is_burnin_enabled(job):
+            self.create_stamper(job, frames).stamp_files(sequence_files, frames)
+
+        if job.options.get('format', None) == 'image':
+            job.capture_path = sequence_files[0]
+        else:
+            extension, codec_args = streaming.get_movie_codec(job.options)
+            job.capture_path = streaming.encode_sequence(
+                sequence_files, '{}{}'.format(job.options['filename'], extension), codec_args,
+                fps=self._get_fps(job))
+            for sequence_file in sequence_files:
+                os.remove(sequence_file)
+        job.options['filename'] = job.capture_path
+
+        return True
+
+    def _get_fps(self, job):
+        """
+        Internal function that returns the frame rate of the movies encoded by the given job
+        :param job: PlayblastJob
+        :return: float
+        """
+
+        return job.fps or job.options.get('fps', None) or get_scene_fps()
+
+    def _get_encoding_error(self, job):
+        """
+        Internal function that returns why the movie of the given job can not be encoded with FFmpeg
+        :param job: PlayblastJob
+        :return: str or None, None if the movie can be encoded with FFmpeg
+        """
+
+        if not streaming.get_ffmpeg_executable():
+            return 'FFmpeg executable not found'
+        if not streaming.get_movie_codec(job.options):
+            return 'Codec "{} | {}" can not be encoded with FFmpeg'.format(
+                job.options.get('format', None), job.options.get('compression', None))
+        # Sound is muxed by the DCC when it captures the movie, so movies with sound are not encoded with FFmpeg
+        if job.options.get('sound', None):
+            return 'Sound "{}" can not be encoded with FFmpeg'.format(job.options['sound'])
+
+        return None
+
+    def _is_burnin_enabled(self, job):
+        """
+        Internal function that returns whether stamp of the given job is burned into the captured frames
+        :param job: PlayblastJob
+        :return: bool
+        """
+
+        if not job.options.get('enable_stamp', False) or not job.options.get('stamp_burnin', False):
+            return False
+        if not stamper.is_available():
+            LOGGER.warning('NumPy is not available. Project stamp is used instead of burn-in!')
+            job.options['stamp_burnin'] = False
+            return False
+        if job.options.get('format', None) != 'image':
+            encoding_error = self._get_encoding_error(job)
+            if encoding_error:
+                LOGGER.warning('{}. Project stamp is used instead of burn-in!'.format(encoding_error))
+                job.options['stamp_burnin'] = False
+                return False
+
+        return True
+
+    def _is_project_stamp_enabled(self, job):
+        """
+        Internal function that returns whether given job must be stamped with the project stamp after capture
+        :param job: PlayblastJob
+        :return: bool
+        """
+
+        return job.options.get('enable_stamp', False) and not job.options.get('stamp_burnin', False)
+
+    def _is_burnin_stamped(self, job):
+        """
+        Internal function that returns whether the stamp of the given job was burned into the captured frames
+        :param job: PlayblastJob
+        :return: bool
+        """
+
+        # If burn-in is not available, stamp_burnin option is disabled when the job is captured
+        return bool(job.options.get('enable_stamp', False) and job.options.get('stamp_burnin', False))
+
+    def _has_capture_file(self, job):
+        """
+        Internal function that returns whether the capture of the given job generated a valid file
+        :param job: PlayblastJob
+        :return: bool
+        """
+
+        return bool(job.capture_path and os.path.isfile(job.capture_path))
+
+
+def run_playblast(options, output_dir=None, **kwargs):
+    """
+    Runs a playblast with given options without UI
+    :param options: dict, merged playblast options
+    :param output_dir: str, folder where playblast is stored if no filename is defined in the options
+    :param kwargs: dict, managers passed to PlayblastEngine
+    :return: PlayblastJob
+    """
+
+    job = PlayblastJob(options, output_dir=output_dir)
+
+    return PlayblastEngine(**kwargs).run(job)
@@ -0,0 +1,255 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains implementation for incremental playblasts, where only frames whose inputs changed are captured
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import os
+import json
+import time
+import shutil
+import hashlib
+import logging
+import tempfile
+
+import tpDcc as tp
+
+if tp.is_maya():
+    import tpDcc.dccs.maya as maya
+
+LOGGER = logging.getLogger()
+
+# Options that modify the look of captured frames
+FINGERPRINT_OPTIONS = (
+    'camera', 'width', 'height', 'isolate', 'show_ornaments', 'compression', 'quality',
+    'viewport_options', 'viewport2_options', 'display_options', 'camera_options'
+)
+
+# Maximum disk space used by the cached frames of all shots. Least recently captured shots are removed first
+DEFAULT_CACHE_MAX_BYTES = 2 * 1024 ** 3
+
+# Seconds after which the cached frames of a shot that was not captured again are removed
+DEFAULT_CACHE_MAX_AGE = 14 * 24 * 60 * 60
+
+
+def get_default_cache_dir():
+    """
+    Returns default folder where incremental captures cache is stored
+    :return: str
+    """
+
+    return os.path.join(tempfile.gettempdir(), 'artellapipe_playblast_cache')
+
+
+def get_options_digest(options):
+    """
+    Returns a hash of the options that modify the look of captured frames
+    :param options: dict
+    :return: str
+    """
+
+    frame_options = dict((key, options.get(key, None)) for key in FINGERPRINT_OPTIONS)
+    options_str = json.dumps(frame_options, sort_keys=True, default=str)
+
+    return hashlib.md5(options_str.encode('utf-8')).hexdigest()
+
+
+class FrameFingerprinter(object):
+    """
+    Generates a fingerprint per frame from the frame inputs: camera matrix, the value of all animation curves of the
+    scene in that frame and the options used to capture the frame.
+    Changes that are not driven by animation curves (simulations, expressions, ...) are not detected
+    """
+
+    def get_fingerprints(self, frames, options):
+        """
+        Returns fingerprint of the given frames
+        :param frames: list(int)
+        :param options: dict
+        :return: dict(int, str), fingerprint of each frame. Frames without fingerprint are not returned
+        """
+
+        if not tp.is_maya():
+            return dict()
+
+        options_digest = get_options_digest(options)
+        camera = options.get('camera', None)
+        anim_curves = maya.cmds.ls(type='animCurve') or list()
+
+        fingerprints = dict()
+        for frame in frames:
+            frame_hash = hashlib.md5(options_digest.encode('utf-8'))
+            if camera:
+                camera_matrix = maya.cmds.getAttr('{}.worldMatrix'.format(camera), time=frame)
+                frame_hash.update(str(camera_matrix).encode('utf-8'))
+            if anim_curves:
+                # Curves are evaluated in a single call, much cheaper than rendering the frame
+                curve_values = maya.cmds.keyframe(anim_curves, query=True, eval=True, time=(frame,))
+                frame_hash.update(str(curve_values).encode('utf-8'))
+            fingerprints[frame] = frame_hash.hexdigest()
+
+        return fingerprints
+
+
+class FrameCache(object):
+    """
+    Stores captured frames indexed by their fingerprint. Frames of each shot are stored in their own folder of the
+    cache root folder. Each time a manifest is written, shots that were not captured recently are removed, so the
+    cache does not grow without limit
+    """
+
+    MANIFEST_NAME = 'manifest.json'
+
+    def __init__(self, cache_dir, key, max_bytes=DEFAULT_CACHE_MAX_BYTES, max_age=DEFAULT_CACHE_MAX_AGE):
+        """
+        :param cache_dir: str, root folder of the cache
+        :param key: str, identifies the captured shot (for example, scene path and camera)
+        :param max_bytes: int, maximum disk space used by the cached frames of all shots. None to disable it
+        :param max_age: float, seconds after which the cached frames of a shot that was not captured again are
+            removed. None to disable it
+        """
+
+        self._root_dir = cache_dir
+        self._max_bytes = max_bytes
+        self._max_age = max_age
+        self._cache_dir = os.path.join(cache_dir, hashlib.md5(key.encode('utf-8')).hexdigest())
+        self._manifest_path = os.path.join(self._cache_dir, self.MANIFEST_NAME)
+        self._manifest = self._read_manifest()
+
+    @property
+    def cache_dir(self):
+        return self._cache_dir
+
+    def get_changed_frames(self, fingerprints):
+        """
+        Returns frames whose fingerprint does not match the cached one
+        :param fingerprints: dict(int, str)
+        :return: list(int)
+        """
+
+        changed_frames = list()
+        for frame, fingerprint in sorted(fingerprints.items()):
+            frame_info = self._manifest.get(str(frame), None)
+            if not frame_info or frame_info['fingerprint'] != fingerprint:
+                changed_frames.append(frame)
+                continue
+            if not os.path.isfile(os.path.join(self._cache_dir, frame_info['file'])):
+                changed_frames.append(frame)
+
+        return changed_frames
+
+    def store(self, frame, fingerprint, frame_file):
+        """
+        Stores given frame file in cache
+        :param frame: int
+        :param fingerprint: str
+        :param frame_file: str
+        """
+
+        if not os.path.isdir(self._cache_dir):
+            os.makedirs(self._cache_dir)
+        cache_file = 'frame.{}{}'.format(frame, os.path.splitext(frame_file)[-1])
+        shutil.copy2(frame_file, os.path.join(self._cache_dir, cache_file))
+        self._manifest[str(frame)] = {'fingerprint': fingerprint, 'file': cache_file}
+
+    def restore(self, frame, target_file):
+        """
+        Copies cached frame into given file
+        :param frame: int
+        :param target_file: str, target file path without extension
+        :return: str, restored file path
+        """
+
+        frame_info = self._manifest[str(frame)]
+        target_file = '{}{}'.format(target_file, os.path.splitext(frame_info['file'])[-1])
+        shutil.copy2(os.path.join(self._cache_dir, frame_info['file']), target_file)
+
+        return target_file
+
+    def save(self):
+        """
+        Writes cache manifest into disk and removes the cached shots that exceed the cache bounds
+        """
+
+        if not os.path.isdir(self._cache_dir):
+            os.makedirs(self._cache_dir)
+        with open(self._manifest_path, 'w') as fh:
+            json.dump(self._manifest, fh)
+
+        try:
+            self.prune()
+        except Exception as exc:
+            LOGGER.warning('Impossible to prune playblast cache "{}": {}'.format(self._root_dir, exc))
+
+    def prune(self, now=None):
+        """
+        Removes frame files that are not stored in the manifest anymore and the cached shots that were not captured
+        during max_age seconds. If cached shots still use more than max_bytes, least recently captured shots are
+        removed. Frames of this shot are never removed
+        :param now: float, current time
+        :return: list(str), removed shot cache folders
+        """
+
+        cached_files = set(frame_info['file'] for frame_info in self._manifest.values())
+        cached_files.add(self.MANIFEST_NAME)
+        for file_name in os.listdir(self._cache_dir):
+            if file_name not in cached_files:
+                os.remove(os.path.join(self._cache_dir, file_name))
+
+        # Manifest is written each time a shot is captured, so its modification time is the last time it was used
+        shot_caches = list()
+        for folder_name in os.listdir(self._root_dir):
+            shot_dir = os.path.join(self._root_dir, folder_name)
+            if not os.path.isdir(shot_dir) or os.path.normpath(shot_dir) == os.path.normpath(self._cache_dir):
+                continue
+            manifest_path = os.path.join(shot_dir, self.MANIFEST_NAME)
+            last_used = os.path.getmtime(manifest_path if os.path.isfile(manifest_path) else shot_dir)
+            shot_caches.append((last_used, shot_dir, self._get_folder_size(shot_dir)))
+
+        now = time.time() if now is None else now
+        total_bytes = self._get_folder_size(self._cache_dir) + sum(shot_cache[2] for shot_cache in shot_caches)
+        removed_dirs = list()
+        for last_used, shot_dir, shot_bytes in sorted(shot_caches):
+            is_expired = self._max_age is not None and now - last_used > self._max_age
+            is_full = self._max_bytes is not None and total_bytes > self._max_bytes
+            if not is_expired and not is_full:
+                break
+            shutil.rmtree(shot_dir, ignore_errors=True)
+            total_bytes -= shot_bytes
+            removed_dirs.append(shot_dir)
+
+        return removed_dirs
+
+    def _read_manifest(self):
+        """
+        Internal function that reads cache manifest from disk
+        :return: dict
+        """
+
+        if not os.path.isfile(self._manifest_path):
+            return dict()
+        try:
+            with open(self._manifest_path, 'r') as fh:
+                return json.load(fh)
+        except Exception as exc:
+            LOGGER.warning('Impossible to read playblast cache manifest "{}": {}'.format(self._manifest_path, exc))
+            return dict()
+
+    @staticmethod
+    def _get_folder_size(folder):
+        """
+        Internal function that returns the disk space used by the files of the given folder
+        :param folder: str
+        :return: int
+        """
+
+        return sum(os.path.getsize(os.path.join(root, file_name))
+                   for root, _, file_names in os.walk(folder) for file_name in file_names)
@@ -0,0 +1,173 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains implementation to allocate unique playblast file names
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import os
+import time
+import errno
+import logging
+
+LOGGER = logging.getLogger()
+
+
+class FileLock(object):
+    """
+    Inter-process lock based on the atomic creation of a lock file. Works on network shares
+    """
+
+    def __init__(self, lock_file, timeout=10.0, stale_timeout=60.0, poll_interval=0.01):
+        """
+        :param lock_file: str
+        :param timeout: float, seconds to wait for the lock before raising an error
+        :param stale_timeout: float, lock files older than this number of seconds are considered orphans and removed
+        :param poll_interval: float
+        """
+
+        self._lock_file = lock_file
+        self._timeout = timeout
+        self._stale_timeout = stale_timeout
+        self._poll_interval = poll_interval
+        self._fd = None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
+    def acquire(self):
+        """
+        Acquires the lock, waiting until it is available
+        """
+
+        start_time = time.time()
+        while True:
+            try:
+                self._fd = os.open(self._lock_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(self._fd, str(os.getpid()).encode('utf-8'))
+                return
+            except OSError as exc:
+                if exc.errno != errno.EEXIST:
+                    raise
+            self._remove_stale_lock()
+            if time.time() - start_time > self._timeout:
+                raise RuntimeError('Timeout while waiting for lock: "{}"'.format(self._lock_file))
+            time.sleep(self._poll_interval)
+
+    def release(self):
+        """
+        Releases the lock
+        """
+
+        if self._fd is None:
+            return
+        os.close(self._fd)
+        self._fd = None
+        try:
+            os.remove(self._lock_file)
+        except OSError:
+            pass
+
+    def _remove_stale_lock(self):
+        """
+        Internal function that removes lock file if the process that created it did not release it
+        """
+
+        try:
+            if time.time() - os.path.getmtime(self._lock_file) > self._stale_timeout:
+                LOGGER.warning('Removing stale lock file: "{}"'.format(self._lock_file))
+                os.remove(self._lock_file)
+        except OSError:
+            pass
+
+
+class FilenameAllocator(object):
+    """
+    Allocates unique sequential file names inside a folder. A counter file stores the next available index, so
+    allocation does not depend on the number of files of the folder and it is safe across parallel sessions
+    """
+
+    COUNTER_FILE = '.playblast_counter'
+    LOCK_FILE = '.playblast_counter.lock'
+
+    def __init__(self, folder, prefix='playblast'):
+        """
+        :param folder: str
+        :param prefix: str, prefix of the allocated names
+        """
+
+        self._folder = folder
+        self._prefix = prefix
+
+    @property
+    def counter_file(self):
+        return os.path.join(self._folder, self.COUNTER_FILE)
+
+    def allocate(self):
+        """
+        Returns a new unique file path (without extension) inside allocator folder
+        :return: str
+        """
+
+        if not os.path.isdir(self._folder):
+            try:
+                os.makedirs(self._folder)
+            except OSError as exc:
+                if exc.errno != errno.EEXIST:
+                    raise
+
+        with FileLock(os.path.join(self._folder, self.LOCK_FILE)):
+            index = self._read_counter()
+            temp_file = '{}.{}'.format(self.counter_file, os.getpid())
+            with open(temp_file, 'w') as fh:
+                fh.write(str(index + 1))
+            if os.path.isfile(self.counter_file):
+                os.remove(self.counter_file)
+            os.rename(temp_file, self.counter_file)
+
+        return os.path.join(self._folder, '{}_{}'.format(self._prefix, index))
+
+    def _read_counter(self):
+        """
+        Internal function that returns next available index
+        :return: int
+        """
+
+        if not os.path.isfile(self.counter_file):
+            return self._get_initial_index()
+
+        try:
+            with open(self.counter_file, 'r') as fh:
+                return int(fh.read().strip())
+        except (IOError, ValueError) as exc:
+            LOGGER.warning('Invalid playblast counter file "{}": {}'.format(self.counter_file, exc))
+            return self._get_initial_index()
+
+    def _get_initial_index(self):
+        """
+        Internal function that returns the first index to use in folders without counter file. The folder is only
+        scanned once, so names of playblasts generated before the counter existed are not reused
+        :return: int
+        """
+
+        index = 0
+        prefix = '{}_'.format(self._prefix)
+        for file_name in os.listdir(self._folder):
+            if not file_name.startswith(prefix):
+                continue
+            index_str = os.path.splitext(file_name[len(prefix):])[0].split('.')[0]
+            if index_str.isdigit():
+                index = max(index, int(index_str) + 1)
+
+        return index
@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains implementation for the cache of playblast plugins outputs
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import logging
+
+import tpDcc as tp
+
+from artellapipe.tools.playblastmanager.core import snapshot
+
+if tp.is_maya():
+    import maya.OpenMaya as OpenMaya
+
+LOGGER = logging.getLogger()
+
+# Scene events that invalidate the outputs of all plugins
+GLOBAL_SCENE_EVENTS = ('SceneOpened', 'NewSceneOpened')
+
+
+class OutputsCache(object):
+    """
+    Caches the outputs of each playblast plugin. Outputs of a plugin are retrieved again only after the plugin emits
+    its optionsChanged signal or after one of its scene events is triggered
+    """
+
+    def __init__(self):
+        self._outputs = dict()
+        self._event_plugins = dict()
+
+    def register_plugin(self, playblast_plugin):
+        """
+        Registers given plugin, so its cache is invalidated when the plugin options or its scene events change
+        :param playblast_plugin: PlayblastPlugin
+        """
+
+        plugin_id = playblast_plugin.id
+        playblast_plugin.optionsChanged.connect(lambda *args: self.invalidate(plugin_id))
+        for event_name in playblast_plugin.scene_events:
+            self._event_plugins.setdefault(event_name, set()).add(plugin_id)
+
+    def get_scene_events(self):
+        """
+        Returns all scene events that invalidate cached outputs
+        :return: list(str)
+        """
+
+        return sorted(set(GLOBAL_SCENE_EVENTS) | set(self._event_plugins.keys()))
+
+    def get_outputs(self, playblast_plugin):
+        """
+        Returns outputs of the given plugin, retrieving them from the plugin only if they are not cached
+        :param playblast_plugin: PlayblastPlugin
+        :return: dict
+        """
+
+        return self.get_snapshot(playblast_plugin).to_dict()
+
+    def get_snapshot(self, playblast_plugin):
+        """
+        Returns an immutable snapshot of the outputs of the given plugin
+        :param playblast_plugin: PlayblastPlugin
+        :return: PlayblastOptions
+        """
+
+        if not playblast_plugin.cache_outputs:
+            return snapshot.PlayblastOptions(playblast_plugin.get_outputs())
+
+        plugin_id = playblast_plugin.id
+        if plugin_id not in self._outputs:
+            self._outputs[plugin_id] = snapshot.PlayblastOptions(playblast_plugin.get_outputs())
+
+        return self._outputs[plugin_id]
+
+    def invalidate(self, plugin_id=None):
+        """
+        Removes cached outputs
+        :param plugin_id: str, plugin whose outputs are removed. If not given, all outputs are removed
+        """
+
+        if plugin_id is None:
+            self._outputs.clear()
+        else:
+            self._outputs.pop(plugin_id, None)
+
+    def on_scene_event(self, event_name):
+        """
+        Removes cached outputs of the plugins that depend on the given scene event
+        :param event_name: str
+        """
+
+        if event_name in GLOBAL_SCENE_EVENTS:
+            self.invalidate()
+            return
+
+        for plugin_id in self._event_plugins.get(event_name, list()):
+            self.invalidate(plugin_id)
+
+
+class SceneEventWatcher(object):
+    """
+    Calls a function each time one of the given DCC scene events is triggered
+    """
+
+    def __init__(self, events, callback):
+        """
+        :param events: list(str), DCC event names
+        :param callback: fn, function called with the name of the triggered event
+        """
+
+        self._callback = callback
+        self._callback_ids = list()
+
+        if not tp.is_maya():
+            return
+
+        for event_name in events:
+            try:
+                callback_id = OpenMaya.MEventMessage.addEventCallback(event_name, self._on_event, event_name)
+            except RuntimeError as exc:
+                LOGGER.warning('Impossible to register scene event "{}": {}'.format(event_name, exc))
+                continue
+            self._callback_ids.append(callback_id)
+
+    def remove(self):
+        """
+        Removes registered DCC callbacks
+        """
+
+        if not tp.is_maya():
+            return
+
+        for callback_id in self._callback_ids:
+            try:
+                OpenMaya.MMessage.removeCallback(callback_id)
+            except RuntimeError as exc:
+                LOGGER.warning('Impossible to remove scene event callback: {}'.format(exc))
+        self._callback_ids = list()
+
+    def _on_event(self, event_name):
+        """
+        Internal callback function that is called by the DCC when a registered event is triggered
+        :param event_name: str
+        """
+
+        self._callback(event_name)
@@ -65,8 +65,15 @@ class PlayblastManagerToolset(artellapipe.Toolset, object):
 
     def contents(self):
 
-        from artellapipe.tools.playblastmanager.widgets import playblastmanager
+        from artellapipe.tools.playblastmanager.core import profiler
+
+        startup_profiler = profiler.StartupProfiler()
+        with startup_profiler.measure('contents'):
+            with startup_profiler.measure('import', parent='contents'):
+                from artellapipe.tools.playblastmanager.widgets import playblastmanager
+            playblast_manager = playblastmanager.PlayblastManager(
+                project=self._project, config=self._config, settings=self._settings, parent=self,
+                startup_profiler=startup_profiler)
+        startup_profiler.finish(name=TOOL_ID)
 
-        playblast_manager = playblastmanager.PlayblastManager(
-            project=self._project, config=self._config, settings=self._settings, parent=self)
         return [playblast_manager]
@@ -19,6 +19,8 @@ from tpDcc.libs.python import python
 
 from tpDcc.libs.qt.core import base
 
+from artellapipe.tools.playblastmanager.core import profiler
+
 
 class PlayblastPlugin(base.BaseWidget, object):
 
@@ -26,6 +28,12 @@ class PlayblastPlugin(base.BaseWidget, object):
 
     label = ''
     collapsed = False
+    # Whether outputs can be cached until optionsChanged is emitted or one of the scene events is triggered
+    cache_outputs = True
+    # DCC scene events that modify the outputs of the plugin
+    scene_events = tuple()
+    # Whether the widgets of the plugin are already built
+    loaded = True
     labelChanged = Signal(str)
     optionsChanged = Signal()
 
@@ -34,7 +42,9 @@ class PlayblastPlugin(base.BaseWidget, object):
         self._project = project
         self._config = config
 
-        super(PlayblastPlugin, self).__init__(parent=parent)
+        # Base widget builds plugin widgets and connects their signals
+        with profiler.get_active_profiler().measure('ui', plugin=self.id, parent='__init__'):
+            super(PlayblastPlugin, self).__init__(parent=parent)
 
     def __str__(self):
         return self.label or type(self).__name__
@@ -105,6 +115,32 @@ class PlayblastPlugin(base.BaseWidget, object):
 
         pass
 
+    def update_inputs(self, attrs_dict):
+        """
+        Applies the given dict of attributes to the widget with the signals of the plugin and all its children blocked,
+        so no intermediate signals are emitted while the attributes are applied. Once applied, widgets that depend on
+        the attributes are refreshed only once
+        :param attrs_dict: dict
+        """
+
+        blocked_objects = [self] + self.findChildren(QObject)
+        signal_states = [blocked_object.blockSignals(True) for blocked_object in blocked_objects]
+        try:
+            self.apply_inputs(attrs_dict)
+        finally:
+            for blocked_object, signal_state in zip(blocked_objects, signal_states):
+                blocked_object.blockSignals(signal_state)
+
+        self.refresh_state()
+
+    def refresh_state(self):
+        """
+        Updates widgets whose state depends on plugin attributes. Called after attributes are applied with signals
+        blocked and once per burst of optionsChanged signals
+        """
+
+        pass
+
     def on_playblast_finished(self, options):
         """
         Internal callback function that is called when a Playblast is generated
@@ -112,3 +148,134 @@ class PlayblastPlugin(base.BaseWidget, object):
         """
 
         pass
+
+
+class LazyPlayblastPlugin(QWidget, object):
+    """
+    Placeholder of a playblast plugin that builds the plugin the first time it is shown or the first time its
+    outputs are requested. Inputs applied before the plugin is built are stored and applied once it is built
+    """
+
+    labelChanged = Signal(str)
+    optionsChanged = Signal()
+
+    def __init__(self, plugin_class, project, config, parent=None):
+        super(LazyPlayblastPlugin, self).__init__(parent=parent)
+
+        self._plugin_class = plugin_class
+        self._project = project
+        self._config = config
+        self._plugin = None
+        self._pending_inputs = None
+
+        self._main_layout = QVBoxLayout()
+        self._main_layout.setContentsMargins(0, 0, 0, 0)
+        self._main_layout.setSpacing(0)
+        self.setLayout(self._main_layout)
+
+    def __str__(self):
+        return str(self._plugin) if self._plugin else self.label or self._plugin_class.__name__
+
+    def __repr__(self):
+        return u"%s.%s(%r)" % (__name__, type(self).__name__, self.__str__())
+
+    @property
+    def id(self):
+        return self._plugin_class.id
+
+    @property
+    def label(self):
+        return self._plugin.label if self._plugin else self._plugin_class.label
+
+    @property
+    def collapsed(self):
+        return self._plugin_class.collapsed
+
+    @property
+    def cache_outputs(self):
+        return self._plugin_class.cache_outputs
+
+    @property
+    def scene_events(self):
+        return self._plugin_class.scene_events
+
+    @property
+    def config(self):
+        return self._config
+
+    @property
+    def loaded(self):
+        return self._plugin is not None
+
+    @property
+    def plugin(self):
+        """
+        Returns wrapped plugin. Plugin is built if it is not built yet
+        :return: PlayblastPlugin
+        """
+
+        if self._plugin is None:
+            self.load()
+
+        return self._plugin
+
+    def load(self):
+        """
+        Builds the wrapped plugin and applies the inputs stored while it was not built
+        """
+
+        if self._plugin is not None:
+            return
+
+        self._plugin = self._plugin_class(project=self._project, config=self._config, parent=self)
+        self._main_layout.addWidget(self._plugin)
+        if self._pending_inputs is not None:
+            self._plugin.update_inputs(self._pending_inputs)
+            self._pending_inputs = None
+        self._plugin.labelChanged.connect(self.labelChanged)
+        self._plugin.optionsChanged.connect(self.optionsChanged)
+        self.labelChanged.emit(self._plugin.label or self.id)
+
+    def validate(self):
+        return self.plugin.validate()
+
+    def initialize(self):
+        if self._plugin is not None:
+            self._plugin.initialize()
+
+    def uninitialize(self):
+        if self._plugin is not None:
+            self._plugin.uninitialize()
+
+    def get_outputs(self):
+        return self.plugin.get_outputs()
+
+    def get_inputs(self, as_preset=False):
+        return self.plugin.get_inputs(as_preset=as_preset)
+
+    def apply_inputs(self, attrs_dict):
+        self.update_inputs(attrs_dict)
+
+    def update_inputs(self, attrs_dict):
+        if self._plugin is None:
+            self._pending_inputs = dict(attrs_dict or dict())
+        else:
+            self._plugin.update_inputs(attrs_dict)
+
+    def refresh_state(self):
+        if self._plugin is not None:
+            self._plugin.refresh_state()
+
+    def on_playblast_finished(self, options):
+        if self._plugin is not None:
+            self._plugin.on_playblast_finished(options)
+
+    def showEvent(self, event):
+        """
+        Overrides base QWidget showEvent function
+        Plugin is built the first time its rollout is expanded
+        :param event: QShowEvent
+        """
+
+        self.load()
+        super(LazyPlayblastPlugin, self).showEvent(event)
@@ -0,0 +1,289 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains implementation for the index of playblast presets. Indexed presets are only read and validated
+again when their size or modification time change, so preset folders located in network shares are not parsed
+every time the tool is opened
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import os
+import copy
+import json
+import hashlib
+import logging
+import tempfile
+import threading
+
+LOGGER = logging.getLogger()
+
+INDEX_VERSION = 1
+
+_indices = dict()
+_indices_lock = threading.Lock()
+
+
+def get_default_index_file():
+    """
+    Returns default file where presets index is stored
+    :return: str
+    """
+
+    return os.path.join(os.path.expanduser('~'), '.artellapipe', 'playblast_presets_index.json')
+
+
+def get_index(index_file=None):
+    """
+    Returns the presets index stored in the given file. Index is shared by all the tools opened in the session
+    :param index_file: str, file where index is stored. Default index file is used if not given
+    :return: PresetsIndex
+    """
+
+    index_file = index_file or get_default_index_file()
+    with _indices_lock:
+        if index_file not in _indices:
+            _indices[index_file] = PresetsIndex(index_file)
+
+    return _indices[index_file]
+
+
+class PresetsIndex(object):
+    """
+    Stores the path, size, modification time, content hash and label of each preset file found in presets folders.
+    Parsed presets are also kept in memory, keyed by their modification time, so a preset is parsed at most once
+    per session while it does not change
+    """
+
+    def __init__(self, index_file):
+        """
+        :param index_file: str
+        """
+
+        self._index_file = index_file
+        self._index = None
+        self._parsed = dict()
+        self._lock = threading.RLock()
+
+    @property
+    def index_file(self):
+        return self._index_file
+
+    def get_presets(self, presets_paths):
+        """
+        Returns valid preset files located in the given folders. Only files that are not indexed or that changed since
+        they were indexed are read
+        :param presets_paths: list(str), folders where preset files are located
+        :return: list(dict), index entry of each valid preset
+        """
+
+        return self._scan(presets_paths)[0]
+
+    def update_presets(self, presets_paths):
+        """
+        Scans given folders again and returns the presets that changed since they were last indexed. Presets whose
+        files were touched but whose contents are the same are not returned
+        :param presets_paths: list(str), folders where preset files are located
+        :return: dict, with 'added' and 'updated' lists of index entries and a 'removed' list of preset files
+        """
+
+        return self._scan(presets_paths)[1]
+
+    def validate(self, preset_file):
+        """
+        Returns whether given file is a valid preset. File is only read if it changed since it was indexed
+        :param preset_file: str
+        :return: bool
+        """
+
+        preset_file = os.path.abspath(os.path.normpath(preset_file))
+        with self._lock:
+            entry, updated = self._get_entry(self._read().setdefault('files', dict()), preset_file)
+            if updated:
+                self._write()
+
+        return bool(entry and entry['valid'])
+
+    def read_preset(self, preset_file):
+        """
+        Returns the contents of the given preset file. File is only parsed if it changed since it was last parsed
+        :param preset_file: str
+        :return: dict
+        """
+
+        preset_file = os.path.abspath(os.path.normpath(preset_file))
+        stat = os.stat(preset_file)
+        with self._lock:
+            parsed = self._parsed.get(preset_file, None)
+            if not parsed or parsed[0] != (stat.st_size, stat.st_mtime):
+                with open(preset_file, 'rb') as fh:
+                    data = fh.read()
+                parsed = ((stat.st_size, stat.st_mtime), json.loads(data.decode('utf-8')))
+                self._parsed[preset_file] = parsed
+
+        # Callers receive a copy, so modifying a loaded preset does not modify the cached one
+        return copy.deepcopy(parsed[1])
+
+    def clear(self):
+        """
+        Removes all indexed presets, so they are read again next time they are requested
+        """
+
+        with self._lock:
+            self._index = {'version': INDEX_VERSION, 'files': dict()}
+            self._parsed.clear()
+            self._write()
+
+    def _scan(self, presets_paths):
+        """
+        Internal function that scans given folders, updating the index of the files that changed
+        :param presets_paths: list(str), folders where preset files are located
+        :return: tuple(list(dict), dict), index entry of each valid preset and presets that changed
+        """
+
+        presets = list()
+        changes = {'added': list(), 'updated': list(), 'removed': list()}
+        with self._lock:
+            files = self._read().setdefault('files', dict())
+            updated = False
+            for presets_path in presets_paths:
+                presets_path = os.path.abspath(os.path.normpath(presets_path))
+                if not os.path.isdir(presets_path):
+                    continue
+                folder_files = list()
+                for file_name in sorted(os.listdir(presets_path)):
+                    if file_name.startswith('_') or not file_name.lower().endswith('.json'):
+                        continue
+                    file_path = os.path.join(presets_path, file_name)
+                    folder_files.append(file_path)
+                    previous_entry = files.get(file_path, None)
+                    entry, entry_updated = self._get_entry(files, file_path)
+                    if not entry_updated:
+                        if entry and entry['valid'] and entry not in presets:
+                            presets.append(entry)
+                        continue
+                    updated = True
+                    was_valid = bool(previous_entry and previous_entry['valid'])
+                    if entry and entry['valid']:
+                        if entry not in presets:
+                            presets.append(entry)
+                        if not was_valid:
+                            changes['added'].append(entry)
+                        elif previous_entry['hash'] != entry['hash']:
+                            changes['updated'].append(entry)
+                    elif was_valid:
+                        changes['removed'].append(file_path)
+
+                # Files that were removed from the folder are removed from the index
+                for file_path in list(files.keys()):
+                    if os.path.dirname(file_path) == presets_path and file_path not in folder_files:
+                        if files.pop(file_path)['valid']:
+                            changes['removed'].append(file_path)
+                        self._parsed.pop(file_path, None)
+                        updated = True
+
+            if updated:
+                self._write()
+
+        return presets, changes
+
+    def _get_entry(self, files, file_path):
+        """
+        Internal function that returns the index entry of the given file, reading the file if it is not indexed yet
+        or if it changed since it was indexed
+        :param files: dict(str, dict), index entries by file path
+        :param file_path: str
+        :return: tuple(dict or None, bool), index entry and whether the index was updated
+        """
+
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None, files.pop(file_path, None) is not None
+
+        entry = files.get(file_path, None)
+        if entry and entry['size'] == stat.st_size and entry['mtime'] == stat.st_mtime:
+            return entry, False
+
+        entry = {
+            'path': file_path,
+            'label': os.path.splitext(os.path.basename(file_path))[0],
+            'size': stat.st_size,
+            'mtime': stat.st_mtime,
+            'hash': None,
+            'valid': False
+        }
+        if stat.st_size <= 0:
+            LOGGER.warning('File size is smaller than 1 byte for preset file: "{}"'.format(file_path))
+        else:
+            try:
+                with open(file_path, 'rb') as fh:
+                    data = fh.read()
+                preset = json.loads(data.decode('utf-8'))
+                entry['hash'] = hashlib.md5(data).hexdigest()
+                entry['valid'] = isinstance(preset, dict)
+                self._parsed[file_path] = ((stat.st_size, stat.st_mtime), preset)
+            except Exception as exc:
+                LOGGER.warning('Error while reading Playblast preset: {} | {} | {}'.format(
+                    entry['label'], file_path, exc))
+
+        files[file_path] = entry
+
+        return entry, True
+
+    def _read(self):
+        """
+        Internal function that returns the index, reading it from disk if it is not loaded yet
+        :return: dict
+        """
+
+        if self._index is not None:
+            return self._index
+
+        index = dict()
+        if os.path.isfile(self._index_file):
+            try:
+                with open(self._index_file, 'r') as fh:
+                    index = json.load(fh)
+            except Exception as exc:
+                LOGGER.warning('Impossible to read playblast presets index "{}": {}'.format(self._index_file, exc))
+        if index.get('version', None) != INDEX_VERSION:
+            index = {'version': INDEX_VERSION, 'files': dict()}
+        self._index = index
+
+        return self._index
+
+    def _write(self):
+        """
+        Internal function that writes index into disk. Index is replaced atomically, so sessions reading it never find
+        a partially written index
+        """
+
+        index_dir = os.path.dirname(self._index_file)
+        temp_file = None
+        try:
+            if index_dir and not os.path.isdir(index_dir):
+                os.makedirs(index_dir)
+            # Temporary file is unique and located in the index folder, so concurrent writers never share it and
+            # it can be renamed over the index
+            temp_handle, temp_file = tempfile.mkstemp(
+                prefix='{}.'.format(os.path.basename(self._index_file)), suffix='.tmp', dir=index_dir or None)
+            with os.fdopen(temp_handle, 'w') as fh:
+                json.dump(self._index, fh, indent=4, sort_keys=True)
+            if hasattr(os, 'replace'):
+                os.replace(temp_file, self._index_file)
+            else:
+                # Python 2 cannot rename a file over an existing one in Windows
+                if os.path.isfile(self._index_file):
+                    os.remove(self._index_file)
+                os.rename(temp_file, self._index_file)
+        except Exception as exc:
+            LOGGER.warning('Impossible to write playblast presets index "{}": {}'.format(self._index_file, exc))
+            if temp_file and os.path.isfile(temp_file):
+                os.remove(temp_file)
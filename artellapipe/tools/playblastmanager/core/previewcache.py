@@ -0,0 +1,267 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains implementation for the cache of playblast previews
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import atexit
+import shutil
+import logging
+import tempfile
+import threading
+from collections import OrderedDict
+
+from artellapipe.tools.playblastmanager.core import snapshot
+
+LOGGER = logging.getLogger()
+
+# Options that do not modify how a single frame looks, so they are not taken into account to cache previews
+NON_VISUAL_OPTIONS = (
+    'start_frame', 'end_frame', 'frame', 'sound', 'filename', 'complete_filename', 'viewer', 'raw_frame_numbers',
+    'stream_capture', 'incremental_capture', 'format', 'compression', 'quality')
+
+_scratch_folder = None
+_scratch_lock = threading.Lock()
+
+
+def get_scratch_folder():
+    """
+    Returns the folder where preview frames are captured before they are loaded into memory. The same folder is used
+    during the whole session and it is removed when the session exits
+    :return: str
+    """
+
+    global _scratch_folder
+
+    with _scratch_lock:
+        if _scratch_folder is None:
+            _scratch_folder = tempfile.mkdtemp(prefix='artellapipe_preview_')
+            atexit.register(shutil.rmtree, _scratch_folder, True)
+
+    return _scratch_folder
+
+
+def get_visual_options(options):
+    """
+    Returns a snapshot with the given options that modify how a single frame looks
+    :param options: PlayblastOptions
+    :return: PlayblastOptions
+    """
+
+    return snapshot.PlayblastOptions(
+        dict((key, value) for key, value in options.items() if key not in NON_VISUAL_OPTIONS))
+
+
+def get_filmstrip_frames(options, count):
+    """
+    Returns frames, evenly spaced across the time range of the given options, that are shown in a filmstrip
+    :param options: PlayblastOptions
+    :param count: int, maximum number of frames
+    :return: list(int)
+    """
+
+    frames = options.get('frame', None)
+    if frames:
+        frames = sorted(set(frames))
+    else:
+        start_frame = options.get('start_frame', None)
+        end_frame = options.get('end_frame', None)
+        if start_frame is None or end_frame is None:
+            return list()
+        frames = list(range(int(start_frame), int(end_frame) + 1))
+
+    if len(frames) <= count:
+        return frames
+    if count <= 1:
+        return frames[:1]
+
+    step = (len(frames) - 1) / (count - 1)
+    return [frames[int(round(i * step))] for i in range(count)]
+
+
+class PreviewCache(object):
+    """
+    Least recently used cache of preview images. Previews are stored by the options snapshot they were captured with
+    and by the captured frame, so previews of a state that was already captured are returned without calling the DCC
+    """
+
+    def __init__(self, max_size=32, max_bytes=None, get_size=None):
+        """
+        :param max_size: int, maximum number of previews stored in the cache
+        :param max_bytes: int, maximum memory used by stored previews. Only used if get_size is given
+        :param get_size: fn, function that returns the memory used by a preview
+        """
+
+        self._max_size = max_size
+        self._max_bytes = max_bytes
+        self._get_size = get_size
+        self._previews = OrderedDict()
+        self._sizes = dict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._previews)
+
+    def __contains__(self, key):
+        return key in self._previews
+
+    @property
+    def max_size(self):
+        return self._max_size
+
+    @property
+    def total_bytes(self):
+        return self._total_bytes
+
+    @staticmethod
+    def get_key(options, frame, scene=None):
+        """
+        Returns the cache key of a preview. Only options that modify how the frame looks are taken into account, so
+        changing the time range does not invalidate frames that are still in the range
+        :param options: PlayblastOptions, options snapshot the preview is captured with
+        :param frame: int or float
+        :param scene: str, scene the preview is captured from
+        :return: tuple
+        """
+
+        return get_visual_options(options), frame, scene
+
+    def get(self, key):
+        """
+        Returns the preview stored with the given key
+        :param key: tuple
+        :return: object or None
+        """
+
+        with self._lock:
+            if key not in self._previews:
+                return None
+            preview = self._previews.pop(key)
+            self._previews[key] = preview
+
+        return preview
+
+    def add(self, key, preview):
+        """
+        Stores given preview. Least recently used previews are removed if the cache is full
+        :param key: tuple
+        :param preview: object
+        """
+
+        with self._lock:
+            self._remove(key)
+            self._previews[key] = preview
+            self._sizes[key] = self._get_size(preview) if self._get_size else 0
+            self._total_bytes += self._sizes[key]
+            while self._previews and self._is_full():
+                self._remove(next(iter(self._previews)))
+
+    def remove_scene(self, scene):
+        """
+        Removes the previews captured from the given scene. Previews of other scenes are still valid
+        :param scene: str
+        """
+
+        with self._lock:
+            for key in [key for key in self._previews if isinstance(key, tuple) and key[-1] == scene]:
+                self._remove(key)
+
+    def clear(self):
+        """
+        Removes all stored previews
+        """
+
+        with self._lock:
+            self._previews.clear()
+            self._sizes.clear()
+            self._total_bytes = 0
+
+    def _is_full(self):
+        """
+        Internal function that returns whether the cache stores more previews than allowed
+        :return: bool
+        """
+
+        if self._max_size is not None and len(self._previews) > self._max_size:
+            return True
+
+        return self._max_bytes is not None and len(self._previews) > 1 and self._total_bytes > self._max_bytes
+
+    def _remove(self, key):
+        """
+        Internal function that removes the preview stored with the given key
+        :param key: tuple
+        """
+
+        if key not in self._previews:
+            return
+        self._previews.pop(key)
+        self._total_bytes -= self._sizes.pop(key, 0)
+
+
+class RenderBudget(object):
+    """
+    Keeps preview renders inside a time budget. When a render takes longer than the budget, next previews are
+    rendered at a lower resolution. Resolution is restored once renders are fast enough again
+    """
+
+    def __init__(self, time_budget=0.25, min_scale=0.25):
+        """
+        :param time_budget: float, maximum seconds a preview render should take
+        :param min_scale: float, minimum resolution scale previews are rendered with
+        """
+
+        self._time_budget = time_budget
+        self._min_scale = min_scale
+        self._scale = 1.0
+
+    @property
+    def time_budget(self):
+        return self._time_budget
+
+    @property
+    def scale(self):
+        return self._scale
+
+    def get_size(self, width, height):
+        """
+        Returns the resolution next preview should be rendered with
+        :param width: int, full preview width
+        :param height: int, full preview height
+        :return: tuple(int, int)
+        """
+
+        return max(int(width * self._scale), 1), max(int(height * self._scale), 1)
+
+    def update(self, duration):
+        """
+        Updates resolution scale taking into account the time spent by the last render
+        :param duration: float, seconds spent rendering last preview at current scale
+        :return: float, new resolution scale
+        """
+
+        if duration > self._time_budget:
+            self._scale = max(self._scale * 0.5, self._min_scale)
+        elif duration * 2.0 < self._time_budget:
+            # Render time roughly scales with pixel count, so the next scale is only used if it would fit the budget
+            next_scale = min(self._scale * 2.0, 1.0)
+            if duration * (next_scale / self._scale) ** 2 <= self._time_budget:
+                self._scale = next_scale
+
+        return self._scale
+
+    def reset(self):
+        """
+        Restores full resolution
+        """
+
+        self._scale = 1.0
@@ -0,0 +1,257 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains implementation to profile the startup of Playblast Manager
+Profiling is enabled by setting ARTELLAPIPE_PLAYBLAST_PROFILE_STARTUP environment variable before opening the tool.
+If its value is a file path, startup report is written into that file.
+Usage: python -m artellapipe.tools.playblastmanager.core.profiler <report_file.json> [--top 10] [--sort allocated]
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import contextlib
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+from artellapipe.tools.playblastmanager.core import timings
+
+LOGGER = logging.getLogger()
+
+PROFILE_STARTUP_ENV = 'ARTELLAPIPE_PLAYBLAST_PROFILE_STARTUP'
+
+_active_profiler = None
+
+
+def is_enabled():
+    """
+    Returns whether startup profiling is enabled
+    :return: bool
+    """
+
+    return os.environ.get(PROFILE_STARTUP_ENV, '').lower() not in ('', '0', 'false')
+
+
+def get_default_report_file():
+    """
+    Returns default file where startup reports are written
+    :return: str
+    """
+
+    return os.path.join(os.path.expanduser('~'), '.artellapipe', 'playblast_startup_profile.json')
+
+
+def get_report_file():
+    """
+    Returns file where startup report is written
+    :return: str
+    """
+
+    report_file = os.environ.get(PROFILE_STARTUP_ENV, '')
+    if report_file.lower() in ('', '0', '1', 'true'):
+        return get_default_report_file()
+
+    return report_file
+
+
+def get_active_profiler():
+    """
+    Returns the profiler of the tool that is being opened. If no tool is being opened, a disabled profiler is returned
+    :return: StartupProfiler
+    """
+
+    return _active_profiler or StartupProfiler(enabled=False)
+
+
+class StartupProfiler(object):
+    """
+    Records wall time and, if profiling is enabled, memory allocated by each startup stage. Stage records have the
+    same format as capture timings records
+    """
+
+    def __init__(self, enabled=None):
+        """
+        :param enabled: bool, whether startup profiling is enabled. If not given, it is read from the environment
+        """
+
+        self._enabled = is_enabled() if enabled is None else enabled
+        self._records = list()
+        self._started_tracing = False
+
+        if self._enabled and tracemalloc and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    @property
+    def enabled(self):
+        return self._enabled
+
+    @property
+    def records(self):
+        return self._records
+
+    @contextlib.contextmanager
+    def activate(self):
+        """
+        Context manager that makes this profiler the active one, so plugins record their startup stages into it
+        """
+
+        global _active_profiler
+
+        previous_profiler = _active_profiler
+        _active_profiler = self
+        try:
+            yield self
+        finally:
+            _active_profiler = previous_profiler
+
+    @contextlib.contextmanager
+    def measure(self, stage, plugin=None, parent=None):
+        """
+        Context manager that records the time and the memory spent executing its block
+        :param stage: str, name of the measured stage
+        :param plugin: str, id of the plugin the stage belongs to
+        :param parent: str, name of the stage that contains the measured stage
+        """
+
+        tracing = self._enabled and tracemalloc is not None and tracemalloc.is_tracing()
+        start_memory = tracemalloc.get_traced_memory()[0] if tracing else 0
+        start = time.time()
+        try:
+            yield
+        finally:
+            duration = time.time() - start
+            allocated = tracemalloc.get_traced_memory()[0] - start_memory if tracing else None
+            self._records.append({
+                'stage': stage, 'plugin': plugin, 'parent': parent, 'start': start, 'duration': duration,
+                'allocated': allocated})
+
+    def create_report(self, name=None):
+        """
+        Returns a report with the recorded startup stages
+        :param name: str
+        :return: dict
+        """
+
+        report = timings.create_report(self._records, name=name, status='startup')
+        report['allocations'] = summarize_allocations(self._records)
+
+        return report
+
+    def finish(self, name=None):
+        """
+        Stops memory tracing and, if profiling is enabled, logs and writes startup report
+        :param name: str
+        :return: dict, startup report
+        """
+
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+        report = self.create_report(name=name)
+        if not self._enabled:
+            return report
+
+        LOGGER.info('Playblast Manager startup profile:\n{}'.format(format_report(report)))
+        write_report(report, get_report_file())
+
+        return report
+
+
+def summarize_allocations(records):
+    """
+    Returns total memory allocated in each stage. Plugin records are summarized as "stage/plugin"
+    :param records: list(dict)
+    :return: dict(str, int)
+    """
+
+    summary = dict()
+    for record in records:
+        if record.get('allocated', None) is None:
+            continue
+        key = record['stage'] if not record['plugin'] else '{}/{}'.format(record['stage'], record['plugin'])
+        summary[key] = summary.get(key, 0) + record['allocated']
+
+    return summary
+
+
+def format_report(report, top=None, sort_by='duration'):
+    """
+    Returns a human readable table of the given startup report. Most expensive stages are listed first
+    :param report: dict
+    :param top: int, maximum number of stages to list
+    :param sort_by: str, 'duration' or 'allocated'
+    :return: str
+    """
+
+    allocations = report.get('allocations', dict())
+    rows = [(key, duration, allocations.get(key, None)) for key, duration in report['summary'].items()]
+    sort_index = 2 if sort_by == 'allocated' else 1
+    rows.sort(key=lambda row: row[sort_index] or 0, reverse=True)
+    if top:
+        rows = rows[:top]
+
+    lines = ['{:<48} {:>10} {:>12}'.format('Stage', 'Time (ms)', 'Alloc (KB)')]
+    for key, duration, allocated in rows:
+        allocated = '-' if allocated is None else '{:.1f}'.format(allocated / 1024.0)
+        lines.append('{:<48} {:>10.1f} {:>12}'.format(key, duration * 1000.0, allocated))
+    lines.append('{:<48} {:>10.1f}'.format('Total', report['total'] * 1000.0))
+
+    return '\n'.join(lines)
+
+
+def write_report(report, report_file):
+    """
+    Writes given startup report into a JSON file
+    :param report: dict
+    :param report_file: str
+    """
+
+    report_dir = os.path.dirname(report_file)
+    try:
+        if report_dir and not os.path.isdir(report_dir):
+            os.makedirs(report_dir)
+        with open(report_file, 'w') as fh:
+            json.dump(report, fh, indent=4, sort_keys=True)
+    except Exception as exc:
+        LOGGER.warning('Impossible to write Playblast Manager startup profile into "{}": {}'.format(report_file, exc))
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description='Shows the startup profile of Playblast Manager')
+    parser.add_argument('report_file', nargs='?', default=None, help='JSON file with the startup report')
+    parser.add_argument('--top', type=int, default=None, help='Maximum number of stages to show')
+    parser.add_argument(
+        '--sort', choices=('duration', 'allocated'), default='duration', help='Value used to sort stages')
+    parsed_args = parser.parse_args(args)
+
+    report_file = parsed_args.report_file or get_report_file()
+    if not os.path.isfile(report_file):
+        print('Startup report "{}" does not exist. Open Playblast Manager with {} environment variable set'.format(
+            report_file, PROFILE_STARTUP_ENV))
+        return 1
+
+    with open(report_file, 'r') as fh:
+        report = json.load(fh)
+    print(format_report(report, top=parsed_args.top, sort_by=parsed_args.sort))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,212 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains implementation for immutable snapshots of playblast options
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import logging
+
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+LOGGER = logging.getLogger()
+
+
+class PlayblastOptions(Mapping):
+    """
+    Immutable snapshot of playblast options. Nested dictionaries are stored as snapshots and lists as tuples, so
+    snapshots can be hashed and used as keys of caches and job queues. Derived snapshots share all the values that
+    are not modified with the snapshot they are created from
+    """
+
+    __slots__ = ('_data', '_hash')
+
+    def __init__(self, options=None):
+        """
+        :param options: dict, playblast options
+        """
+
+        if isinstance(options, PlayblastOptions):
+            data = options._data
+        else:
+            data = dict((key, _freeze(value)) for key, value in (options or dict()).items())
+
+        object.__setattr__(self, '_data', data)
+        object.__setattr__(self, '_hash', None)
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __hash__(self):
+        if self._hash is None:
+            object.__setattr__(self, '_hash', hash(frozenset(self._data.items())))
+        return self._hash
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if isinstance(other, PlayblastOptions):
+            return hash(self) == hash(other) and self._data == other._data
+        if isinstance(other, Mapping):
+            return self._data == dict((key, _freeze(value)) for key, value in other.items())
+        return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __setattr__(self, name, value):
+        raise AttributeError('{} is immutable'.format(type(self).__name__))
+
+    def __delattr__(self, name):
+        raise AttributeError('{} is immutable'.format(type(self).__name__))
+
+    def __repr__(self):
+        return u"%s.%s(%r)" % (__name__, type(self).__name__, self._data)
+
+    def __reduce__(self):
+        return type(self), (self.to_dict(),)
+
+    @classmethod
+    def from_outputs(cls, outputs_list):
+        """
+        Creates a snapshot merging the outputs of several playblast plugins. Nested options are merged with the ones
+        defined by previous plugins
+        :param outputs_list: list(dict or PlayblastOptions)
+        :return: PlayblastOptions
+        """
+
+        options = cls()
+        for outputs in outputs_list:
+            if outputs:
+                options = options.merge(outputs)
+
+        return options
+
+    def replace(self, **changes):
+        """
+        Returns a new snapshot with the given options replaced
+        :return: PlayblastOptions
+        """
+
+        if not changes:
+            return self
+
+        data = dict(self._data)
+        data.update((key, _freeze(value)) for key, value in changes.items())
+
+        return self._from_data(data)
+
+    def merge(self, options):
+        """
+        Returns a new snapshot with the given options. Nested options are merged with the current ones
+        :param options: dict or PlayblastOptions
+        :return: PlayblastOptions
+        """
+
+        options = options if isinstance(options, PlayblastOptions) else PlayblastOptions(options)
+        if not options:
+            return self
+        if not self:
+            return options
+
+        data = dict(self._data)
+        for key, value in options._data.items():
+            current_value = data.get(key, None)
+            if isinstance(value, PlayblastOptions) and isinstance(current_value, PlayblastOptions):
+                nested_data = dict(current_value._data)
+                nested_data.update(value._data)
+                data[key] = self._from_data(nested_data)
+            else:
+                data[key] = value
+
+        return self._from_data(data)
+
+    def to_dict(self):
+        """
+        Returns a mutable copy of the snapshot. Nested snapshots are returned as dictionaries
+        :return: dict
+        """
+
+        return dict((key, _thaw(value)) for key, value in self._data.items())
+
+    @classmethod
+    def _from_data(cls, data):
+        """
+        Internal function that creates a snapshot from already frozen data without copying it
+        :param data: dict
+        :return: PlayblastOptions
+        """
+
+        options = cls.__new__(cls)
+        object.__setattr__(options, '_data', data)
+        object.__setattr__(options, '_hash', None)
+
+        return options
+
+
+class _FrozenList(tuple):
+    """
+    Tuple that stores the items of a frozen list, so it is returned as a list when the snapshot is thawed
+    """
+
+    __slots__ = ()
+
+
+def _freeze(value):
+    """
+    Internal function that returns an immutable version of the given option value
+    :param value: object
+    :return: object
+    """
+
+    if isinstance(value, PlayblastOptions):
+        return value
+    elif isinstance(value, dict):
+        return PlayblastOptions(value)
+    elif isinstance(value, list):
+        return _FrozenList(_freeze(item) for item in value)
+    elif isinstance(value, tuple):
+        return tuple(_freeze(item) for item in value)
+    elif isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+
+    return value
+
+
+def _thaw(value):
+    """
+    Internal function that returns a mutable version of the given frozen option value
+    :param value: object
+    :return: object
+    """
+
+    if isinstance(value, PlayblastOptions):
+        return value.to_dict()
+    elif isinstance(value, _FrozenList):
+        return [_thaw(item) for item in value]
+    elif isinstance(value, tuple):
+        return tuple(_thaw(item) for item in value)
+    elif isinstance(value, frozenset):
+        return set(_thaw(item) for item in value)
+
+    return value
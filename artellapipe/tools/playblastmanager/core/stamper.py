@@ -0,0 +1,371 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains implementation for a built-in burn-in stamper that works over captured frames using NumPy
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import logging
+import datetime
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+import tpDcc as tp
+
+from artellapipe.tools.playblastmanager.core import streaming
+
+if tp.is_maya():
+    import tpDcc.dccs.maya as maya
+
+LOGGER = logging.getLogger()
+
+# 5x7 bitmap font. Each glyph is stored as 7 rows of 5 bits (most significant bit is the leftmost pixel)
+FONT = {
+    ' ': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
+    '?': (0x0E, 0x11, 0x01, 0x02, 0x04, 0x00, 0x04),
+    '0': (0x0E, 0x11, 0x13, 0x15, 0x19, 0x11, 0x0E),
+    '1': (0x04, 0x0C, 0x04, 0x04, 0x04, 0x04, 0x0E),
+    '2': (0x0E, 0x11, 0x01, 0x02, 0x04, 0x08, 0x1F),
+    '3': (0x1F, 0x02, 0x04, 0x02, 0x01, 0x11, 0x0E),
+    '4': (0x02, 0x06, 0x0A, 0x12, 0x1F, 0x02, 0x02),
+    '5': (0x1F, 0x10, 0x1E, 0x01, 0x01, 0x11, 0x0E),
+    '6': (0x06, 0x08, 0x10, 0x1E, 0x11, 0x11, 0x0E),
+    '7': (0x1F, 0x01, 0x02, 0x04, 0x08, 0x08, 0x08),
+    '8': (0x0E, 0x11, 0x11, 0x0E, 0x11, 0x11, 0x0E),
+    '9': (0x0E, 0x11, 0x11, 0x0F, 0x01, 0x02, 0x0C),
+    'A': (0x0E, 0x11, 0x11, 0x1F, 0x11, 0x11, 0x11),
+    'B': (0x1E, 0x11, 0x11, 0x1E, 0x11, 0x11, 0x1E),
+    'C': (0x0E, 0x11, 0x10, 0x10, 0x10, 0x11, 0x0E),
+    'D': (0x1C, 0x12, 0x11, 0x11, 0x11, 0x12, 0x1C),
+    'E': (0x1F, 0x10, 0x10, 0x1E, 0x10, 0x10, 0x1F),
+    'F': (0x1F, 0x10, 0x10, 0x1E, 0x10, 0x10, 0x10),
+    'G': (0x0E, 0x11, 0x10, 0x17, 0x11, 0x11, 0x0F),
+    'H': (0x11, 0x11, 0x11, 0x1F, 0x11, 0x11, 0x11),
+    'I': (0x0E, 0x04, 0x04, 0x04, 0x04, 0x04, 0x0E),
+    'J': (0x07, 0x02, 0x02, 0x02, 0x02, 0x12, 0x0C),
+    'K': (0x11, 0x12, 0x14, 0x18, 0x14, 0x12, 0x11),
+    'L': (0x10, 0x10, 0x10, 0x10, 0x10, 0x10, 0x1F),
+    'M': (0x11, 0x1B, 0x15, 0x15, 0x11, 0x11, 0x11),
+    'N': (0x11, 0x11, 0x19, 0x15, 0x13, 0x11, 0x11),
+    'O': (0x0E, 0x11, 0x11, 0x11, 0x11, 0x11, 0x0E),
+    'P': (0x1E, 0x11, 0x11, 0x1E, 0x10, 0x10, 0x10),
+    'Q': (0x0E, 0x11, 0x11, 0x11, 0x15, 0x12, 0x0D),
+    'R': (0x1E, 0x11, 0x11, 0x1E, 0x14, 0x12, 0x11),
+    'S': (0x0F, 0x10, 0x10, 0x0E, 0x01, 0x01, 0x1E),
+    'T': (0x1F, 0x04, 0x04, 0x04, 0x04, 0x04, 0x04),
+    'U': (0x11, 0x11, 0x11, 0x11, 0x11, 0x11, 0x0E),
+    'V': (0x11, 0x11, 0x11, 0x11, 0x11, 0x0A, 0x04),
+    'W': (0x11, 0x11, 0x11, 0x15, 0x15, 0x15, 0x0A),
+    'X': (0x11, 0x11, 0x0A, 0x04, 0x0A, 0x11, 0x11),
+    'Y': (0x11, 0x11, 0x11, 0x0A, 0x04, 0x04, 0x04),
+    'Z': (0x1F, 0x01, 0x02, 0x04, 0x08, 0x10, 0x1F),
+    ':': (0x00, 0x0C, 0x0C, 0x00, 0x0C, 0x0C, 0x00),
+    '-': (0x00, 0x00, 0x00, 0x1F, 0x00, 0x00, 0x00),
+    '_': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x1F),
+    '.': (0x00, 0x00, 0x00, 0x00, 0x00, 0x0C, 0x0C),
+    ',': (0x00, 0x00, 0x00, 0x00, 0x0C, 0x04, 0x08),
+    '/': (0x00, 0x01, 0x02, 0x04, 0x08, 0x10, 0x00),
+    '(': (0x02, 0x04, 0x08, 0x08, 0x08, 0x04, 0x02),
+    ')': (0x08, 0x04, 0x02, 0x02, 0x02, 0x04, 0x08),
+    '#': (0x0A, 0x0A, 0x1F, 0x0A, 0x1F, 0x0A, 0x0A),
+    '|': (0x04, 0x04, 0x04, 0x04, 0x04, 0x04, 0x04)
+}
+GLYPH_WIDTH = 6
+GLYPH_HEIGHT = 8
+
+
+def is_available():
+    """
+    Returns whether burn-in stamper can be used
+    :return: bool
+    """
+
+    return np is not None
+
+
+class GlyphAtlas(object):
+    """
+    Stores the rasterized alpha mask of all font glyphs at a given scale, so text is rendered just indexing the atlas
+    """
+
+    def __init__(self, scale=1):
+        self._scale = max(1, int(scale))
+        self._chars = sorted(FONT.keys())
+        self._indices = dict((char, i) for i, char in enumerate(self._chars))
+        self._unknown = self._indices['?']
+
+        rows = np.array([FONT[char] for char in self._chars], dtype=np.uint8)
+        bits = (rows[:, :, None] >> np.arange(4, -1, -1, dtype=np.uint8)) & 1
+        glyphs = np.zeros((len(self._chars), GLYPH_HEIGHT, GLYPH_WIDTH), dtype=np.float32)
+        glyphs[:, :7, :5] = bits
+        self._atlas = glyphs.repeat(self._scale, axis=1).repeat(self._scale, axis=2)
+
+    @property
+    def glyph_height(self):
+        return GLYPH_HEIGHT * self._scale
+
+    @property
+    def glyph_width(self):
+        return GLYPH_WIDTH * self._scale
+
+    def get_indices(self, texts):
+        """
+        Returns atlas indices of the given texts. All texts must have the same length
+        :param texts: list(str)
+        :return: np.array, (number of texts, number of chars)
+        """
+
+        return np.array(
+            [[self._indices.get(char, self._unknown) for char in text.upper()] for text in texts], dtype=np.intp)
+
+    def render(self, texts):
+        """
+        Returns alpha masks of the given texts. Texts are right padded so all of them have the same length
+        :param texts: list(str)
+        :return: np.array, (number of texts, glyph height, glyph width * number of chars)
+        """
+
+        length = max(len(text) for text in texts)
+        indices = self.get_indices([text.ljust(length) for text in texts])
+        masks = self._atlas[indices]
+        num_texts, num_chars, height, width = masks.shape
+
+        return masks.transpose(0, 2, 1, 3).reshape(num_texts, height, num_chars * width)
+
+
+class BurnInStamper(object):
+    """
+    Burns frame number, shot, camera, focal length and date into captured frames.
+    Frames are processed in batches and each text is composited in a single array operation for the whole batch
+    """
+
+    def __init__(self, shot=None, camera=None, date=None, focal_lengths=None, color=(255, 255, 255),
+                 opacity=1.0, background_opacity=0.5, batch_size=16):
+        """
+        :param shot: str
+        :param camera: str
+        :param date: str, current date is used by default
+        :param focal_lengths: dict(int, float), focal length of the camera in each frame
+        :param color: tuple(int, int, int), text color
+        :param opacity: float, text opacity
+        :param background_opacity: float, opacity of the box drawn behind texts
+        :param batch_size: int, number of frames processed at the same time
+        """
+
+        if not is_available():
+            raise RuntimeError('NumPy is not available. Burn-in stamper cannot be used!')
+
+        self._shot = shot or ''
+        self._camera = (camera or '').split('|')[-1]
+        self._date = date or datetime.datetime.today().strftime('%d-%m-%Y %H:%M')
+        self._focal_lengths = focal_lengths or dict()
+        self._color = np.array(color, dtype=np.float32)
+        self._opacity = opacity
+        self._background_opacity = background_opacity
+        self._batch_size = max(1, int(batch_size))
+        self._atlases = dict()
+
+    @property
+    def batch_size(self):
+        return self._batch_size
+
+    @classmethod
+    def from_options(cls, options, frames, **kwargs):
+        """
+        Creates a stamper from playblast options. Must be called from the main thread, because camera focal length
+        is queried from the scene
+        :param options: dict
+        :param frames: list(int)
+        :return: BurnInStamper
+        """
+
+        camera = options.get('camera', None)
+        shot = options.get('shot_name', None) or tp.Dcc.scene_name()
+        focal_lengths = dict()
+        if camera and tp.is_maya():
+            for frame in frames:
+                focal_lengths[frame] = maya.cmds.getAttr('{}.focalLength'.format(camera), time=frame)
+
+        return cls(shot=shot, camera=camera, focal_lengths=focal_lengths, **kwargs)
+
+    def stamp_frames(self, frames, frame_numbers):
+        """
+        Stamps given batch of frames in place
+        :param frames: np.array, (number of frames, height, width, channels) uint8 array
+        :param frame_numbers: list(int), frame number of each frame of the batch
+        :return: np.array
+        """
+
+        height, width = frames.shape[1:3]
+        atlas = self._get_atlas(height)
+        margin = atlas.glyph_height // 2
+
+        top_masks = atlas.render(['{}  {}'.format(self._shot, self._date)])
+        self._blit(frames, top_masks, margin, margin)
+
+        camera_texts = list()
+        frame_texts = list()
+        for frame in frame_numbers:
+            focal_length = self._focal_lengths.get(frame, None)
+            camera_text = self._camera
+            if focal_length is not None:
+                camera_text = '{} {:.1f}MM'.format(camera_text, focal_length)
+            camera_texts.append(camera_text)
+            frame_texts.append(str(frame).rjust(5))
+        camera_masks = atlas.render(camera_texts)
+        frame_masks = atlas.render(frame_texts)
+        bottom = height - margin - atlas.glyph_height
+        self._blit(frames, camera_masks, margin, bottom)
+        self._blit(frames, frame_masks, width - margin - frame_masks.shape[2], bottom)
+
+        return frames
+
+    def stamp_files(self, frame_files, frame_numbers):
+        """
+        Stamps given frame files in place
+        :param frame_files: list(str)
+        :param frame_numbers: list(int), frame number of each file
+        """
+
+        for i in range(0, len(frame_files), self._batch_size):
+            batch_files = frame_files[i:i + self._batch_size]
+            batch_frames = np.stack([read_image(frame_file) for frame_file in batch_files])
+            self.stamp_frames(batch_frames, frame_numbers[i:i + self._batch_size])
+            for frame_file, frame in zip(batch_files, batch_frames):
+                write_image(frame_file, frame)
+
+    def _get_atlas(self, height):
+        """
+        Internal function that returns glyph atlas with the proper text size for the given frame height
+        :param height: int
+        :return: GlyphAtlas
+        """
+
+        scale = max(1, height // 270)
+        if scale not in self._atlases:
+            self._atlases[scale] = GlyphAtlas(scale)
+
+        return self._atlases[scale]
+
+    def _blit(self, frames, masks, x, y):
+        """
+        Internal function that composites text masks over a batch of frames
+        :param frames: np.array, (number of frames, height, width, channels)
+        :param masks: np.array, (number of frames or 1, mask height, mask width)
+        :param x: int
+        :param y: int
+        """
+
+        height, width = frames.shape[1:3]
+        x = max(0, x)
+        y = max(0, y)
+        mask_height = min(masks.shape[1], height - y)
+        mask_width = min(masks.shape[2], width - x)
+        if mask_height <= 0 or mask_width <= 0:
+            return
+
+        alpha = masks[:, :mask_height, :mask_width, None] * self._opacity
+        region = frames[:, y:y + mask_height, x:x + mask_width, :3].astype(np.float32)
+        region *= 1.0 - self._background_opacity
+        region = region * (1.0 - alpha) + self._color * alpha
+        frames[:, y:y + mask_height, x:x + mask_width, :3] = np.clip(region, 0, 255).astype(np.uint8)
+
+
+class BurnInFrameSink(streaming.FrameSink):
+    """
+    Burns stamp into streamed frames before sending them to the next sink. Frames are buffered and stamped in batches
+    of the stamper batch size, so streamed captures are stamped as fast as captured sequences
+    """
+
+    def __init__(self, burnin_stamper, sink, frame_numbers=None):
+        """
+        :param burnin_stamper: BurnInStamper
+        :param sink: streaming.FrameSink
+        :param frame_numbers: list(int), scene frame of each streamed frame. If not given, frame number is retrieved
+            from the frame file name
+        """
+
+        self._stamper = burnin_stamper
+        self._sink = sink
+        self._frame_numbers = frame_numbers or list()
+        self._index = 0
+        self._pending_files = list()
+        self._pending_frames = list()
+
+    def process(self, frame_file):
+        if self._index < len(self._frame_numbers):
+            frame = self._frame_numbers[self._index]
+        else:
+            frame = streaming.get_frame_number(frame_file)
+        self._index += 1
+        self._pending_files.append(frame_file)
+        self._pending_frames.append(frame)
+        if len(self._pending_files) >= getattr(self._stamper, 'batch_size', 1):
+            self._flush()
+
+    def close(self):
+        self._flush()
+        return self._sink.close()
+
+    def _flush(self):
+        """
+        Internal function that stamps buffered frames and sends them, in order, to the next sink
+        """
+
+        if not self._pending_files:
+            return
+
+        frame_files, self._pending_files = self._pending_files, list()
+        frame_numbers, self._pending_frames = self._pending_frames, list()
+        self._stamper.stamp_files(frame_files, frame_numbers)
+        for frame_file in frame_files:
+            self._sink.process(frame_file)
+
+
+def read_image(image_file):
+    """
+    Reads given image file as a RGB array
+    :param image_file: str
+    :return: np.array, (height, width, 3) uint8 array
+    """
+
+    from Qt.QtGui import QImage
+
+    image = QImage(image_file)
+    if image.isNull():
+        raise IOError('Impossible to read image: "{}"'.format(image_file))
+    image = image.convertToFormat(QImage.Format_RGB888)
+    width = image.width()
+    height = image.height()
+    bits = image.constBits()
+    if hasattr(bits, 'setsize'):
+        bits.setsize(image.byteCount())
+    pixels = np.frombuffer(bits, dtype=np.uint8).reshape(height, image.bytesPerLine())
+
+    return pixels[:, :width * 3].reshape(height, width, 3).copy()
+
+
+def write_image(image_file, pixels):
+    """
+    Writes given RGB array into an image file
+    :param image_file: str
+    :param pixels: np.array, (height, width, 3) uint8 array
+    """
+
+    from Qt.QtGui import QImage
+
+    pixels = np.ascontiguousarray(pixels[:, :, :3])
+    height, width = pixels.shape[:2]
+    image = QImage(pixels.data, width, height, width * 3, QImage.Format_RGB888)
+    if not image.save(image_file):
+        raise IOError('Impossible to write image: "{}"'.format(image_file))
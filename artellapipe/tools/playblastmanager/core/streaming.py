@@ -0,0 +1,324 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains implementation to process captured frames while the capture is still running
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import os
+import re
+import time
+import shutil
+import logging
+import tempfile
+import threading
+import subprocess
+
+from tpDcc.libs.python import python
+
+if python.is_python2():
+    import Queue as queue
+    from distutils.spawn import find_executable as which
+else:
+    import queue
+    from shutil import which
+
+LOGGER = logging.getLogger()
+
+FRAME_FILE_REGEX = re.compile(r'\.(-?\d+)(\.[^.]+)$')
+STREAM_COMPRESSION = 'png'
+
+# Extension of the movies generated by each playblast format that can be encoded with FFmpeg
+MOVIE_EXTENSIONS = {
+    'qt': '.mov',
+    'movie': '.mov',
+    'avi': '.avi'
+}
+
+
+def get_frame_number(file_path):
+    """
+    Returns the frame number of the given image file path (name.0001.jpg)
+    :param file_path: str
+    :return: int or None
+    """
+
+    frame_match = FRAME_FILE_REGEX.search(os.path.basename(file_path))
+    if not frame_match:
+        return None
+
+    return int(frame_match.group(1))
+
+
+def get_ffmpeg_executable(ffmpeg=None):
+    """
+    Returns FFmpeg executable path
+    :param ffmpeg: str, explicit FFmpeg executable
+    :return: str or None
+    """
+
+    return ffmpeg or os.environ.get('FFMPEG_EXECUTABLE', None) or which('ffmpeg')
+
+
+def get_movie_codec(options):
+    """
+    Returns the extension and the FFmpeg codec arguments used to encode a movie like the one that the DCC captures
+    with the given codec options
+    :param options: dict, playblast options with format, compression and quality
+    :return: tuple(str, list(str)) or None, None if FFmpeg can not encode the given format and compression
+    """
+
+    extension = MOVIE_EXTENSIONS.get(options.get('format', None), None)
+    if not extension:
+        return None
+
+    compression = (options.get('compression', None) or '').lower()
+    quality = options.get('quality', None)
+    quality = max(0, min(100, int(100 if quality is None else quality)))
+    if compression == 'h.264':
+        # CRF goes from 0 (lossless) to 51 (worst quality). H.264 needs even dimensions
+        codec_args = ['-c:v', 'libx264', '-crf', str(int(round((100 - quality) * 51 / 100.0))),
+                      '-pix_fmt', 'yuv420p', '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2']
+    elif compression in ('jpeg', 'photo - jpeg'):
+        # JPEG quality goes from 2 (best quality) to 31 (worst quality)
+        codec_args = ['-c:v', 'mjpeg', '-q:v', str(int(round(2 + (100 - quality) * 29 / 100.0)))]
+    elif compression == 'png':
+        codec_args = ['-c:v', 'png']
+    elif compression == 'animation' and extension == '.mov':
+        codec_args = ['-c:v', 'qtrle']
+    elif compression == 'none':
+        codec_args = ['-c:v', 'rawvideo']
+    else:
+        return None
+
+    return extension, codec_args
+
+
+def encode_sequence(sequence_files, movie_file, codec_args, fps=24, ffmpeg=None):
+    """
+    Encodes given image sequence into a movie file using FFmpeg
+    :param sequence_files: list(str), image sequence files sorted by frame
+    :param movie_file: str
+    :param codec_args: list(str), codec arguments (see get_movie_codec)
+    :param fps: float
+    :param ffmpeg: str, FFmpeg executable
+    :return: str or None, encoded movie file path
+    """
+
+    ffmpeg = get_ffmpeg_executable(ffmpeg)
+    if not ffmpeg:
+        LOGGER.warning('FFmpeg executable not found. Impossible to encode "{}"'.format(movie_file))
+        return None
+    if not sequence_files:
+        return None
+
+    first_file = sequence_files[0]
+    start_frame = get_frame_number(first_file)
+    frame_match = FRAME_FILE_REGEX.search(first_file)
+    padding = len(frame_match.group(1))
+    pattern = '{}%0{}d{}'.format(first_file[:frame_match.start(1)], padding, frame_match.group(2))
+
+    cmd = [ffmpeg, '-y', '-framerate', str(fps), '-start_number', str(start_frame), '-i', pattern]
+    cmd.extend(codec_args)
+    cmd.append(movie_file)
+    process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    output = process.communicate()[0]
+    if process.returncode != 0:
+        LOGGER.warning('Error while encoding "{}": {}'.format(movie_file, output))
+        return None
+
+    return movie_file
+
+
+class FrameSink(object):
+    """
+    Base class for stages that receive captured frames, one by one
+    """
+
+    def process(self, frame_file):
+        """
+        Processes given frame file. Sinks are responsible of removing the frame from the capture folder
+        :param frame_file: str
+        """
+
+        raise NotImplementedError('process function not implemented in "{}"'.format(type(self).__name__))
+
+    def close(self):
+        """
+        Called once all frames have been processed
+        :return: list(str), generated files
+        """
+
+        return list()
+
+
+class MoveFrameSink(FrameSink):
+    """
+    Moves each frame into its final folder
+    """
+
+    def __init__(self, target_dir):
+        self._target_dir = target_dir
+        self._output_files = list()
+
+        if not os.path.isdir(target_dir):
+            os.makedirs(target_dir)
+
+    def process(self, frame_file):
+        target_file = os.path.join(self._target_dir, os.path.basename(frame_file))
+        shutil.move(frame_file, target_file)
+        self._output_files.append(target_file)
+
+    def close(self):
+        return self._output_files
+
+
+class EncoderFrameSink(FrameSink):
+    """
+    Pipes each frame into a FFmpeg process that encodes the movie while frames are being captured
+    """
+
+    def __init__(self, movie_file, codec_args, fps=24, ffmpeg=None):
+        self._movie_file = movie_file
+
+        cmd = [get_ffmpeg_executable(ffmpeg), '-y', '-loglevel', 'error', '-f', 'image2pipe',
+               '-framerate', str(fps), '-i', '-']
+        cmd.extend(codec_args)
+        cmd.append(movie_file)
+        # FFmpeg output is not read until the encoding finishes, so it is written into a file instead of a pipe that
+        # would block FFmpeg, and the capture feeding it, once the pipe buffer is full
+        self._log_file = tempfile.TemporaryFile()
+        self._process = subprocess.Popen(
+            cmd, stdin=subprocess.PIPE, stdout=self._log_file, stderr=subprocess.STDOUT)
+
+    def process(self, frame_file):
+        with open(frame_file, 'rb') as fh:
+            self._process.stdin.write(fh.read())
+        os.remove(frame_file)
+
+    def close(self):
+        self._process.communicate()
+        try:
+            if self._process.returncode != 0:
+                self._log_file.seek(0)
+                LOGGER.warning('Error while encoding "{}": {}'.format(self._movie_file, self._log_file.read()))
+                return list()
+        finally:
+            self._log_file.close()
+
+        return [self._movie_file]
+
+
+class FrameStream(object):
+    """
+    Watches the folder where a capture is writing its frames and sends each frame to a sink as soon as the frame is
+    written, through a bounded queue. A frame is considered written once the next frame appears or the capture ends
+    """
+
+    def __init__(self, watch_dir, sink, max_queued=8, poll_interval=0.05):
+        """
+        :param watch_dir: str, folder where frames are written
+        :param sink: FrameSink
+        :param max_queued: int, maximum number of frames waiting to be processed
+        :param poll_interval: float, seconds between watch folder checks
+        """
+
+        self._watch_dir = watch_dir
+        self._sink = sink
+        self._poll_interval = poll_interval
+        self._queue = queue.Queue(maxsize=max(1, max_queued))
+        self._seen = set()
+        self._capture_finished = threading.Event()
+        self._watcher = None
+        self._consumer = None
+        self._error = None
+
+    def start(self):
+        """
+        Starts watching capture folder
+        """
+
+        self._watcher = threading.Thread(target=self._watch)
+        self._consumer = threading.Thread(target=self._consume)
+        for thread in (self._watcher, self._consumer):
+            thread.daemon = True
+            thread.start()
+
+    def finish(self):
+        """
+        Must be called once the capture ends. Waits until all pending frames are processed
+        :return: list(str), files generated by the sink
+        """
+
+        self._capture_finished.set()
+        self._watcher.join()
+        self._consumer.join()
+        if self._error:
+            raise self._error
+
+        return self._sink.close()
+
+    def _get_frames(self):
+        """
+        Internal function that returns the frames that are not sent yet to the sink, sorted by frame number
+        :return: list(str)
+        """
+
+        frames = list()
+        for file_name in os.listdir(self._watch_dir):
+            if file_name in self._seen:
+                continue
+            frame = get_frame_number(file_name)
+            if frame is None:
+                continue
+            frames.append((frame, file_name))
+
+        return [file_name for _, file_name in sorted(frames)]
+
+    def _watch(self):
+        """
+        Internal function that pushes written frames into the queue
+        """
+
+        try:
+            while True:
+                # We check the flag before listing the folder, so no frame is lost when the capture ends
+                capture_finished = self._capture_finished.is_set()
+                frames = self._get_frames()
+                if not capture_finished:
+                    frames = frames[:-1]
+                for file_name in frames:
+                    self._seen.add(file_name)
+                    self._queue.put(os.path.join(self._watch_dir, file_name))
+                if capture_finished:
+                    break
+                time.sleep(self._poll_interval)
+        except Exception as exc:
+            LOGGER.error('Error while watching captured frames in "{}": {}'.format(self._watch_dir, exc))
+            self._error = exc
+        finally:
+            self._queue.put(None)
+
+    def _consume(self):
+        """
+        Internal function that sends queued frames into the sink
+        """
+
+        while True:
+            frame_file = self._queue.get()
+            if frame_file is None:
+                break
+            if self._error:
+                continue
+            try:
+                self._sink.process(frame_file)
+            except Exception as exc:
+                LOGGER.error('Error while processing captured frame "{}": {}'.format(frame_file, exc))
+                self._error = exc
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains implementation to measure the time spent in each playblast capture stage
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import os
+import json
+import time
+import logging
+import contextlib
+from collections import OrderedDict
+
+LOGGER = logging.getLogger()
+
+TIMINGS_LOG_ENV = 'ARTELLAPIPE_PLAYBLAST_TIMINGS_LOG'
+
+
+@contextlib.contextmanager
+def measure(records, stage, plugin=None, parent=None):
+    """
+    Context manager that appends to the given list a record with the time spent executing its block
+    :param records: list(dict)
+    :param stage: str, name of the measured stage
+    :param plugin: str, id of the plugin the stage belongs to
+    :param parent: str, name of the stage that contains the measured stage
+    """
+
+    start = time.time()
+    try:
+        yield
+    finally:
+        records.append({
+            'stage': stage, 'plugin': plugin, 'parent': parent, 'start': start, 'duration': time.time() - start})
+
+
+def summarize(records):
+    """
+    Returns total time spent in each stage. Plugin records are summarized as "stage/plugin"
+    :param records: list(dict)
+    :return: OrderedDict(str, float)
+    """
+
+    summary = OrderedDict()
+    for record in sorted(records, key=lambda r: r['start']):
+        key = record['stage'] if not record['plugin'] else '{}/{}'.format(record['stage'], record['plugin'])
+        summary[key] = summary.get(key, 0.0) + record['duration']
+
+    return summary
+
+
+def create_report(records, name=None, status=None):
+    """
+    Returns a report with the given timing records
+    :param records: list(dict)
+    :param name: str, name of the measured capture
+    :param status: str, final status of the capture
+    :return: dict
+    """
+
+    stage_records = [record for record in records if not record['plugin'] and not record['parent']]
+
+    return {
+        'name': name,
+        'status': status,
+        'timestamp': time.time(),
+        'total': sum(record['duration'] for record in stage_records),
+        'summary': summarize(records),
+        'records': sorted(records, key=lambda r: r['start'])
+    }
+
+
+def get_log_file(log_file=None):
+    """
+    Returns file where timing reports are logged
+    :param log_file: str, explicit log file
+    :return: str or None
+    """
+
+    return log_file or os.environ.get(TIMINGS_LOG_ENV, None)
+
+
+def write_report(report, log_file):
+    """
+    Appends given report into a JSON lines log file. Each record is written in a line
+    :param report: dict
+    :param log_file: str
+    """
+
+    log_dir = os.path.dirname(log_file)
+    if log_dir and not os.path.isdir(log_dir):
+        os.makedirs(log_dir)
+
+    try:
+        with open(log_file, 'a') as fh:
+            for record in report['records']:
+                line = dict(record)
+                line.update({'name': report['name'], 'status': report['status'], 'timestamp': report['timestamp']})
+                fh.write('{}\n'.format(json.dumps(line, sort_keys=True)))
+    except Exception as exc:
+        LOGGER.warning('Impossible to write playblast timings into "{}": {}'.format(log_file, exc))
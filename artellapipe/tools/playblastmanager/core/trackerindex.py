@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains implementation for a session cache of production tracker shots and tasks
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import time
+import logging
+import threading
+from collections import OrderedDict
+
+import artellapipe
+
+LOGGER = logging.getLogger()
+
+_TRACKER_INDEX = None
+
+
+def get_tracker_index():
+    """
+    Returns tracker index shared by all the tools of the current session
+    :return: TrackerIndex
+    """
+
+    global _TRACKER_INDEX
+    if _TRACKER_INDEX is None:
+        _TRACKER_INDEX = TrackerIndex()
+
+    return _TRACKER_INDEX
+
+
+class TrackerIndex(object):
+    """
+    Indexes production tracker shots and tasks by (sequence, shot, task), so lookups do not need a tracker request.
+    Shots of a sequence and tasks of a shot are retrieved with a single request the first time they are needed and
+    they are retrieved again once their time to live expires
+    """
+
+    def __init__(self, tracker=None, shots_mgr=None, ttl=300.0):
+        """
+        :param tracker: production tracker. Project tracker is used by default
+        :param shots_mgr: shots manager. Project shots manager is used by default
+        :param ttl: float, seconds cached entries are valid
+        """
+
+        self._tracker = tracker
+        self._shots_mgr = shots_mgr
+        self._ttl = ttl
+        self._shots = dict()
+        self._tasks = dict()
+        self._lock = threading.RLock()
+
+    @property
+    def tracker(self):
+        return self._tracker or artellapipe.Tracker()
+
+    @property
+    def shots_mgr(self):
+        return self._shots_mgr or artellapipe.ShotsMgr()
+
+    def get_shots(self, sequence_name):
+        """
+        Returns shots of the given sequence indexed by their name
+        :param sequence_name: str
+        :return: OrderedDict(str, shot)
+        """
+
+        with self._lock:
+            shots = self._get_valid(self._shots, sequence_name)
+            if shots is None:
+                shots = OrderedDict()
+                for shot in self.shots_mgr.get_shots_from_sequence(sequence_name) or list():
+                    shots[shot.get_name()] = shot
+                self._shots[sequence_name] = (time.time(), shots)
+
+            return shots
+
+    def get_shot_names(self, sequence_name):
+        """
+        Returns names of the shots of the given sequence
+        :param sequence_name: str
+        :return: list(str)
+        """
+
+        return list(self.get_shots(sequence_name).keys())
+
+    def get_shot(self, sequence_name, shot_name):
+        """
+        Returns shot with given name
+        :param sequence_name: str, if not given, shot is searched in all the project
+        :param shot_name: str
+        :return: shot or None
+        """
+
+        with self._lock:
+            if sequence_name:
+                shot = self.get_shots(sequence_name).get(shot_name, None)
+                if shot:
+                    return shot
+            shots = self._get_valid(self._shots, None) or dict()
+            if shot_name not in shots:
+                shot = self.shots_mgr.find_shot(shot_name)
+                if not shot:
+                    return None
+                shots[shot_name] = shot
+                self._shots[None] = (time.time(), shots)
+
+            return shots[shot_name]
+
+    def get_tasks(self, sequence_name, shot_name):
+        """
+        Returns tracker tasks of the given shot indexed by their name
+        :param sequence_name: str
+        :param shot_name: str
+        :return: dict(str, task)
+        """
+
+        with self._lock:
+            key = (sequence_name, shot_name)
+            tasks = self._get_valid(self._tasks, key)
+            if tasks is None:
+                tasks = dict()
+                shot = self.get_shot(sequence_name, shot_name)
+                if not shot:
+                    LOGGER.warning('No shot found with name: "{}"!'.format(shot_name))
+                    return tasks
+                for shot_task in self.tracker.get_tasks_in_shot(shot.get_id()) or list():
+                    tasks[shot_task.name] = shot_task
+                self._tasks[key] = (time.time(), tasks)
+
+            return tasks
+
+    def get_task_names(self, sequence_name, shot_name):
+        """
+        Returns names of the tracker tasks of the given shot
+        :param sequence_name: str
+        :param shot_name: str
+        :return: list(str)
+        """
+
+        return list(self.get_tasks(sequence_name, shot_name).keys())
+
+    def get_task(self, sequence_name, shot_name, task_name):
+        """
+        Returns tracker task of the given shot. If the task is not indexed, shot tasks are retrieved again, because
+        the task could have been created after they were indexed
+        :param sequence_name: str
+        :param shot_name: str
+        :param task_name: str
+        :return: task or None
+        """
+
+        with self._lock:
+            shot_task = self.get_tasks(sequence_name, shot_name).get(task_name, None)
+            if shot_task is None:
+                self._tasks.pop((sequence_name, shot_name), None)
+                shot_task = self.get_tasks(sequence_name, shot_name).get(task_name, None)
+
+            return shot_task
+
+    def invalidate(self, sequence_name=None, shot_name=None):
+        """
+        Removes cached entries. If no sequence is given, all entries are removed
+        :param sequence_name: str
+        :param shot_name: str
+        """
+
+        with self._lock:
+            if sequence_name is None and shot_name is None:
+                self._shots.clear()
+                self._tasks.clear()
+                return
+            if shot_name is None:
+                self._shots.pop(sequence_name, None)
+                for key in [key for key in self._tasks if key[0] == sequence_name]:
+                    self._tasks.pop(key)
+            else:
+                self._tasks.pop((sequence_name, shot_name), None)
+
+    def _get_valid(self, cache, key):
+        """
+        Internal function that returns cached value if its time to live did not expire
+        :param cache: dict
+        :param key: object
+        :return: object or None
+        """
+
+        cached = cache.get(key, None)
+        if not cached:
+            return None
+        timestamp, value = cached
+        if time.time() - timestamp > self._ttl:
+            cache.pop(key, None)
+            return None
+
+        return value
@@ -0,0 +1,472 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains implementation for the background upload of playblasts into production tracker
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import os
+import json
+import time
+import uuid
+import socket
+import logging
+import threading
+import traceback
+
+from artellapipe.tools.playblastmanager.core import naming, trackerindex, timings
+
+LOGGER = logging.getLogger()
+
+_UPLOAD_QUEUE = None
+
+
+class UploadState(object):
+    PENDING = 'pending'
+    UPLOADING = 'uploading'
+    FAILED = 'failed'
+
+
+def get_default_journal_file():
+    """
+    Returns default file where pending uploads are stored
+    :return: str
+    """
+
+    return os.path.join(os.path.expanduser('~'), '.artellapipe', 'playblast_uploads.json')
+
+
+def get_upload_queue():
+    """
+    Returns upload queue of the current session. Queue worker is started the first time this function is called, so
+    uploads pending from previous sessions are resumed
+    :return: UploadQueue
+    """
+
+    global _UPLOAD_QUEUE
+    if _UPLOAD_QUEUE is None:
+        _UPLOAD_QUEUE = UploadQueue()
+        _UPLOAD_QUEUE.start()
+
+    return _UPLOAD_QUEUE
+
+
+def upload_preview(preview_file, sequence_name, shot_name, task_name, comment='', status='', tracker_index=None):
+    """
+    Uploads given preview file into the given shot task of the production tracker
+    :param preview_file: str
+    :param sequence_name: str
+    :param shot_name: str
+    :param task_name: str
+    :param comment: str
+    :param status: str
+    :param tracker_index: trackerindex.TrackerIndex, index used to find the task. Session index is used by default
+    :return: bool
+    """
+
+    if not sequence_name or not shot_name or not task_name:
+        return False
+
+    tracker_index = tracker_index or trackerindex.get_tracker_index()
+    shot_task = tracker_index.get_task(sequence_name, shot_name, task_name)
+    if not shot_task:
+        return False
+
+    return bool(tracker_index.tracker.upload_shot_task_preview(
+        shot_task.id, comment=comment, preview_file_path=preview_file, status=status))
+
+
+class UploadJournal(object):
+    """
+    Stores pending uploads in a JSON file, so uploads survive DCC restarts. The journal can be shared by several
+    sessions: all modifications are done while holding a file lock
+    """
+
+    def __init__(self, journal_file):
+        """
+        :param journal_file: str
+        """
+
+        self._journal_file = journal_file
+
+    @property
+    def journal_file(self):
+        return self._journal_file
+
+    def get_entries(self):
+        """
+        Returns all entries stored in the journal
+        :return: list(dict)
+        """
+
+        return self._read()
+
+    def add(self, entry):
+        """
+        Adds a new entry into the journal
+        :param entry: dict
+        """
+
+        with self._lock():
+            entries = self._read()
+            entries.append(entry)
+            self._write(entries)
+
+    def update(self, entry_id, **kwargs):
+        """
+        Updates the values of the given entry
+        :param entry_id: str
+        :param kwargs: dict, values to update
+        :return: dict or None, updated entry
+        """
+
+        with self._lock():
+            entries = self._read()
+            for entry in entries:
+                if entry['id'] == entry_id:
+                    entry.update(kwargs)
+                    self._write(entries)
+                    return entry
+
+        return None
+
+    def remove(self, entry_id):
+        """
+        Removes given entry from the journal
+        :param entry_id: str
+        """
+
+        with self._lock():
+            entries = self._read()
+            self._write([entry for entry in entries if entry['id'] != entry_id])
+
+    def claim(self, now=None, claim_timeout=300.0, exclude=None):
+        """
+        Marks as uploading and returns the next entry ready to be uploaded. Entries claimed by a session that did not
+        finish the upload are claimed again once claim timeout is reached
+        :param now: float, current time
+        :param claim_timeout: float, seconds after which uploading entries are considered abandoned
+        :param exclude: list(str), identifiers of entries that cannot be claimed
+        :return: dict or None
+        """
+
+        now = time.time() if now is None else now
+        exclude = exclude or list()
+        with self._lock():
+            entries = self._read()
+            for entry in sorted(entries, key=lambda e: e['next_attempt']):
+                if entry['id'] in exclude or entry['state'] == UploadState.FAILED:
+                    continue
+                if entry['state'] == UploadState.UPLOADING and now - entry['claimed_at'] < claim_timeout:
+                    continue
+                if entry['next_attempt'] > now:
+                    continue
+                entry['state'] = UploadState.UPLOADING
+                entry['claimed_at'] = now
+                entry['owner'] = '{}:{}'.format(socket.gethostname(), os.getpid())
+                self._write(entries)
+                return dict(entry)
+
+        return None
+
+    def _lock(self):
+        """
+        Internal function that returns the lock used to modify the journal
+        :return: naming.FileLock
+        """
+
+        journal_dir = os.path.dirname(self._journal_file)
+        if journal_dir and not os.path.isdir(journal_dir):
+            os.makedirs(journal_dir)
+
+        return naming.FileLock('{}.lock'.format(self._journal_file))
+
+    def _read(self):
+        """
+        Internal function that reads journal entries from disk
+        :return: list(dict)
+        """
+
+        if not os.path.isfile(self._journal_file):
+            return list()
+        try:
+            with open(self._journal_file, 'r') as fh:
+                return json.load(fh)
+        except Exception as exc:
+            LOGGER.warning('Impossible to read playblast uploads journal "{}": {}'.format(self._journal_file, exc))
+            return list()
+
+    def _write(self, entries):
+        """
+        Internal function that writes journal entries into disk. Journal is replaced atomically, so a crash never
+        leaves a partially written journal
+        :param entries: list(dict)
+        """
+
+        temp_file = '{}.{}'.format(self._journal_file, os.getpid())
+        with open(temp_file, 'w') as fh:
+            json.dump(entries, fh, indent=4)
+        if hasattr(os, 'replace'):
+            os.replace(temp_file, self._journal_file)
+        else:
+            # Python 2 cannot rename a file over an existing one in Windows
+            if os.path.isfile(self._journal_file):
+                os.remove(self._journal_file)
+            os.rename(temp_file, self._journal_file)
+
+
+class UploadQueue(object):
+    """
+    Uploads playblasts into production tracker in a background thread. Failed uploads are retried with exponential
+    backoff and pending uploads are resumed the next time the queue is started
+    """
+
+    def __init__(self, journal_file=None, tracker_index=None, max_attempts=8, base_delay=5.0,
+                 max_delay=600.0, poll_interval=1.0, claim_timeout=300.0, timings_log=None):
+        """
+        :param journal_file: str, file where pending uploads are stored
+        :param tracker_index: trackerindex.TrackerIndex, index used to find tracker tasks. Session index is used by
+            default
+        :param max_attempts: int, number of attempts before an upload is marked as failed
+        :param base_delay: float, seconds to wait before retrying an upload the first time. Delay is doubled after
+            each failed attempt
+        :param max_delay: float, maximum seconds to wait between attempts
+        :param poll_interval: float, seconds between journal checks in the background thread
+        :param claim_timeout: float, seconds after which uploads claimed by other sessions are retried
+        :param timings_log: str, JSON lines file where the time spent in each upload attempt is logged.
+            ARTELLAPIPE_PLAYBLAST_TIMINGS_LOG environment variable is used by default
+        """
+
+        self._journal = UploadJournal(journal_file or get_default_journal_file())
+        self._tracker_index = tracker_index
+        self._max_attempts = max_attempts
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._poll_interval = poll_interval
+        self._claim_timeout = claim_timeout
+        self._timings_log = timings_log
+        self._callbacks = list()
+        self._wake_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    @property
+    def journal(self):
+        return self._journal
+
+    @property
+    def tracker_index(self):
+        return self._tracker_index or trackerindex.get_tracker_index()
+
+    def add_callback(self, callback):
+        """
+        Registers a function that is called, from the queue thread, with the entry and whether it was uploaded
+        each time an upload attempt finishes
+        :param callback: fn
+        """
+
+        self._callbacks.append(callback)
+
+    def remove_callback(self, callback):
+        """
+        Unregisters a function registered with add_callback
+        :param callback: fn
+        """
+
+        if callback in self._callbacks:
+            self._callbacks.remove(callback)
+
+    def get_failed(self):
+        """
+        Returns uploads that failed and must be uploaded manually
+        :return: list(dict)
+        """
+
+        return [entry for entry in self._journal.get_entries() if entry['state'] == UploadState.FAILED]
+
+    def clear_failed(self):
+        """
+        Removes failed uploads from the queue
+        :return: int, number of removed uploads
+        """
+
+        failed_entries = self.get_failed()
+        for entry in failed_entries:
+            self._journal.remove(entry['id'])
+
+        return len(failed_entries)
+
+    def enqueue(self, preview_file, sequence_name, shot_name, task_name, comment='', status=''):
+        """
+        Adds a new upload into the queue
+        :param preview_file: str
+        :param sequence_name: str
+        :param shot_name: str
+        :param task_name: str
+        :param comment: str
+        :param status: str
+        :return: str, upload identifier
+        """
+
+        entry = {
+            'id': str(uuid.uuid4()),
+            'file': preview_file,
+            'sequence_name': sequence_name,
+            'shot_name': shot_name,
+            'task_name': task_name,
+            'comment': comment,
+            'status': status,
+            'state': UploadState.PENDING,
+            'attempts': 0,
+            'next_attempt': time.time(),
+            'claimed_at': 0,
+            'owner': None,
+            'last_error': None
+        }
+        self._journal.add(entry)
+        self._wake_event.set()
+
+        return entry['id']
+
+    def start(self):
+        """
+        Starts the thread that uploads queued playblasts
+        """
+
+        if self._thread and self._thread.is_alive():
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        """
+        Stops queue thread. Pending uploads remain in the journal
+        :param timeout: float
+        """
+
+        self._stop_event.set()
+        self._wake_event.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def process_pending(self, now=None):
+        """
+        Uploads all entries that are ready to be uploaded. Each entry is tried once at most
+        :param now: float, current time
+        :return: int, number of upload attempts
+        """
+
+        processed = set()
+        while not self._stop_event.is_set():
+            entry = self._journal.claim(now=now, claim_timeout=self._claim_timeout, exclude=processed)
+            if not entry:
+                break
+            processed.add(entry['id'])
+            self._process_entry(entry, now=now)
+
+        return len(processed)
+
+    def get_retry_delay(self, attempts):
+        """
+        Returns seconds to wait before retrying an upload that failed the given number of times
+        :param attempts: int
+        :return: float
+        """
+
+        return min(self._max_delay, self._base_delay * (2 ** max(0, attempts - 1)))
+
+    def _run(self):
+        """
+        Internal function that drains the queue until it is stopped
+        """
+
+        while not self._stop_event.is_set():
+            try:
+                self.process_pending()
+            except Exception as exc:
+                LOGGER.error('Error while processing playblast uploads: {} | {}'.format(exc, traceback.format_exc()))
+            self._wake_event.wait(self._poll_interval)
+            self._wake_event.clear()
+
+    def _process_entry(self, entry, now=None):
+        """
+        Internal function that uploads given entry and updates the journal with the result
+        :param entry: dict
+        :param now: float, current time
+        """
+
+        error = None
+        uploaded = False
+        timing_records = list()
+        file_exists = os.path.isfile(entry['file'])
+        if not file_exists:
+            error = 'Preview file to upload does not exists: "{}"'.format(entry['file'])
+        else:
+            try:
+                # Capture upload stage only queues the upload, so the time spent uploading is measured here
+                with timings.measure(timing_records, 'upload'):
+                    uploaded = upload_preview(
+                        entry['file'], entry['sequence_name'], entry['shot_name'], entry['task_name'],
+                        comment=entry['comment'], status=entry['status'], tracker_index=self.tracker_index)
+                if not uploaded:
+                    error = 'Task "{}" of shot "{}" not found'.format(entry['task_name'], entry['shot_name'])
+            except Exception as exc:
+                error = str(exc)
+        if timing_records:
+            self._log_timings(entry, timing_records, uploaded)
+
+        if uploaded:
+            LOGGER.info('Playblast uploaded to production tracker ({:.3f}s): "{}"'.format(
+                timing_records[0]['duration'], entry['file']))
+            self._journal.remove(entry['id'])
+        else:
+            attempts = entry['attempts'] + 1
+            now = time.time() if now is None else now
+            if not file_exists:
+                # Retrying does not bring back a missing file
+                state = UploadState.FAILED
+                LOGGER.warning('{}. Please upload it manually!'.format(error))
+            elif attempts >= self._max_attempts:
+                state = UploadState.FAILED
+                LOGGER.warning(
+                    'It was not possible to upload "{}" after {} attempts. Please upload it manually!'.format(
+                        entry['file'], attempts))
+            else:
+                state = UploadState.PENDING
+                LOGGER.warning('Error while uploading "{}": {}. Retrying in {} seconds ...'.format(
+                    entry['file'], error, self.get_retry_delay(attempts)))
+            entry = self._journal.update(
+                entry['id'], state=state, attempts=attempts, last_error=error,
+                next_attempt=now + self.get_retry_delay(attempts)) or entry
+
+        for callback in self._callbacks:
+            try:
+                callback(entry, uploaded)
+            except Exception as exc:
+                LOGGER.error('Error while executing playblast upload callback: {}'.format(exc))
+
+    def _log_timings(self, entry, timing_records, uploaded):
+        """
+        Internal function that logs the time spent in an upload attempt into the timings log file
+        :param entry: dict
+        :param timing_records: list(dict)
+        :param uploaded: bool
+        """
+
+        log_file = timings.get_log_file(self._timings_log)
+        if not log_file:
+            return
+
+        status = 'uploaded' if uploaded else 'upload_failed'
+        timings.write_report(timings.create_report(timing_records, name=entry['file'], status=status), log_file)
@@ -0,0 +1,265 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains implementation to grab previews directly from the framebuffer of a live viewport.
+Grabbing a viewport avoids the playblast and the disk round-trip of capture_scene, but it is only valid when the
+viewport already looks like the requested playblast
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import ctypes
+import logging
+
+from Qt.QtCore import *
+from Qt.QtGui import *
+
+import tpDcc as tp
+
+if tp.is_maya():
+    import tpDcc.dccs.maya as maya
+    import maya.api.OpenMaya as OpenMaya
+    import maya.api.OpenMayaUI as OpenMayaUI
+
+LOGGER = logging.getLogger()
+
+# Options that override how the viewport draws the scene
+OVERRIDE_OPTIONS = ('display_options', 'viewport_options', 'viewport2_options', 'camera_options')
+
+# Options that can not be reproduced by grabbing a viewport
+UNSUPPORTED_OPTIONS = ('isolate',)
+
+# Option group used to query the state of the viewport itself (size and ornaments)
+VIEW_OPTIONS = 'view'
+
+# Returned by live value getters when the value of an option can not be queried
+MISSING = object()
+
+FLOAT_TOLERANCE = 1e-4
+
+# Maximum relative difference between the aspect ratio of the viewport and the aspect ratio of the requested image
+ASPECT_TOLERANCE = 0.01
+
+
+def get_overrides(options):
+    """
+    Returns the options that override how the viewport draws the scene
+    :param options: dict or PlayblastOptions
+    :return: list(tuple(str, str, object)), option group, option name and value of each override
+    """
+
+    overrides = list()
+    for group in OVERRIDE_OPTIONS:
+        for key, value in sorted((options.get(group, None) or dict()).items()):
+            overrides.append((group, key, value))
+
+    return overrides
+
+
+def matches_live_view(options, live_camera, get_live_value, size=None):
+    """
+    Returns whether given options would capture the same image that is shown by a live viewport
+    :param options: dict or PlayblastOptions
+    :param live_camera: str, camera shown by the viewport
+    :param get_live_value: fn, function that receives an option group and an option name and returns the value of
+        that option in the viewport, or MISSING if it can not be queried. VIEW_OPTIONS group is used to query the
+        viewport size and whether ornaments are shown
+    :param size: tuple(int, int), resolution of the requested image. Options width and height are used if not given
+    :return: bool
+    """
+
+    for key in UNSUPPORTED_OPTIONS:
+        if options.get(key, None):
+            return False
+
+    camera = options.get('camera', None)
+    if camera and (not live_camera or _get_short_name(camera) != _get_short_name(live_camera)):
+        return False
+
+    width, height = size or (options.get('width', None), options.get('height', None))
+    if width and height:
+        live_size = get_live_value(VIEW_OPTIONS, 'size')
+        if live_size is MISSING or not _is_same_aspect_ratio((width, height), live_size):
+            return False
+
+    live_ornaments = get_live_value(VIEW_OPTIONS, 'show_ornaments')
+    if live_ornaments is MISSING or bool(live_ornaments) != bool(options.get('show_ornaments', True)):
+        return False
+
+    # Viewports always show the 2D pan/zoom of the camera, but playblasts only apply it if it is enabled for renders.
+    # If options override the pan/zoom, it is compared with the rest of camera overrides
+    if 'panZoomEnabled' not in (options.get('camera_options', None) or dict()):
+        pan_zoom_enabled = get_live_value('camera_options', 'panZoomEnabled')
+        if pan_zoom_enabled is MISSING:
+            return False
+        if pan_zoom_enabled:
+            render_pan_zoom = get_live_value('camera_options', 'renderPanZoom')
+            if render_pan_zoom is MISSING or not render_pan_zoom:
+                return False
+
+    for group, key, value in get_overrides(options):
+        live_value = get_live_value(group, key)
+        if live_value is MISSING or not _is_same_value(value, live_value):
+            return False
+
+    return True
+
+
+def grab_view(options, width, height):
+    """
+    Returns the image shown by the viewport of the playblast camera, if the viewport already looks like the requested
+    playblast. Only the current frame can be grabbed and the viewport must have the aspect ratio of the image
+    :param options: dict or PlayblastOptions
+    :param width: int
+    :param height: int
+    :return: QImage or None, None if viewport can not be grabbed and preview must be captured
+    """
+
+    if not tp.is_maya():
+        return None
+
+    panel = find_model_panel(options.get('camera', None))
+    if not panel:
+        return None
+
+    live_camera = maya.cmds.modelPanel(panel, query=True, camera=True)
+    if not matches_live_view(
+            options, live_camera, lambda group, key: _get_maya_live_value(panel, group, key), size=(width, height)):
+        return None
+
+    try:
+        view = OpenMayaUI.M3dView.getM3dViewFromModelPanel(panel)
+        view.refresh(False, True)
+        image = OpenMaya.MImage()
+        view.readColorBuffer(image, True)
+        image_width, image_height = image.getSize()
+        data = ctypes.string_at(image.pixels(), image_width * image_height * 4)
+    except Exception as exc:
+        LOGGER.debug('Impossible to grab viewport "{}": {}'.format(panel, exc))
+        return None
+
+    # Framebuffer rows are stored bottom to top. Mirroring also copies data, so image does not reference the buffer
+    qimage = QImage(data, image_width, image_height, QImage.Format_RGBA8888).mirrored(False, True)
+
+    # Viewport and image have the same aspect ratio, so the image is not distorted
+    return qimage.scaled(width, height, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+
+
+def find_model_panel(camera=None):
+    """
+    Returns the visible model panel that shows the given camera. Focused panel is returned if it shows the camera
+    :param camera: str, if not given, focused model panel is returned
+    :return: str or None
+    """
+
+    if not tp.is_maya():
+        return None
+
+    focused_panel = maya.cmds.getPanel(withFocus=True)
+    visible_panels = maya.cmds.getPanel(visiblePanels=True) or list()
+    model_panels = [
+        panel for panel in [focused_panel] + visible_panels
+        if panel and maya.cmds.getPanel(typeOf=panel) == 'modelPanel']
+    for panel in model_panels:
+        if not camera:
+            return panel
+        panel_camera = maya.cmds.modelPanel(panel, query=True, camera=True)
+        if panel_camera and _get_short_name(panel_camera) == _get_short_name(camera):
+            return panel
+
+    return None
+
+
+def _get_maya_live_value(panel, group, key):
+    """
+    Internal function that returns the value of the given option in the given Maya model panel
+    :param panel: str
+    :param group: str, option group
+    :param key: str, option name
+    :return: object
+    """
+
+    try:
+        if group == VIEW_OPTIONS:
+            if key == 'size':
+                view = OpenMayaUI.M3dView.getM3dViewFromModelPanel(panel)
+                return view.portWidth(), view.portHeight()
+            elif key == 'show_ornaments':
+                return maya.cmds.modelEditor(panel, query=True, hud=True)
+        elif group == 'display_options':
+            if key == 'displayGradient':
+                return maya.cmds.displayPref(query=True, displayGradient=True)
+            return maya.cmds.displayRGBColor(key, query=True)
+        elif group == 'viewport_options':
+            try:
+                return maya.cmds.modelEditor(panel, query=True, **{key: True})
+            except TypeError:
+                # Options that are not modelEditor flags are plugin display filters
+                return maya.cmds.modelEditor(panel, query=True, queryPluginObjects=key)
+        elif group == 'viewport2_options':
+            return maya.cmds.getAttr('hardwareRenderingGlobals.{}'.format(key))
+        elif group == 'camera_options':
+            camera = maya.cmds.modelPanel(panel, query=True, camera=True)
+            return maya.cmds.getAttr('{}.{}'.format(camera, key))
+    except Exception:
+        return MISSING
+
+    return MISSING
+
+
+def _get_short_name(node):
+    """
+    Internal function that returns the name of the given node without its path
+    :param node: str
+    :return: str
+    """
+
+    return node.split('|')[-1]
+
+
+def _is_same_aspect_ratio(size, live_size):
+    """
+    Internal function that returns whether given image sizes have the same aspect ratio
+    :param size: tuple(int, int)
+    :param live_size: tuple(int, int)
+    :return: bool
+    """
+
+    width, height = size
+    live_width, live_height = live_size
+    if not height or not live_height:
+        return False
+    aspect_ratio = float(width) / height
+    live_aspect_ratio = float(live_width) / live_height
+
+    return abs(aspect_ratio - live_aspect_ratio) <= aspect_ratio * ASPECT_TOLERANCE
+
+
+def _is_same_value(value, live_value):
+    """
+    Internal function that returns whether an option value is the same as the value queried from a viewport
+    Sequences are compared item by item, so lists and tuples with same items are equal, and floats are compared with
+    a tolerance
+    :param value: object
+    :param live_value: object
+    :return: bool
+    """
+
+    if isinstance(value, (list, tuple)) and isinstance(live_value, (list, tuple)):
+        # Maya returns single item lists for some values (for example, colors are returned as [(r, g, b)])
+        if len(live_value) == 1 and isinstance(live_value[0], (list, tuple)):
+            live_value = live_value[0]
+        return len(value) == len(live_value) and all(
+            _is_same_value(item, live_item) for item, live_item in zip(value, live_value))
+    if isinstance(value, bool) or isinstance(live_value, bool):
+        return bool(value) == bool(live_value)
+    if isinstance(value, (int, float)) and isinstance(live_value, (int, float)):
+        return abs(value - live_value) <= FLOAT_TOLERANCE
+
+    return value == live_value
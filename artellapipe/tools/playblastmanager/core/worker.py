@@ -0,0 +1,173 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains standalone worker used to capture playblasts from batch sessions
+Usage: mayapy -m artellapipe.tools.playblastmanager.core.worker <job_file.json>
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import sys
+import json
+import logging
+import argparse
+import importlib
+import traceback
+
+LOGGER = logging.getLogger()
+
+# Cameras that exist in every scene and never are used as shot cameras
+DEFAULT_CAMERAS = ('persp', 'top', 'front', 'side')
+
+
+def read_job_file(job_file):
+    """
+    Reads the given worker job file
+    :param job_file: str
+    :return: dict
+    """
+
+    with open(job_file, 'r') as fh:
+        job_data = json.load(fh)
+
+    options_file = job_data.get('options_file', None)
+    if options_file:
+        with open(options_file, 'r') as fh:
+            options = json.load(fh)
+        options.update(job_data.get('options', dict()))
+        job_data['options'] = options
+
+    return job_data
+
+
+def write_result_file(result_file, result):
+    """
+    Writes the result of a worker job into disk
+    :param result_file: str
+    :param result: dict
+    """
+
+    with open(result_file, 'w') as fh:
+        json.dump(result, fh, indent=4)
+
+
+def resolve_scene_options(options):
+    """
+    Fills the options that depend on the opened scene (frame range, camera and sound)
+    :param options: dict
+    :return: dict
+    """
+
+    import artellapipe
+
+    scene = artellapipe.PlayblastsMgr().parse_current_scene()
+    if options.get('start_frame', None) is None and not options.get('frame', None):
+        options['start_frame'] = scene.get('start_frame', None)
+        options['end_frame'] = scene.get('end_frame', None)
+    if 'sound' not in options:
+        options['sound'] = scene.get('sound', None)
+
+    # Shared options never store a camera, so a camera in the options always is an override of the shot
+    camera = options.get('camera', None) or resolve_shot_camera(options.get('shot_name', None), scene.get('camera'))
+    if not camera:
+        raise ValueError('No camera found to capture shot "{}"'.format(options.get('shot_name', None)))
+    options['camera'] = camera
+
+    return options
+
+
+def resolve_shot_camera(shot_name=None, scene_camera=None):
+    """
+    Returns the camera used to capture the given shot in the opened scene. Camera of the shot entity is used first,
+    then the given scene camera and, finally, the scene camera named after the shot or the only non default one
+    :param shot_name: str
+    :param scene_camera: str
+    :return: str or None
+    """
+
+    import tpDcc as tp
+    import artellapipe
+
+    shot = artellapipe.ShotsMgr().find_shot(shot_name) if shot_name else None
+    get_camera = getattr(shot, 'get_camera', None)
+    for camera in (get_camera() if get_camera else None, scene_camera):
+        if camera and tp.Dcc.object_exists(camera):
+            return camera
+
+    camera_transforms = tp.Dcc.shape_transform(tp.Dcc.list_nodes(node_type='camera') or list()) or list()
+    cameras = [camera for camera in camera_transforms if tp.Dcc.node_short_name(camera) not in DEFAULT_CAMERAS]
+    if shot_name:
+        shot_cameras = [camera for camera in cameras if shot_name.lower() in tp.Dcc.node_short_name(camera).lower()]
+        if len(shot_cameras) == 1:
+            return shot_cameras[0]
+
+    return cameras[0] if len(cameras) == 1 else None
+
+
+def run_job(job_data):
+    """
+    Opens the scene of the given job and captures it
+    :param job_data: dict
+    :return: dict, result of the job
+    """
+
+    import tpDcc as tp
+    from artellapipe.tools.playblastmanager.core import engine
+
+    scene_file = job_data.get('scene', None)
+    if scene_file:
+        tp.Dcc.open_file(scene_file, force=True)
+
+    options = resolve_scene_options(job_data.get('options', dict()))
+    job = engine.PlayblastJob(options, output_dir=job_data.get('output_dir', None))
+    engine.PlayblastEngine().run(job)
+
+    return {
+        'status': job.status,
+        'filename': job.options.get('filename', None),
+        'errors': job.errors
+    }
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description='Captures a playblast from a standalone session')
+    parser.add_argument('job_file', help='JSON file with the job to capture')
+    parser.add_argument('--result', default=None, help='JSON file where the result of the job is stored')
+    parsed_args = parser.parse_args(args)
+
+    job_data = read_job_file(parsed_args.job_file)
+    result_file = parsed_args.result or job_data.get('result_file', None)
+
+    # DCC must be initialized before importing tpDcc, so DCC specific implementations are loaded
+    try:
+        import maya.standalone
+        maya.standalone.initialize(name='python')
+    except ImportError:
+        pass
+
+    from artellapipe.tools.playblastmanager.core import engine
+
+    try:
+        # Studio bootstrap module, used to initialize artellapipe project in the standalone session
+        bootstrap = job_data.get('bootstrap', None)
+        if bootstrap:
+            importlib.import_module(bootstrap)
+        result = run_job(job_data)
+    except Exception as exc:
+        LOGGER.error('Error while capturing playblast: {} | {}'.format(exc, traceback.format_exc()))
+        result = {'status': engine.JobStatus.FAILED, 'filename': None, 'errors': [str(exc)]}
+
+    if result_file:
+        write_result_file(result_file, result)
+
+    return 0 if result.get('status', None) == engine.JobStatus.FINISHED else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -73,6 +73,7 @@ class CamerasWidget(plugin.PlayblastPlugin, object):
         self.get_active.clicked.connect(self._on_set_active_camera)
         self.refresh.clicked.connect(self._on_refresh)
         self.cameras.currentIndexChanged.connect(self._on_camera_selected)
+        self.cameras.currentIndexChanged.connect(self.optionsChanged)
 
     def validate(self):
         """
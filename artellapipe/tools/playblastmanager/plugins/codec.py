@@ -98,9 +98,14 @@ class CodecWidget(plugin.PlayblastPlugin, object):
 
         try:
             self.format.setCurrentIndex(self.format.findText(codec_format))
-            self.compression.setCurrentIndex(self.compression.findText(compression))
         except Exception:
             self.format.setCurrentIndex(codec_format)
+        # Compressions are refreshed when format changes, so we refresh them if format signals are blocked
+        if self.format.signalsBlocked():
+            self._on_format_changed()
+        try:
+            self.compression.setCurrentIndex(self.compression.findText(compression))
+        except Exception:
             self.compression.setCurrentIndex(compression)
         self.quality.setValue(int(quality))
 
@@ -30,6 +30,7 @@ class DisplayOptionsWidget(plugin.PlayblastPlugin, object):
     """
 
     id = 'DisplayOptions'
+    scene_events = ('displayRGBColorChanged', 'DisplayPreferenceChanged')
     label = 'Display Options'
     collapsed = True
 
@@ -129,6 +130,14 @@ class DisplayOptionsWidget(plugin.PlayblastPlugin, object):
         override = attrs_dict.get('override_display', False)
         self.override.setChecked(override)
 
+    def refresh_state(self):
+        """
+        Overrides base ArtellaPlayblastPlugin refresh_state function
+        Updates widgets whose state depends on plugin attributes
+        """
+
+        self._on_toggle_override()
+
     def display_gradient(self):
         """
         Returns whether the background should be displayed as gradient
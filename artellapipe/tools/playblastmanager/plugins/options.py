@@ -26,6 +26,7 @@ if tp.is_maya():
 class PlayblastOptionsWidget(plugin.PlayblastPlugin, object):
 
     id = 'Options'
+    scene_events = ('SelectionChanged', 'ActiveViewChanged', 'modelEditorChanged')
     collapsed = True
 
     def __init__(self, project, config, parent=None):
@@ -42,13 +43,22 @@ class PlayblastOptionsWidget(plugin.PlayblastPlugin, object):
 
         self.isolate_view = QCheckBox('Use isolate view from active panel')
         self.off_screen = QCheckBox('Render offscreen')
+        self.stream_capture = QCheckBox('Process frames while capturing')
+        self.stream_capture.setToolTip(
+            'Captured frames are moved or encoded while the capture is running, so they do not pile up in disk')
 
-        for widget in [self.isolate_view, self.off_screen]:
+        self.incremental_capture = QCheckBox('Only capture frames that changed since last capture')
+        self.incremental_capture.setToolTip(
+            'Frames whose camera, animation and options did not change are reused from previous captures')
+
+        for widget in [self.isolate_view, self.off_screen, self.stream_capture, self.incremental_capture]:
             self.main_layout.addWidget(widget)
 
         self.widgets = {
             'off_screen': self.off_screen,
-            'isolate_view': self.isolate_view
+            'isolate_view': self.isolate_view,
+            'stream_capture': self.stream_capture,
+            'incremental_capture': self.incremental_capture
         }
 
         self.apply_inputs(self.get_defaults())
@@ -56,11 +66,15 @@ class PlayblastOptionsWidget(plugin.PlayblastPlugin, object):
     def setup_signals(self):
         self.isolate_view.stateChanged.connect(self.optionsChanged)
         self.off_screen.stateChanged.connect(self.optionsChanged)
+        self.stream_capture.stateChanged.connect(self.optionsChanged)
+        self.incremental_capture.stateChanged.connect(self.optionsChanged)
 
     def get_defaults(self):
         return {
             'off_screen': True,
-            'isolate_view': False
+            'isolate_view': False,
+            'stream_capture': False,
+            'incremental_capture': False
         }
 
     def get_inputs(self, as_preset=False):
@@ -87,6 +101,8 @@ class PlayblastOptionsWidget(plugin.PlayblastPlugin, object):
         inputs = self.get_inputs(as_preset=False)
         outputs = dict()
         outputs['off_screen'] = inputs['off_screen']
+        outputs['stream_capture'] = inputs['stream_capture']
+        outputs['incremental_capture'] = inputs['incremental_capture']
 
         if inputs['isolate_view']:
             panel = gui.get_active_editor()
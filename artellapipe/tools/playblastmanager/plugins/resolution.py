@@ -33,6 +33,7 @@ class ScaleSettings(object):
 class ResolutionWidget(plugin.PlayblastPlugin, object):
 
     id = 'Resolution'
+    scene_events = ('ActiveViewChanged', 'renderLayerChange')
     collapsed = True
 
     resolutionChanged = Signal()
@@ -108,9 +109,6 @@ class ResolutionWidget(plugin.PlayblastPlugin, object):
 
         self.mode.currentIndexChanged.connect(self._on_mode_changed)
         self.mode.currentIndexChanged.connect(self._on_resolution_changed)
-        self.percent.valueChanged.connect(self._on_resolution_changed)
-        self.width.valueChanged.connect(self._on_resolution_changed)
-        self.height.valueChanged.connect(self._on_resolution_changed)
 
         self.mode.currentIndexChanged.connect(self.optionsChanged)
         self.percent.valueChanged.connect(self.optionsChanged)
@@ -172,6 +170,16 @@ class ResolutionWidget(plugin.PlayblastPlugin, object):
         self.height.setValue(height)
         self.percent.setValue(percent)
 
+    def refresh_state(self):
+        """
+        Overrides base ArtellaPlayblastPlugin refresh_state function
+        Updates widgets whose state depends on plugin attributes
+        Resolution label is only updated here, so it is not recalculated for each step while dragging spinboxes
+        """
+
+        self._on_mode_changed()
+        self._on_resolution_changed()
+
     def _get_output_resolution(self):
         """
         Internal function that returns the ouput resolution
@@ -62,6 +62,8 @@ class SaveWidget(plugin.PlayblastPlugin, object):
     """
 
     id = 'Save'
+    # File name contains a time stamp when no path is defined, so it is retrieved each time
+    cache_outputs = False
     max_recent_playblasts = 5
 
     def __init__(self, project, config, parent=None):
@@ -136,6 +138,7 @@ class SaveWidget(plugin.PlayblastPlugin, object):
         self.file_path.textChanged.connect(self.optionsChanged)
         self.save_file.stateChanged.connect(self.optionsChanged)
         self.raw_frame_numbers.stateChanged.connect(self.optionsChanged)
+        self.open_viewer.stateChanged.connect(self.optionsChanged)
         self.save_file.stateChanged.connect(self._on_save_changed)
 
         self._on_save_changed()
@@ -208,6 +211,14 @@ class SaveWidget(plugin.PlayblastPlugin, object):
 
         self.file_path.setText(directory)
 
+    def refresh_state(self):
+        """
+        Overrides base ArtellaPlayblastPlugin refresh_state function
+        Updates widgets whose state depends on plugin attributes
+        """
+
+        self._on_save_changed()
+
     def add_playblast(self, item):
         """
         Adds an item into the playblast menu
@@ -14,7 +14,7 @@ __email__ = "tpovedatd@gmail.com"
 
 from tpDcc.libs.qt.widgets import layouts, checkbox
 
-from artellapipe.tools.playblastmanager.core import plugin
+from artellapipe.tools.playblastmanager.core import plugin, stamper
 
 
 class StampWidget(plugin.PlayblastPlugin, object):
@@ -35,7 +35,16 @@ class StampWidget(plugin.PlayblastPlugin, object):
         super(StampWidget, self).ui()
 
         self.enable_cbx = checkbox.BaseCheckBox('Enable')
+        self.burnin_cbx = checkbox.BaseCheckBox('Burn-in into frames before encoding')
+        self.burnin_cbx.setToolTip(
+            'Frame number, shot, camera, focal length and date are burned into captured frames')
+        self.burnin_cbx.setEnabled(stamper.is_available())
         self.main_layout.addWidget(self.enable_cbx)
+        self.main_layout.addWidget(self.burnin_cbx)
+
+    def setup_signals(self):
+        self.enable_cbx.stateChanged.connect(self.optionsChanged)
+        self.burnin_cbx.stateChanged.connect(self.optionsChanged)
 
     def get_inputs(self, as_preset=False):
         """
@@ -45,7 +54,8 @@ class StampWidget(plugin.PlayblastPlugin, object):
         """
 
         return {
-            'enable_stamp': self.enable_cbx.isChecked()
+            'enable_stamp': self.enable_cbx.isChecked(),
+            'stamp_burnin': self.burnin_cbx.isChecked()
         }
 
     def get_outputs(self):
@@ -56,7 +66,8 @@ class StampWidget(plugin.PlayblastPlugin, object):
         """
 
         return {
-            'enable_stamp': self.enable_cbx.isChecked()
+            'enable_stamp': self.enable_cbx.isChecked(),
+            'stamp_burnin': self.burnin_cbx.isChecked()
         }
 
     def apply_inputs(self, attrs_dict):
@@ -67,5 +78,7 @@ class StampWidget(plugin.PlayblastPlugin, object):
         """
 
         enable = attrs_dict.get('enable_stamp', True)
+        burnin = attrs_dict.get('stamp_burnin', False)
 
         self.enable_cbx.setChecked(enable)
+        self.burnin_cbx.setChecked(burnin and stamper.is_available())
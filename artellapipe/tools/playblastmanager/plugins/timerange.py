@@ -13,7 +13,6 @@ __maintainer__ = "Tomas Poveda"
 __email__ = "tpovedatd@gmail.com"
 
 import re
-import sys
 
 import tpDcc as tp
 from tpDcc.libs.qt.widgets import layouts, combobox, spinbox, lineedit
@@ -31,8 +30,11 @@ class TimeRanges(object):
 class TimeRangeWidget(plugin.PlayblastPlugin, object):
 
     id = 'TimeRange'
+    scene_events = ('timeChanged', 'playbackRangeChanged', 'playbackRangeSliderChanged')
     label = 'Time Range'
     collapsed = True
+    # Spin boxes store values as C integers, so sys.maxint (not available in Python 3) overflows in 64 bits platforms
+    MAX_FRAME = 2 ** 31 - 1
 
     def __init__(self, project, config, parent=None):
 
@@ -57,10 +59,10 @@ class TimeRangeWidget(plugin.PlayblastPlugin, object):
              TimeRanges.CUSTOM_FRAMES])
 
         self.start = spinbox.BaseSpinBox()
-        self.start.setRange(-sys.maxint, sys.maxint)
+        self.start.setRange(-self.MAX_FRAME, self.MAX_FRAME)
         self.start.setFixedHeight(20)
         self.end = spinbox.BaseSpinBox()
-        self.end.setRange(-sys.maxint, sys.maxint)
+        self.end.setRange(-self.MAX_FRAME, self.MAX_FRAME)
         self.end.setFixedHeight(20)
 
         self.custom_frames = lineedit.BaseLineEdit()
@@ -74,11 +76,12 @@ class TimeRangeWidget(plugin.PlayblastPlugin, object):
 
     def setup_signals(self):
         self.start.valueChanged.connect(self._ensure_end)
-        self.start.valueChanged.connect(self._on_mode_changed)
         self.end.valueChanged.connect(self._ensure_start)
-        self.end.valueChanged.connect(self._on_mode_changed)
         self.mode.currentIndexChanged.connect(self._on_mode_changed)
-        self.custom_frames.textChanged.connect(self._on_mode_changed)
+        self.start.valueChanged.connect(self.optionsChanged)
+        self.end.valueChanged.connect(self.optionsChanged)
+        self.mode.currentIndexChanged.connect(self.optionsChanged)
+        self.custom_frames.textChanged.connect(self.optionsChanged)
 
     def validate(self):
         """
@@ -173,6 +176,15 @@ class TimeRangeWidget(plugin.PlayblastPlugin, object):
         if custom_frames is not None:
             self.custom_frames.setText(custom_frames)
 
+    def refresh_state(self):
+        """
+        Overrides base ArtellaPlayblastPlugin refresh_state function
+        Updates widgets whose state depends on plugin attributes
+        Label is only updated here when frames change, so custom frames are not parsed for each typed character
+        """
+
+        self._on_mode_changed()
+
     def _ensure_start(self, value):
         """
         Internal function that initializes the value of the start frame
@@ -23,7 +23,7 @@ import tpDcc as tp
 from tpDcc.libs.qt.widgets import layouts, label, checkbox, combobox, lineedit
 
 import artellapipe
-from artellapipe.tools.playblastmanager.core import plugin
+from artellapipe.tools.playblastmanager.core import plugin, trackerindex
 
 LOGGER = logging.getLogger()
 
@@ -96,6 +96,12 @@ class TrackerPlugin(plugin.PlayblastPlugin, object):
         self._sequences_combo.currentIndexChanged.connect(self._on_sequence_selected)
         self._shots_combo.currentIndexChanged.connect(self._on_shot_selected)
         self._tasks_combo.currentIndexChanged.connect(self._on_task_selected)
+        self._upload_playblast_cbx.stateChanged.connect(self.optionsChanged)
+        self._sequences_combo.currentIndexChanged.connect(self.optionsChanged)
+        self._shots_combo.currentIndexChanged.connect(self.optionsChanged)
+        self._tasks_combo.currentIndexChanged.connect(self.optionsChanged)
+        self._task_status_combo.currentIndexChanged.connect(self.optionsChanged)
+        self._task_comment_line.textChanged.connect(self.optionsChanged)
 
     def get_inputs(self, as_preset=False):
         """
@@ -154,6 +160,7 @@ class TrackerPlugin(plugin.PlayblastPlugin, object):
         self._task_comment_line.setText(str(stamp_template))
 
     def refresh(self):
+        trackerindex.get_tracker_index().invalidate()
         self._fill_sequences_combo()
         self._shots_combo.clear()
         self._tasks_combo.clear()
@@ -231,12 +238,11 @@ class TrackerPlugin(plugin.PlayblastPlugin, object):
         if not sequence_name:
             return
 
-        sequence_shots = artellapipe.ShotsMgr().get_shots_from_sequence(sequence_name)
+        sequence_shots = trackerindex.get_tracker_index().get_shot_names(sequence_name)
         if not sequence_shots:
             self._disable_combos()
         self._shots_combo.setEnabled(True)
-        for shot in sequence_shots:
-            self._shots_combo.addItem(shot.get_name())
+        self._shots_combo.addItems(sequence_shots)
 
     def _on_shot_selected(self, index):
         self._tasks_combo.clear()
@@ -246,7 +252,8 @@ class TrackerPlugin(plugin.PlayblastPlugin, object):
         if not shot_name:
             return
 
-        shot_tasks = artellapipe.TasksMgr().get_task_names_for_shot(shot_name)
+        sequence_name = self._sequences_combo.currentText()
+        shot_tasks = trackerindex.get_tracker_index().get_task_names(sequence_name, shot_name)
         if not shot_tasks:
             return
         self._tasks_combo.setEnabled(True)
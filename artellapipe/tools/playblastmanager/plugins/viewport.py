@@ -37,6 +37,8 @@ class ViewportOptionsWidget(plugin.PlayblastPlugin, object):
     """
 
     id = 'ViewportOptions'
+    scene_events = (
+        'modelEditorChanged', 'ActiveViewChanged', 'cameraChange', 'displayRGBColorChanged', 'DisplayPreferenceChanged')
     label = 'Viewport Options'
     collapsed = True
 
@@ -175,6 +177,14 @@ class ViewportOptionsWidget(plugin.PlayblastPlugin, object):
             state = attrs_dict.get(system_name, True)
             action.setChecked(state)
 
+    def refresh_state(self):
+        """
+        Overrides base ArtellaPlayblastPlugin refresh_state function
+        Updates widgets whose state depends on plugin attributes
+        """
+
+        self._on_toggle_override()
+
     def get_show_object_tyes(self):
         """
         Returns object types
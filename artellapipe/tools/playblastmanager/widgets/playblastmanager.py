@@ -13,8 +13,6 @@ __maintainer__ = "Tomas Poveda"
 __email__ = "tpovedatd@gmail.com"
 
 import os
-import shutil
-import inspect
 import logging
 from collections import OrderedDict
 
@@ -22,17 +20,13 @@ from Qt.QtCore import *
 from Qt.QtWidgets import *
 
 import tpDcc
-from tpDcc.libs.python import path as path_utils, python, folder
+from tpDcc.libs.python import path as path_utils
 from tpDcc.libs.qt.widgets import layouts, label, accordion, stack, dividers, buttons
 
-if python.is_python2():
-    import pkgutil as loader
-else:
-    import importlib as loader
-
 import artellapipe
 from artellapipe.widgets import dialog
-from artellapipe.tools.playblastmanager.core import plugin
+from artellapipe.tools.playblastmanager.core import plugin, engine, uploads, timings, outputscache, snapshot
+from artellapipe.tools.playblastmanager.core import changebus, discovery, profiler
 from artellapipe.tools.playblastmanager.widgets import presets, preview
 
 
@@ -64,57 +58,61 @@ class PlayblastManager(artellapipe.ToolWidget, object):
 
     optionsChanged = Signal(dict)
     playblastStart = Signal(dict)
+    playblastProgress = Signal(str, int, int)
+    playblastCancelled = Signal(dict)
     playblastFinished = Signal(dict)
+    playblastTimings = Signal(dict)
+    uploadsChanged = Signal()
 
-    def __init__(self, project, config, settings, parent):
+    def __init__(self, project, config, settings, parent, startup_profiler=None):
         self.playblast_widgets = list()
         self.config_dialog = None
         self._plugins = list()
-
-        super(PlayblastManager, self).__init__(project=project, config=config, settings=settings, parent=parent)
-
-        tokens = self.config.get('tokens', dict())
-        if tokens:
-            for token in tokens:
-                for token_name, token_info in token.items():
-                    if 'rule' in token_info:
-                        artellapipe.PlayblastsMgr().register_token(
-                            token_name, lambda attrs_dict: artellapipe.PlayblastsMgr().get_project_rule_token(
-                                token_info['rule']), label=token_info['label']
-                        )
-                    else:
-                        if 'fn' not in token_info:
-                            LOGGER.warning(
-                                'Impossible to register token "{}" because its function is not defined!'.format(
-                                    token_name))
-                            continue
-                        if not hasattr(artellapipe.PlayblastsMgr(), token_info['fn']):
-                            LOGGER.warning(
-                                'Impossible to register token "{}" because PlayblastMgr does not implements '
-                                'its function: "{}"'.format(token_name, token_info['fn']))
-                        artellapipe.PlayblastsMgr().register_token(
-                            token_name, lambda attrs_dict: getattr(
-                                artellapipe.PlayblastsMgr(), token_info['fn'])(), label=token_info['label']
-                        )
-
-        registered_plugins = self._get_registered_plugins() or list()
-        for plugin_class in registered_plugins:
-            plugin_inst = plugin_class(project=self._project, config=self._config)
-            plugin_label = plugin_inst.label
-            if not plugin_label:
-                plugin_label = plugin_inst.id
-            new_item = self._plugins_widget.add_item(plugin_label, plugin_inst, collapsed=plugin_inst.collapsed)
-            plugin_inst.labelChanged.connect(new_item.setTitle)
-            self.playblastFinished.connect(plugin_inst.on_playblast_finished)
-
-            self._plugins.append(plugin_inst)
-
-        if self._plugins:
-            self._stack.slide_in_index(1)
-            self.capture_btn.setVisible(True)
-
-        self.preset_widget.load_active_preset()
-        # self.apply_inputs(inputs=self._read_configuration())
+        self._capture_thread = None
+        self._outputs_cache = outputscache.OutputsCache()
+        self._scene_event_watcher = None
+        self._options_bus = None
+        self._building = True
+        self._startup_profiler = startup_profiler or profiler.StartupProfiler()
+        self._startup_report = None
+        self._upload_queue = None
+
+        with self._startup_profiler.activate(), self._startup_profiler.measure(
+                '__init__', parent='contents' if startup_profiler else None):
+            with self._startup_profiler.measure('ui', parent='__init__'):
+                super(PlayblastManager, self).__init__(
+                    project=project, config=config, settings=settings, parent=parent)
+
+            self._options_bus = changebus.OptionsChangeBus(parent=self)
+            self._options_bus.optionsChanged.connect(self._on_plugins_options_changed)
+            self.optionsChanged.connect(self.preview_widget.request_refresh)
+
+            with self._startup_profiler.measure('register_tokens', parent='__init__'):
+                self._register_tokens()
+            self._create_plugins()
+
+            self._scene_event_watcher = outputscache.SceneEventWatcher(
+                self._outputs_cache.get_scene_events(), self._outputs_cache.on_scene_event)
+            self.destroyed.connect(self._scene_event_watcher.remove)
+
+            if self._plugins:
+                self._stack.slide_in_index(1)
+                self.capture_btn.setVisible(True)
+
+            with self._startup_profiler.measure('load_active_preset', parent='__init__'):
+                self.preset_widget.load_active_preset()
+
+            # Uploads that failed in this or in previous sessions are shown, so the artist uploads them manually
+            self._upload_queue = uploads.get_upload_queue()
+            self._upload_queue.add_callback(self._on_upload_finished)
+            self.destroyed.connect(lambda: self._upload_queue.remove_callback(self._on_upload_finished))
+            self._refresh_failed_uploads()
+            # self.apply_inputs(inputs=self._read_configuration())
+            self._building = False
+
+        # If the profiler is given, it is finished by the toolset once the tool contents are created
+        if not startup_profiler:
+            self._startup_report = self._startup_profiler.finish(name='PlayblastManager')
 
     def ui(self):
         super(PlayblastManager, self).ui()
@@ -155,12 +153,38 @@ class PlayblastManager(artellapipe.ToolWidget, object):
             project=self._project, inputs_getter=self.get_inputs, config=self.config, parent=self)
         self._main_widget.add_item('Presets', self.preset_widget, collapsed=False)
 
-        self.preview_widget = preview.PlayblastPreview(options=self.get_outputs, validator=self.validate, parent=self)
+        self.preview_widget = preview.PlayblastPreview(
+            options=self.get_options, validator=self.validate, parent=self,
+            refresh_interval=self.config.get('preview_refresh_interval', 500),
+            time_budget=self.config.get('preview_time_budget', 0.25))
         self._main_widget.add_item('Preview', self.preview_widget, collapsed=False)
 
         self.capture_btn = buttons.BaseButton('C A P T U R E')
         self.capture_btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
         self.capture_btn.setVisible(False)
+        self.cancel_btn = buttons.BaseButton('Cancel')
+        self.cancel_btn.setToolTip('Cancels playblast once current stage finishes')
+        self.cancel_btn.setVisible(False)
+        self._capture_progress = QProgressBar()
+        self._capture_progress.setVisible(False)
+        self._failed_uploads_widget = QFrame()
+        self._failed_uploads_widget.setVisible(False)
+        failed_uploads_layout = layouts.HorizontalLayout()
+        failed_uploads_layout.setContentsMargins(2, 2, 2, 2)
+        failed_uploads_layout.setSpacing(2)
+        self._failed_uploads_widget.setLayout(failed_uploads_layout)
+        self._failed_uploads_lbl = label.BaseLabel()
+        self._failed_uploads_lbl.setStyleSheet('color: rgb(230, 120, 60);')
+        self.clear_failed_uploads_btn = buttons.BaseButton('Clear')
+        self.clear_failed_uploads_btn.setToolTip('Removes failed uploads once they are uploaded manually')
+        failed_uploads_layout.addWidget(self._failed_uploads_lbl)
+        failed_uploads_layout.addStretch()
+        failed_uploads_layout.addWidget(self.clear_failed_uploads_btn)
+        capture_layout = layouts.HorizontalLayout()
+        capture_layout.setContentsMargins(0, 0, 0, 0)
+        capture_layout.setSpacing(2)
+        capture_layout.addWidget(self.capture_btn)
+        capture_layout.addWidget(self.cancel_btn)
 
         accordions_layout.addWidget(self._main_widget)
         accordions_layout.addLayout(dividers.DividerLayout())
@@ -170,7 +194,9 @@ class PlayblastManager(artellapipe.ToolWidget, object):
         self._stack.addWidget(accordions_widget)
 
         self.main_layout.addWidget(self._stack)
-        self.main_layout.addWidget(self.capture_btn)
+        self.main_layout.addWidget(self._capture_progress)
+        self.main_layout.addWidget(self._failed_uploads_widget)
+        self.main_layout.addLayout(capture_layout)
 
         # # We force the reload of the camera plugin title
         # self.cameras._on_update_label()
@@ -178,7 +204,11 @@ class PlayblastManager(artellapipe.ToolWidget, object):
 
     def setup_signals(self):
         self.capture_btn.clicked.connect(self._on_capture)
+        self.cancel_btn.clicked.connect(self._on_cancel_capture)
+        self.playblastProgress.connect(self._on_capture_progress)
         self.preset_widget.presetLoaded.connect(self.apply_inputs)
+        self.clear_failed_uploads_btn.clicked.connect(self._on_clear_failed_uploads)
+        self.uploadsChanged.connect(self._refresh_failed_uploads)
 
     def get_plugins_paths(self):
         """
@@ -190,23 +220,30 @@ class PlayblastManager(artellapipe.ToolWidget, object):
             os.path.join(os.path.dirname(os.path.os.path.dirname(os.path.abspath(__file__))), 'plugins'))
         return [plugins_path]
 
-    def validate(self):
+    def validate(self, timing_records=None, show_errors=True):
         """
         Will ensure that widget outputs are valid and will raise proper errors if necessary
+        :param timing_records: list(dict), if given, time spent validating each widget is appended to this list
+        :param show_errors: bool, whether validation errors are shown in a dialog or only logged
         :return: list<str>
         """
 
+        timing_records = list() if timing_records is None else timing_records
         errors = list()
         for widget in self.playblast_widgets:
             if hasattr(widget, 'validate'):
-                widget_errors = widget.validate()
+                with timings.measure(timing_records, 'validate', plugin=widget.id, parent='validate'):
+                    widget_errors = widget.validate()
                 if widget_errors:
                     errors.extend(widget_errors)
 
         if errors:
             message_title = '{} Validation Error(s)'.format(len(errors))
             message = '\n'.join(errors)
-            QMessageBox.critical(self, message_title, message, QMessageBox.Ok)
+            if show_errors:
+                QMessageBox.critical(self, message_title, message, QMessageBox.Ok)
+            else:
+                LOGGER.debug('{}:\n{}'.format(message_title, message))
             return False
 
         return True
@@ -219,8 +256,7 @@ class PlayblastManager(artellapipe.ToolWidget, object):
         """
 
         inputs = dict()
-        config_widgets = self.playblast_widgets
-        config_widgets.append(self.preset_widget)
+        config_widgets = self.playblast_widgets + [self.preset_widget]
         for widget in config_widgets:
             widget_inputs = widget.get_inputs(as_preset=as_preset)
             if not isinstance(widget_inputs, dict):
@@ -249,45 +285,87 @@ class PlayblastManager(artellapipe.ToolWidget, object):
 
         return inputs
 
-    def get_outputs(self):
+    def get_outputs(self, timing_records=None):
         """
           Returns the outputs variables of the Playblast widget as dict
+          :param timing_records: list(dict), if given, time spent by each plugin get_outputs is appended to this list
           :return: dict
           """
 
-        outputs = dict()
+        return self.get_options(timing_records=timing_records).to_dict()
+
+    def get_options(self, timing_records=None):
+        """
+        Returns an immutable snapshot with the merged outputs of all playblast plugins
+        :param timing_records: list(dict), if given, time spent by each plugin get_outputs is appended to this list
+        :return: PlayblastOptions
+        """
+
+        timing_records = list() if timing_records is None else timing_records
+        plugins_outputs = list()
         for playblast_plugins in self._plugins:
             if hasattr(playblast_plugins, 'get_outputs'):
-                widget_outputs = playblast_plugins.get_outputs()
-                if not widget_outputs:
-                    continue
-                for key, value in widget_outputs.items():
-                    if isinstance(value, dict) and key in outputs:
-                        outputs[key].update(value)
-                    else:
-                        outputs[key] = value
+                with timings.measure(timing_records, 'get_outputs', plugin=playblast_plugins.id, parent='get_outputs'):
+                    plugins_outputs.append(self._outputs_cache.get_snapshot(playblast_plugins))
 
-        return outputs
+        return snapshot.PlayblastOptions.from_outputs(plugins_outputs)
 
     def apply_inputs(self, inputs):
         """
         Applies the given dict of attributes to the widget
+        Only plugins whose current inputs differ from the given ones are updated. Plugins are updated with their
+        signals blocked and a single optionsChanged signal is emitted once all plugins are updated
         :param inputs: dict
         """
 
         if not inputs:
             return
 
-        playblast_plugins = self._plugins
-        playblast_plugins.append(self.preset_widget)
-        for widget in playblast_plugins:
-            widget_inputs = inputs.get(widget.id, None)
-            if not widget_inputs:
-                widget_inputs = dict()
-            # if not widget_inputs:
-            #     continue
-            # if widget_inputs:
-            widget.apply_inputs(widget_inputs)
+        changed_plugins = list()
+        for playblast_plugin in self._plugins:
+            plugin_inputs = inputs.get(playblast_plugin.id, None) or dict()
+            if not playblast_plugin.loaded:
+                # Plugins that are not built yet store the inputs and apply them when they are built
+                playblast_plugin.update_inputs(plugin_inputs)
+                continue
+            current_inputs = playblast_plugin.get_inputs(as_preset=True)
+            if snapshot.PlayblastOptions(plugin_inputs) == snapshot.PlayblastOptions(current_inputs):
+                continue
+            playblast_plugin.update_inputs(plugin_inputs)
+            changed_plugins.append(playblast_plugin)
+
+        self.preset_widget.apply_inputs(inputs.get(self.preset_widget.id, None) or dict())
+
+        if not changed_plugins:
+            return
+
+        for playblast_plugin in changed_plugins:
+            self._outputs_cache.invalidate(playblast_plugin.id)
+
+        # Preview is not visible while the tool is being built, so we avoid retrieving outputs (which would build all
+        # collapsed plugins) when the active preset is applied
+        if not self._building:
+            self.optionsChanged.emit(self.get_outputs())
+
+    def get_startup_report(self):
+        """
+        Returns the report with the time spent, and memory allocated if startup profiling is enabled, by each stage
+        of the tool startup
+        :return: dict
+        """
+
+        if self._startup_report is None:
+            self._startup_report = self._startup_profiler.create_report(name='PlayblastManager')
+
+        return self._startup_report
+
+    def invalidate_outputs(self, plugin_id=None):
+        """
+        Discards cached plugin outputs, so they are retrieved again the next time outputs are requested
+        :param plugin_id: str, plugin whose outputs are discarded. If not given, outputs of all plugins are discarded
+        """
+
+        self._outputs_cache.invalidate(plugin_id)
 
     def show_config(self):
         """
@@ -300,9 +378,67 @@ class PlayblastManager(artellapipe.ToolWidget, object):
         self.config_dialog.move(QPoint(geometry.x() + 30, geometry.y()))
         self.config_dialog.exec_()
 
-    def _get_plugins(self):
+    def _register_tokens(self):
+        """
+        Internal function that registers the playblast tokens defined in Playblast Manager configuration file
+        """
+
+        tokens = self.config.get('tokens', dict())
+        if tokens:
+            for token in tokens:
+                for token_name, token_info in token.items():
+                    if 'rule' in token_info:
+                        artellapipe.PlayblastsMgr().register_token(
+                            token_name, lambda attrs_dict: artellapipe.PlayblastsMgr().get_project_rule_token(
+                                token_info['rule']), label=token_info['label']
+                        )
+                    else:
+                        if 'fn' not in token_info:
+                            LOGGER.warning(
+                                'Impossible to register token "{}" because its function is not defined!'.format(
+                                    token_name))
+                            continue
+                        if not hasattr(artellapipe.PlayblastsMgr(), token_info['fn']):
+                            LOGGER.warning(
+                                'Impossible to register token "{}" because PlayblastMgr does not implements '
+                                'its function: "{}"'.format(token_name, token_info['fn']))
+                        artellapipe.PlayblastsMgr().register_token(
+                            token_name, lambda attrs_dict: getattr(
+                                artellapipe.PlayblastsMgr(), token_info['fn'])(), label=token_info['label']
+                        )
+
+    def _create_plugins(self):
+        """
+        Internal function that creates the plugins registered in Playblast Manager configuration file
+        """
+
+        # Collapsed plugins are not built until they are expanded or their outputs are requested
+        lazy_plugins = self.config.get('lazy_plugins', True)
+        with self._startup_profiler.measure('discover_plugins', parent='__init__'):
+            registered_plugins = self._get_registered_plugins() or list()
+        for plugin_class in registered_plugins:
+            with self._startup_profiler.measure('__init__', plugin=plugin_class.id, parent='__init__'):
+                if lazy_plugins and plugin_class.collapsed:
+                    plugin_inst = plugin.LazyPlayblastPlugin(
+                        plugin_class, project=self._project, config=self._config)
+                else:
+                    plugin_inst = plugin_class(project=self._project, config=self._config)
+            plugin_label = plugin_inst.label
+            if not plugin_label:
+                plugin_label = plugin_inst.id
+            new_item = self._plugins_widget.add_item(plugin_label, plugin_inst, collapsed=plugin_inst.collapsed)
+            plugin_inst.labelChanged.connect(new_item.setTitle)
+            self.playblastFinished.connect(plugin_inst.on_playblast_finished)
+            self._outputs_cache.register_plugin(plugin_inst)
+            self._options_bus.register_plugin(plugin_inst)
+
+            self._plugins.append(plugin_inst)
+
+    def _get_plugins(self, plugin_ids=None):
         """
         Returns a list with all available plugins
+        Discovered plugins are stored in a manifest, so plugin folders are only scanned when their files change
+        :param plugin_ids: list(str), if given, only plugins with these ids are imported
         :return: list
         """
 
@@ -311,24 +447,7 @@ class PlayblastManager(artellapipe.ToolWidget, object):
             LOGGER.warning('No Plugins path to search plugins from!')
             return
 
-        plugins_found = dict()
-
-        for plugin_path in plugins_paths:
-            if not plugin_path or not os.path.isdir(plugin_path):
-                LOGGER.warning('Plugin Path "{}" does not exist!'.format(plugin_path))
-                continue
-
-            for sub_module in loader.walk_packages([plugin_path]):
-                importer, sub_module_name, _ = sub_module
-                mod = importer.find_module(sub_module_name).load_module(sub_module_name)
-                for cname, obj in inspect.getmembers(mod, inspect.isclass):
-                    if issubclass(obj, plugin.PlayblastPlugin):
-                        if cname in plugins_found:
-                            LOGGER.warning(
-                                'Playblast Plugin with name "{}" is already registered! Overriding ...'.format(cname))
-                        plugins_found[cname] = obj
-
-        return plugins_found
+        return discovery.get_plugins(plugins_paths, plugin.PlayblastPlugin, plugin_ids=plugin_ids)
 
     def _get_registered_plugins(self):
         """
@@ -336,16 +455,16 @@ class PlayblastManager(artellapipe.ToolWidget, object):
         :return: list
         """
 
-        all_plugins = self._get_plugins()
-        if not all_plugins:
-            LOGGER.warning('No plugins available!')
-            return None
-
         plugins_to_register = self.config.get('plugins', list())
         if not plugins_to_register:
             LOGGER.warning('No plugins to register defined in Playblast Manager configuration file!')
             return None
 
+        all_plugins = self._get_plugins(plugin_ids=plugins_to_register)
+        if not all_plugins:
+            LOGGER.warning('No plugins available!')
+            return None
+
         registered_plugins = OrderedDict()
 
         for plugin_to_register in plugins_to_register:
@@ -396,6 +515,18 @@ class PlayblastManager(artellapipe.ToolWidget, object):
                 self.settings.set(widget_id, attr_name, attr_value)
         self.settings.update()
 
+    def _on_plugins_options_changed(self, plugin_ids):
+        """
+        Internal callback function that is called once per burst of plugin options changes
+        :param plugin_ids: list(str), ids of the plugins whose options changed
+        """
+
+        for playblast_plugin in self._plugins:
+            if playblast_plugin.id in plugin_ids:
+                playblast_plugin.refresh_state()
+
+        self.optionsChanged.emit(self.get_outputs())
+
     def _on_update_settings(self):
         """
         Internal callback function that is called when options are updated
@@ -407,94 +538,187 @@ class PlayblastManager(artellapipe.ToolWidget, object):
     def _on_refresh(self):
         self.preset_widget.load_active_preset()
 
+    def _set_capturing(self, flag):
+        """
+        Internal function that updates capture widgets depending on whether a capture is running or not
+        :param flag: bool
+        """
+
+        self.capture_btn.setEnabled(not flag)
+        self.cancel_btn.setVisible(flag)
+        self.cancel_btn.setEnabled(flag)
+        self._capture_progress.setVisible(flag)
+        self._capture_progress.setValue(0)
+
+    def _refresh_failed_uploads(self):
+        """
+        Internal function that shows the uploads that failed and must be uploaded manually
+        """
+
+        failed_entries = self._upload_queue.get_failed() if self._upload_queue else list()
+        self._failed_uploads_widget.setVisible(bool(failed_entries))
+        if not failed_entries:
+            return
+
+        self._failed_uploads_lbl.setText('{} playblast upload(s) failed. Please upload them manually!'.format(
+            len(failed_entries)))
+        self._failed_uploads_lbl.setToolTip('\n'.join(
+            '{}: {}'.format(entry['file'], entry.get('last_error', None)) for entry in failed_entries))
+
+    def _on_upload_finished(self, entry, uploaded):
+        """
+        Internal callback function that is called, from the upload queue thread, each time an upload attempt finishes
+        :param entry: dict
+        :param uploaded: bool
+        """
+
+        if not uploaded and entry.get('state', None) == uploads.UploadState.FAILED:
+            # Signal is queued, so failed uploads are refreshed in the main thread
+            self.uploadsChanged.emit()
+
+    def _on_clear_failed_uploads(self):
+        """
+        Internal callback function that is called when clear failed uploads button is clicked
+        """
+
+        if self._upload_queue:
+            self._upload_queue.clear_failed()
+        self._refresh_failed_uploads()
+
+    def enterEvent(self, event):
+        """
+        Overrides base ToolWidget enterEvent function
+        Scene state can be modified in other DCC windows without triggering any scene event (for example, render
+        settings), so cached outputs are discarded each time the artist comes back to the tool
+        :param event: QEvent
+        """
+
+        self._outputs_cache.invalidate()
+        super(PlayblastManager, self).enterEvent(event)
+
+    def _publish_timings(self, job):
+        """
+        Internal function that publishes the time spent in each stage of the given capture job.
+        Timings are also logged into the JSON lines file defined in the tool configuration (timings_log) or in
+        ARTELLAPIPE_PLAYBLAST_TIMINGS_LOG environment variable
+        :param job: engine.PlayblastJob
+        """
+
+        report = timings.create_report(job.timings, name=job.filename or job.options.get('filename'), status=job.status)
+        LOGGER.debug('Playblast timings ({:.3f}s): {}'.format(report['total'], dict(report['summary'])))
+        log_file = timings.get_log_file(self.config.get('timings_log', None))
+        if log_file:
+            timings.write_report(report, log_file)
+        self.playblastTimings.emit(report)
+
     def _on_capture(self):
-        valid = self.validate()
+        if self._capture_thread and self._capture_thread.isRunning():
+            LOGGER.warning('A playblast is already being generated!')
+            return
+
+        timing_records = list()
+        with timings.measure(timing_records, 'validate'):
+            valid = self.validate(timing_records=timing_records)
         if not valid:
             return
 
-        options = self.get_outputs()
-        filename = options.get('filename', None)
-        if not filename:
+        with timings.measure(timing_records, 'get_outputs'):
+            options = self.get_options(timing_records=timing_records)
+        out_playblasts_dir = None
+        if not options.get('filename', None):
             project_path = self._project.get_path()
             if not project_path:
                 LOGGER.warning('Impossible to capture playblast because project is not defined!')
                 return
-
             out_playblasts_dir = path_utils.join_path(project_path, 'out_playblasts')
-            if not os.path.isdir(out_playblasts_dir):
-                os.makedirs(out_playblasts_dir)
-            total_playblasts = folder.get_files(out_playblasts_dir) or list()
-            filename = path_utils.join_path(out_playblasts_dir, 'playblast_{}'.format(len(total_playblasts)))
-        if filename:
-            dir_name = os.path.dirname(filename)
-            base_filename = os.path.basename(filename).replace('.', '_')
-            filename = path_utils.clean_path(os.path.join(dir_name, base_filename))
-
-        self.playblastStart.emit(options)
-
-        temp_dir = artellapipe.MediaMgr().create_temp_path('playblast')
-        temp_filename = path_utils.clean_path(os.path.join(temp_dir, base_filename))
-        options['filename'] = temp_filename
-        options['filename'] = artellapipe.PlayblastsMgr().capture_scene(**options)
-        playblast_path = options['filename']
-        if playblast_path and os.path.isfile(playblast_path):
-            out_ext = os.path.splitext(playblast_path)[-1]
-            filename = '{}{}'.format(os.path.splitext(filename)[0], out_ext)
-            do_stamp = options.get('enable_stamp', False)
-            if do_stamp:
-                filename = artellapipe.PlayblastsMgr().stamp_playblast(playblast_path, filename, extra_dict=options)
-            else:
-                out_dir = os.path.dirname(playblast_path)
-                all_files = folder.get_files(out_dir, full_path=True) or list()
-                options['filename'] = list()
-                for out_file in all_files:
-                    file_dir, file_name, file_ext = path_utils.split_path(out_file)
-                    target_file = path_utils.join_path(os.path.dirname(filename), '{}{}'.format(file_name, file_ext))
-                    shutil.move(out_file, target_file)
-                    options['filename'].append(target_file)
-
-                # For now we set to None, to avoid to upload to production tracker non video files
-                filename = None
-        try:
-            shutil.rmtree(temp_dir)
-        except Exception:
-            pass
-
-        options['filename'] = filename
-
-        tracker_enable = options.get('tracker_enable', False)
-        file_to_upload = filename
-        if tracker_enable:
-            if file_to_upload and os.path.isfile(file_to_upload):
-                file_uploaded = False
-                sequence_name = options.get('sequence_name', None)
-                shot_name = options.get('shot_name', None)
-                task_name = options.get('task_name', None)
-                comment = options.get('task_comment', '')
-                status = options.get('task_status', '')
-                if sequence_name and shot_name and task_name:
-                    shot_found = artellapipe.ShotsMgr().find_shot(shot_name)
-                    if not shot_found:
-                        LOGGER.warning('No shot found with name: "{}"!'.format(shot_name))
-                    else:
-                        shots_tasks = artellapipe.Tracker().get_tasks_in_shot(shot_found.get_id())
-                        if shots_tasks:
-                            for shot_task in shots_tasks:
-                                if shot_task.name == task_name:
-                                    file_uploaded = artellapipe.Tracker().upload_shot_task_preview(
-                                        shot_task.id, comment=comment, preview_file_path=file_to_upload, status=status)
-                                    break
-                if not file_uploaded:
-                    LOGGER.warning('It was not possible to upload "{}" to "{}". Please upload it manually!'.format(
-                        file_to_upload, artellapipe.Tracker().get_name()
-                    ))
-                    return False
-            else:
-                LOGGER.warning('Preview file to upload does not exists: "{}"'.format(file_to_upload))
 
-            return True
+        job = engine.PlayblastJob(options, output_dir=out_playblasts_dir)
+        self.playblastStart.emit(job.options)
+
+        # Capture must be done in main thread, the rest of stages are executed in a worker thread and tracker
+        # uploads are queued, so the artist does not wait for them
+        capture_engine = engine.PlayblastEngine(upload_queue=self._upload_queue or uploads.get_upload_queue())
+        job.timings.extend(timing_records)
+        capture_engine.run(job, stages=capture_engine.CAPTURE_STAGES)
+        if not job.succeeded:
+            capture_engine.cleanup(job)
+            self._publish_timings(job)
+            return False
+
+        self._capture_thread = PlayblastThread(capture_engine, job, stages=capture_engine.POST_CAPTURE_STAGES)
+        self._capture_thread.stageStarted.connect(self.playblastProgress.emit)
+        self._capture_thread.finished.connect(self._on_capture_finished)
+        self._set_capturing(True)
+        self._capture_thread.start()
+
+    def _on_cancel_capture(self):
+        """
+        Internal callback function that is called when cancel button is clicked
+        """
+
+        if not self._capture_thread:
+            return
+
+        self.cancel_btn.setEnabled(False)
+        self._capture_thread.job.cancel()
+
+    def _on_capture_progress(self, stage_name, stage_index, total_stages):
+        """
+        Internal callback function that is called each time a capture stage starts
+        :param stage_name: str
+        :param stage_index: int
+        :param total_stages: int
+        """
+
+        self._capture_progress.setMaximum(total_stages)
+        self._capture_progress.setValue(stage_index)
+        self._capture_progress.setFormat('{} (%v/%m)'.format(stage_name.title()))
+
+    def _on_capture_finished(self):
+        """
+        Internal callback function that is called when capture thread finishes
+        """
+
+        job = self._capture_thread.job
+        self._capture_thread.deleteLater()
+        self._capture_thread = None
+        self._set_capturing(False)
+        self._publish_timings(job)
+
+        if job.status == engine.JobStatus.CANCELLED:
+            LOGGER.info('Playblast cancelled: {}'.format(job.options.get('filename', None)))
+            self.playblastCancelled.emit(job.options)
+            return
+        if not job.succeeded:
+            return
+
+        self.playblastFinished.emit(job.options)
+
+
+class PlayblastThread(QThread, object):
+    """
+    Thread that executes playblast stages that do not need to be executed in the main thread (stamp, file moves,
+    upload, ...)
+    """
+
+    stageStarted = Signal(str, int, int)
+
+    def __init__(self, capture_engine, job, stages=None, parent=None):
+        super(PlayblastThread, self).__init__(parent)
+
+        self._engine = capture_engine
+        self._job = job
+        self._stages = stages
+
+    @property
+    def job(self):
+        return self._job
+
+    def run(self):
+        self._engine.run(self._job, stages=self._stages, stage_callback=self._on_stage_started)
 
-        self.playblastFinished.emit(options)
+    def _on_stage_started(self, job, stage_name, stage_index, total_stages):
+        self.stageStarted.emit(stage_name, stage_index, total_stages)
 
 
 class PlayblastTemplateConfigurationDialog(dialog.ArtellaDialog, object):
@@ -13,7 +13,6 @@ __maintainer__ = "Tomas Poveda"
 __email__ = "tpovedatd@gmail.com"
 
 import os
-import glob
 import json
 import logging.config
 
@@ -21,14 +20,21 @@ from Qt.QtCore import *
 from Qt.QtWidgets import *
 
 import tpDcc
-from tpDcc.libs.python import jsonio, fileio, folder as folder_utils
+from tpDcc.libs.python import folder as folder_utils
 from tpDcc.libs.qt.core import base
 from tpDcc.libs.qt.widgets import layouts, buttons, combobox
 
 import artellapipe
+from artellapipe.tools.playblastmanager.core import presetindex
 
 LOGGER = logging.getLogger()
 
+# Label of the item listed when no presets are available
+NO_PRESETS_LABEL = '*'
+
+# Label of the active preset item when its file is removed
+MISSING_PRESET_LABEL = '{} (missing)'
+
 
 class PlayblastPreset(base.BaseWidget, object):
 
@@ -44,6 +50,7 @@ class PlayblastPreset(base.BaseWidget, object):
         self._project = project
         self._config = config
         self._inputs_getter = inputs_getter
+        self._sync_thread = None
 
         super(PlayblastPreset, self).__init__(parent=parent)
         presets_folders = artellapipe.PlayblastsMgr().get_presets_paths()
@@ -176,28 +183,14 @@ class PlayblastPreset(base.BaseWidget, object):
     def discover_presets(cls, paths=None):
         """
         Get the full list of files found in the registered preset folders
+        Presets are retrieved from the presets index, so only new or modified preset files are read
         :param paths: list<str>, directories which stores preset files
         :return: list<str>, valid JSON preset file paths
         """
 
-        presets = list()
-        for path in paths or cls.get_preset_paths():
-            path = os.path.normpath(path)
-            if not os.path.isdir(path):
-                continue
-
-            glob_query = os.path.abspath(os.path.join(path, '*.json'))
-            file_names = glob.glob(glob_query)
-            for file_name in file_names:
-                if file_name.startswith('_'):
-                    continue
-                if not fileio.file_has_info(file_name):
-                    LOGGER.warning('File size is smaller than 1 byte for preset file: "{}"'.format(file_name))
-                    continue
-                if file_name not in presets:
-                    presets.append(file_name)
+        presets = presetindex.get_index().get_presets(paths or cls.get_preset_paths())
 
-        return presets
+        return [preset['path'] for preset in presets]
 
     def get_presets(self):
         """
@@ -227,10 +220,8 @@ class PlayblastPreset(base.BaseWidget, object):
             LOGGER.info('Preset is already in the presets list: "{}"'.format(filename))
             item_index = paths.index(filename)
         else:
-            try:
-                jsonio.read_file(filename)
-            except Exception as exc:
-                LOGGER.warning('Error while reading Plabylast preset: {} | {} | {}'.format(label, filename, exc))
+            if not presetindex.get_index().validate(filename):
+                LOGGER.warning('Invalid Playblast preset: {} | {}'.format(label, filename))
                 return
 
             self._presets.addItem(label, userData=filename)
@@ -288,7 +279,11 @@ class PlayblastPreset(base.BaseWidget, object):
         if not filename:
             return {}
 
-        preset = jsonio.read_file(filename)
+        try:
+            preset = presetindex.get_index().read_preset(filename)
+        except Exception as exc:
+            LOGGER.warning('Error while reading Playblast preset: {} | {}'.format(filename, exc))
+            return {}
 
         self.presetLoaded.emit(preset)
 
@@ -311,13 +306,44 @@ class PlayblastPreset(base.BaseWidget, object):
         Adds all preset files from preset paths
         """
 
-        for preset_file in self.discover_presets():
+        for preset_file in sorted(self.discover_presets(), key=self._get_preset_sort_key):
             self.add_preset(preset_file)
 
         if self._presets.count() <= 0:
-            self.presets.addItem('*')
+            self.presets.addItem(NO_PRESETS_LABEL)
         self._presets.setCurrentIndex(0)
 
+    def _insert_preset(self, label, preset_file):
+        """
+        Internal function that inserts given preset in the presets list, keeping presets sorted
+        :param label: str
+        :param preset_file: str
+        :return: int, index of the inserted preset
+        """
+
+        sort_key = self._get_preset_sort_key(preset_file)
+        index = 0
+        while index < self._presets.count():
+            item_file = self._presets.itemData(index)
+            if item_file and self._get_preset_sort_key(item_file) > sort_key:
+                break
+            index += 1
+        self._presets.insertItem(index, label, userData=preset_file)
+
+        return index
+
+    @staticmethod
+    def _get_preset_sort_key(preset_file):
+        """
+        Internal function that returns the key used to sort presets: presets folder and then preset file name
+        :param preset_file: str
+        :return: tuple(str, str)
+        """
+
+        preset_file = os.path.abspath(os.path.normpath(preset_file))
+
+        return os.path.dirname(preset_file), os.path.basename(preset_file)
+
     def _default_browse_path(self):
         """
         Returns the current browse path for save/load preset
@@ -346,13 +372,95 @@ class PlayblastPreset(base.BaseWidget, object):
     def _on_sync_presets(self):
         """
         Internal function that syncronizes presets from Artella
+        Presets are synced in the background and presets list is updated as each presets folder is synced
         """
 
+        if self._sync_thread and self._sync_thread.isRunning():
+            return
+
         presets_paths = self.get_preset_paths(get_all=True)
-        if presets_paths:
-            artellapipe.FilesMgr().sync_paths(presets_paths, recursive=True)
-            self._presets.blockSignals(True)
-            self._presets.clear()
-            self._presets.blockSignals(True)
-            self._process_presets()
-            self.load_active_preset()
+        if not presets_paths:
+            return
+
+        self._preset_sync.setEnabled(False)
+        self._sync_thread = PresetsSyncThread(presets_paths, parent=self)
+        self._sync_thread.presetsChanged.connect(self._on_presets_changed)
+        self._sync_thread.finished.connect(self._on_sync_finished)
+        self._sync_thread.start()
+
+    def _on_presets_changed(self, changes):
+        """
+        Internal callback function that is called when synced presets changed. Presets list is updated without
+        changing the selected preset and without loading it again. If the selected preset is removed, it is kept
+        in the list as a missing preset, so the list never silently switches to another preset
+        :param changes: dict, with 'added' and 'updated' lists of index entries and a 'removed' list of preset files
+        """
+
+        current_index = self._presets.currentIndex()
+        current_path = self._presets.itemData(current_index)
+        current_label = self._presets.itemText(current_index)
+        self._presets.blockSignals(True)
+        try:
+            if self._presets.count() == 1 and self._presets.itemText(0) == NO_PRESETS_LABEL and changes['added']:
+                self._presets.removeItem(0)
+            for preset_file in changes['removed']:
+                preset_file = os.path.normpath(preset_file)
+                index = self._presets.findData(preset_file)
+                if index == -1:
+                    continue
+                if preset_file == current_path:
+                    current_label = MISSING_PRESET_LABEL.format(self._presets.itemText(index))
+                    current_path = None
+                    self._presets.setItemText(index, current_label)
+                    self._presets.setItemData(index, None)
+                else:
+                    self._presets.removeItem(index)
+            for entry in changes['added'] + changes['updated']:
+                preset_file = os.path.normpath(entry['path'])
+                index = self._presets.findData(preset_file)
+                if index == -1:
+                    self._insert_preset(entry['label'], preset_file)
+                else:
+                    self._presets.setItemText(index, entry['label'])
+            if self._presets.count() <= 0:
+                self._presets.addItem(NO_PRESETS_LABEL)
+            if current_path:
+                current_index = self._presets.findData(current_path)
+            else:
+                current_index = self._presets.findText(current_label)
+            self._presets.setCurrentIndex(max(current_index, 0))
+        finally:
+            self._presets.blockSignals(False)
+
+    def _on_sync_finished(self):
+        """
+        Internal callback function that is called when presets sync finishes
+        """
+
+        self._sync_thread.deleteLater()
+        self._sync_thread = None
+        self._preset_sync.setEnabled(True)
+
+
+class PresetsSyncThread(QThread, object):
+    """
+    Thread that syncs presets folders from Artella. Each folder is indexed again once it is synced, so only the
+    presets that changed are notified
+    """
+
+    presetsChanged = Signal(dict)
+
+    def __init__(self, presets_paths, parent=None):
+        super(PresetsSyncThread, self).__init__(parent)
+
+        self._presets_paths = presets_paths
+
+    def run(self):
+        for presets_path in self._presets_paths:
+            try:
+                artellapipe.FilesMgr().sync_paths([presets_path], recursive=True)
+            except Exception as exc:
+                LOGGER.warning('Error while syncing Playblast presets folder "{}": {}'.format(presets_path, exc))
+            changes = presetindex.get_index().update_presets([presets_path])
+            if any(changes.values()):
+                self.presetsChanged.emit(changes)
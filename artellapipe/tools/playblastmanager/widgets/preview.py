@@ -13,8 +13,8 @@ __maintainer__ = "Tomas Poveda"
 __email__ = "tpovedatd@gmail.com"
 
 import os
+import time
 import logging
-import tempfile
 
 from Qt.QtCore import *
 from Qt.QtWidgets import *
@@ -27,6 +27,7 @@ from tpDcc.libs.qt.core import base
 from tpDcc.libs.qt.widgets import label
 
 import artellapipe
+from artellapipe.tools.playblastmanager.core import snapshot, previewcache, outputscache, viewportgrab
 
 if tp.is_maya():
     from tpDcc.dccs.maya.core import decorators as maya_decorators
@@ -40,18 +41,59 @@ LOGGER = logging.getLogger()
 class PlayblastPreview(base.BaseWidget, object):
     """
     Playblast image preview
+    In filmstrip mode, evenly spaced frames of the playblast time range are captured in the background, so the whole
+    shot can be scrubbed without generating a playblast.
+    In auto preview mode, preview is refreshed when playblast options change, at most once per refresh interval
     """
 
     __DEFAULT_WIDTH__ = 320
     __DEFAULT_HEIGHT__ = 180
+    __FILMSTRIP_FRAMES__ = 8
+    __THUMBNAIL_WIDTH__ = 36
+    __THUMBNAIL_HEIGHT__ = 20
+    __CACHE_MAX_BYTES__ = 64 * 1024 * 1024
 
-    def __init__(self, options, validator, parent=None):
+    # Scene events that modify the scene without modifying playblast options. Time changes (timeChanged) and executed
+    # commands (RecentCommandChanged) are not watched: they are triggered by selection and playback, which do not
+    # modify the scene, and previews are already cached by frame
+    SCENE_EVENTS = (
+        'SceneOpened', 'NewSceneOpened', 'SceneImported', 'Undo', 'Redo', 'DagObjectCreated', 'NameChanged',
+        'DragRelease', 'displayLayerVisibilityChanged')
+
+    def __init__(self, options, validator, parent=None, refresh_interval=500, time_budget=0.25):
+        """
+        :param options: fn, function that returns playblast options
+        :param validator: fn, function that validates playblast options
+        :param parent: QWidget
+        :param refresh_interval: int, minimum milliseconds between automatic refreshes
+        :param time_budget: float, maximum seconds an automatic refresh should take. If a refresh takes longer, next
+            automatic refreshes are rendered at a lower resolution
+        """
 
         self.options = options
         self.validator = validator
+        self._refresh_interval = refresh_interval
+        self._render_budget = previewcache.RenderBudget(time_budget=time_budget)
+        self._rendering = False
+        self._refresh_pending = False
+        self._last_auto_refresh = 0.0
+        self._cache = previewcache.PreviewCache(
+            max_size=None, max_bytes=self.__CACHE_MAX_BYTES__,
+            get_size=lambda pixmap: pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8)
+        self._filmstrip_frames = list()
+        self._filmstrip_options = None
+        self._filmstrip_scene = None
+        self._pending_frames = list()
 
         super(PlayblastPreview, self).__init__(parent=parent)
 
+        self._scene_event_watcher = outputscache.SceneEventWatcher(self.SCENE_EVENTS, self._on_scene_event)
+        self.destroyed.connect(self._scene_event_watcher.remove)
+
+    @property
+    def cache(self):
+        return self._cache
+
     def get_main_layout(self):
         main_layout = QVBoxLayout()
         main_layout.setContentsMargins(0, 0, 0, 0)
@@ -81,49 +123,374 @@ class PlayblastPreview(base.BaseWidget, object):
             "background-color: rgba(255, 255, 255, 0); border: 0px solid rgba(255,255,255,0);")
         self.sync_preview_btn.move(5, 5)
 
-        self.sync_preview_btn.clicked.connect(self.refresh)
+        self.auto_refresh_cbx = QCheckBox('Auto Preview')
+        self.auto_refresh_cbx.setToolTip('Refreshes preview when playblast options change')
+        self.filmstrip_cbx = QCheckBox('Filmstrip')
+        self.filmstrip_cbx.setToolTip('Captures frames of the whole time range, so they can be scrubbed')
+        modes_layout = QHBoxLayout()
+        modes_layout.setContentsMargins(0, 0, 0, 0)
+        modes_layout.addWidget(self.auto_refresh_cbx)
+        modes_layout.addWidget(self.filmstrip_cbx)
+        self.main_layout.addLayout(modes_layout)
+
+        self.filmstrip_widget = QWidget()
+        filmstrip_layout = QVBoxLayout()
+        filmstrip_layout.setContentsMargins(0, 2, 0, 0)
+        filmstrip_layout.setSpacing(2)
+        self.filmstrip_widget.setLayout(filmstrip_layout)
+        self.thumbnails_layout = QHBoxLayout()
+        self.thumbnails_layout.setContentsMargins(0, 0, 0, 0)
+        self.thumbnails_layout.setSpacing(2)
+        self.thumbnails = list()
+        for i in range(self.__FILMSTRIP_FRAMES__):
+            thumbnail = label.ClickLabel()
+            thumbnail.setFixedSize(self.__THUMBNAIL_WIDTH__, self.__THUMBNAIL_HEIGHT__)
+            thumbnail.setStyleSheet('background-color: rgba(0, 0, 0, 60);')
+            self.thumbnails_layout.addWidget(thumbnail)
+            self.thumbnails.append(thumbnail)
+        self.scrub_slider = QSlider(Qt.Horizontal)
+        self.scrub_slider.setRange(0, 0)
+        self.frame_lbl = QLabel()
+        self.frame_lbl.setAlignment(Qt.AlignCenter)
+        filmstrip_layout.addLayout(self.thumbnails_layout)
+        filmstrip_layout.addWidget(self.scrub_slider)
+        filmstrip_layout.addWidget(self.frame_lbl)
+        self.filmstrip_widget.setVisible(False)
+        self.main_layout.addWidget(self.filmstrip_widget)
+
+        # Filmstrip frames are captured one by one from the event loop, so the UI keeps responding while capturing
+        self._capture_timer = QTimer(self)
+        self._capture_timer.setInterval(0)
+
+        self._auto_refresh_timer = QTimer(self)
+        self._auto_refresh_timer.setSingleShot(True)
+
+        # Preview is refreshed once the event loop is idle, so showing the tool is not delayed by building the lazy
+        # plugins whose outputs are needed to capture the preview
+        self._show_refresh_timer = QTimer(self)
+        self._show_refresh_timer.setSingleShot(True)
+        self._show_refresh_timer.setInterval(0)
+
+    def setup_signals(self):
+        self.sync_preview_btn.clicked.connect(lambda: self.refresh(force=True))
+        self.filmstrip_cbx.toggled.connect(self._on_toggle_filmstrip)
+        self.scrub_slider.valueChanged.connect(self._on_scrub)
+        self._capture_timer.timeout.connect(self._on_capture_next_frame)
+        self._auto_refresh_timer.timeout.connect(self._on_auto_refresh)
+        self._show_refresh_timer.timeout.connect(self._on_show_refresh)
+        self.auto_refresh_cbx.toggled.connect(self._on_toggle_auto_refresh)
+        for i, thumbnail in enumerate(self.thumbnails):
+            thumbnail.clicked.connect(lambda index=i: self.scrub_slider.setValue(index))
 
     def showEvent(self, event):
-        self.refresh()
+        self._show_refresh_timer.start()
         event.accept()
 
-    def refresh(self):
+    def is_filmstrip_enabled(self):
+        """
+        Returns whether filmstrip mode is enabled
+        :return: bool
+        """
+
+        return self.filmstrip_cbx.isChecked()
+
+    def is_auto_refresh_enabled(self):
+        """
+        Returns whether auto preview mode is enabled
+        :return: bool
+        """
+
+        return self.auto_refresh_cbx.isChecked()
+
+    def request_refresh(self, *args):
+        """
+        Requests an automatic refresh of the preview. Requests are throttled, so preview is refreshed at most once per
+        refresh interval, and requests received while a preview is being rendered are merged into a single refresh
+        """
+
+        if not self.is_auto_refresh_enabled() or not self.isVisible():
+            return
+
+        if self._rendering:
+            self._refresh_pending = True
+            return
+
+        if self._auto_refresh_timer.isActive():
+            return
+
+        elapsed = (time.time() - self._last_auto_refresh) * 1000
+        self._auto_refresh_timer.start(int(max(self._refresh_interval - elapsed, 0)))
+
+    def refresh(self, force=False, auto=False):
         """
         Refresh playblast preview
+        Previews are cached by options and frame, so a state that was already captured is shown without capturing it
+        :param force: bool, whether preview should be captured even if it is cached
+        :param auto: bool, whether refresh was requested automatically. Automatic refreshes do not show validation
+            dialogs and are rendered within the time budget
         """
 
+        if self.is_filmstrip_enabled():
+            self.refresh_filmstrip(force=force, auto=auto)
+            return
+
+        if self._rendering:
+            self._refresh_pending = True
+            return
+
         frame = tp.Dcc.get_current_frame()
 
         # When play blasting outside of an undo queue next undo will trigger a reset to frame 0
         # To solve this and ensure undo works properly, we update undo queue with current time
         tp.Dcc.set_current_frame(frame)
 
-        valid = self.validator()
+        valid = self.validator(show_errors=not auto)
         if not valid:
             return
 
-        with no_undo_decorator():
-            options = self.options()
-            tempdir = tempfile.mkdtemp()
-
-            # Override settings that are constants for the preview
-            options = options.copy()
-            options['filename'] = None
-            options['complete_filename'] = os.path.join(tempdir, 'temp.jpg')
-            options['width'] = self.__DEFAULT_WIDTH__
-            options['height'] = self.__DEFAULT_HEIGHT__
-            options['viewer'] = False
-            options['frame'] = frame
-            options['off_screen'] = True
-            options['format'] = 'image'
-            options['compression'] = 'jpg'
-            options['sound'] = None
-
-            frame_name = artellapipe.PlayblastsMgr().capture_scene(**options)
-            if not frame_name:
-                LOGGER.warning('Preview failed!')
-                return
-
-            image = QPixmap(frame_name)
-            self.preview.setPixmap(image)
-            os.remove(frame_name)
+        options = snapshot.PlayblastOptions(self.options())
+        scene = tp.Dcc.scene_name()
+        if auto:
+            size = self._render_budget.get_size(self.__DEFAULT_WIDTH__, self.__DEFAULT_HEIGHT__)
+        else:
+            size = (self.__DEFAULT_WIDTH__, self.__DEFAULT_HEIGHT__)
+
+        image = None if force else self._cache.get(self._get_cache_key(options, frame, scene, size=size))
+        if image is None:
+            start = time.time()
+            image = self._capture_frame(options, frame, scene, size=size, grab=True)
+            if auto:
+                self._render_budget.update(time.time() - start)
+        if image is not None:
+            self._show_image(image)
+
+    def refresh_filmstrip(self, force=False, auto=False):
+        """
+        Refreshes filmstrip frames. Frames that are not cached are captured in the background
+        :param force: bool, whether frames should be captured even if they are cached
+        :param auto: bool, whether refresh was requested automatically, so validation dialogs are not shown
+        """
+
+        self._capture_timer.stop()
+
+        valid = self.validator(show_errors=not auto)
+        if not valid:
+            return
+
+        self._filmstrip_options = snapshot.PlayblastOptions(self.options())
+        self._filmstrip_scene = tp.Dcc.scene_name()
+        self._filmstrip_frames = previewcache.get_filmstrip_frames(
+            self._filmstrip_options, self.__FILMSTRIP_FRAMES__)
+        self._pending_frames = list()
+
+        for i, thumbnail in enumerate(self.thumbnails):
+            thumbnail.setVisible(i < len(self._filmstrip_frames))
+            thumbnail.clear()
+        for i, frame in enumerate(self._filmstrip_frames):
+            # Forced refreshes capture filmstrip frames again, replacing their cached previews. Previews of other
+            # frames and options are still valid, so they are kept
+            image = None if force else self._cache.get(
+                self._get_cache_key(self._filmstrip_options, frame, self._filmstrip_scene))
+            if image is None:
+                self._pending_frames.append(frame)
+            else:
+                self._set_thumbnail(i, image)
+
+        self.scrub_slider.setRange(0, max(len(self._filmstrip_frames) - 1, 0))
+        self._on_scrub(self.scrub_slider.value())
+        if self._pending_frames:
+            self._capture_timer.start()
+
+    def _get_cache_key(self, options, frame, scene, size=None):
+        """
+        Internal function that returns the cache key of the preview of the given frame
+        :param options: PlayblastOptions
+        :param frame: int or float
+        :param scene: str
+        :param size: tuple(int, int), resolution preview is rendered with. Default preview resolution if not given
+        :return: tuple
+        """
+
+        width, height = size or (self.__DEFAULT_WIDTH__, self.__DEFAULT_HEIGHT__)
+
+        return self._cache.get_key(options.replace(width=width, height=height), frame, scene)
+
+    def _capture_frame(self, options, frame, scene, size=None, grab=False):
+        """
+        Internal function that captures the preview of the given frame and stores it in the cache
+        :param options: PlayblastOptions
+        :param frame: int or float
+        :param scene: str
+        :param size: tuple(int, int), resolution preview is rendered with. Default preview resolution if not given
+        :param grab: bool, whether preview can be grabbed from the live viewport. Only valid for the current frame
+        :return: QPixmap or None
+        """
+
+        width, height = size or (self.__DEFAULT_WIDTH__, self.__DEFAULT_HEIGHT__)
+        cache_key = self._get_cache_key(options, frame, scene, size=(width, height))
+
+        # If the viewport already looks like the playblast, its framebuffer is grabbed, which is much faster than
+        # capturing the scene and loading the captured frame from disk
+        grabbed_image = viewportgrab.grab_view(options, width, height) if grab else None
+        if grabbed_image is not None and not grabbed_image.isNull():
+            image = QPixmap.fromImage(grabbed_image)
+            self._cache.add(cache_key, image)
+            return image
+
+        self._rendering = True
+        try:
+            with no_undo_decorator():
+                # Override settings that are constants for the preview. Frames are always captured into the same
+                # scratch folder and removed once they are loaded into memory
+                options = options.to_dict()
+                options['filename'] = None
+                options['complete_filename'] = os.path.join(previewcache.get_scratch_folder(), 'preview.jpg')
+                options['width'] = width
+                options['height'] = height
+                options['viewer'] = False
+                options['frame'] = frame
+                options['off_screen'] = True
+                options['format'] = 'image'
+                options['compression'] = 'jpg'
+                options['sound'] = None
+
+                frame_name = artellapipe.PlayblastsMgr().capture_scene(**options)
+                if not frame_name:
+                    LOGGER.warning('Preview failed!')
+                    return None
+
+                # QPixmap caches images by file name, so frame is loaded through QImage
+                image = QPixmap.fromImage(QImage(frame_name))
+                try:
+                    os.remove(frame_name)
+                except OSError as exc:
+                    LOGGER.warning('Impossible to remove preview frame "{}": {}'.format(frame_name, exc))
+        finally:
+            self._rendering = False
+            if self._refresh_pending:
+                # Changes received while rendering are merged into a single refresh once the event loop is free
+                self._refresh_pending = False
+                QTimer.singleShot(0, self.request_refresh)
+
+        if image.isNull():
+            LOGGER.warning('Preview failed!')
+            return None
+
+        self._cache.add(cache_key, image)
+
+        return image
+
+    def _show_image(self, image):
+        """
+        Internal function that shows given image in the preview. Images rendered at a lower resolution are scaled up
+        to the preview resolution
+        :param image: QPixmap
+        """
+
+        if image.width() < self.__DEFAULT_WIDTH__:
+            image = image.scaled(self.__DEFAULT_WIDTH__, self.__DEFAULT_HEIGHT__, Qt.KeepAspectRatio)
+        self.preview.setPixmap(image)
+
+    def _set_thumbnail(self, index, image):
+        """
+        Internal function that shows given image in the filmstrip thumbnail with the given index
+        :param index: int
+        :param image: QPixmap
+        """
+
+        self.thumbnails[index].setPixmap(image.scaled(
+            self.__THUMBNAIL_WIDTH__, self.__THUMBNAIL_HEIGHT__, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+
+    def _on_toggle_filmstrip(self, flag):
+        """
+        Internal callback function that is called when filmstrip mode is enabled or disabled
+        :param flag: bool
+        """
+
+        self._capture_timer.stop()
+        self.filmstrip_widget.setVisible(flag)
+        self.refresh()
+
+    def _on_capture_next_frame(self):
+        """
+        Internal callback function that captures the next pending filmstrip frame
+        """
+
+        if not self._pending_frames:
+            self._capture_timer.stop()
+            return
+
+        frame = self._pending_frames.pop(0)
+        image = self._capture_frame(self._filmstrip_options, frame, self._filmstrip_scene)
+        if image is not None:
+            index = self._filmstrip_frames.index(frame)
+            self._set_thumbnail(index, image)
+            if index == self.scrub_slider.value():
+                self._on_scrub(index)
+        if not self._pending_frames:
+            self._capture_timer.stop()
+
+    def _on_scrub(self, index):
+        """
+        Internal callback function that shows the filmstrip frame with the given index
+        :param index: int
+        """
+
+        if not self._filmstrip_frames or index >= len(self._filmstrip_frames):
+            self.frame_lbl.setText('')
+            return
+
+        frame = self._filmstrip_frames[index]
+        self.frame_lbl.setText('Frame {}'.format(frame))
+        image = self._cache.get(self._get_cache_key(self._filmstrip_options, frame, self._filmstrip_scene))
+        if image is not None:
+            self._show_image(image)
+
+    def _on_scene_event(self, event_name):
+        """
+        Internal callback function that is called when the scene is modified. Cached previews of the modified scene
+        are removed, because they may not look like the scene anymore. All previews are removed when a scene is opened
+        :param event_name: str
+        """
+
+        # Events triggered by the preview itself, while capturing frames, do not modify the scene
+        if self._rendering:
+            return
+
+        if event_name in outputscache.GLOBAL_SCENE_EVENTS:
+            self._cache.clear()
+        else:
+            self._cache.remove_scene(tp.Dcc.scene_name())
+        self.request_refresh()
+
+    def _on_toggle_auto_refresh(self, flag):
+        """
+        Internal callback function that is called when auto preview mode is enabled or disabled
+        :param flag: bool
+        """
+
+        self._auto_refresh_timer.stop()
+        self._render_budget.reset()
+        if flag:
+            self.request_refresh()
+
+    def _on_show_refresh(self):
+        """
+        Internal callback function that refreshes preview once the widget is shown and the event loop is idle
+        """
+
+        if not self.isVisible():
+            return
+
+        self.refresh()
+
+    def _on_auto_refresh(self):
+        """
+        Internal callback function that refreshes preview once refresh interval is elapsed
+        """
+
+        if not self.is_auto_refresh_enabled() or not self.isVisible():
+            return
+
+        self._last_auto_refresh = time.time()
+        self.refresh(auto=True)
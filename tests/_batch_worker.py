@@ -0,0 +1,22 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Standalone worker used by batch tests. Fails the first attempt of shots whose name starts with "flaky"
+"""
+
+import os
+import sys
+import json
+
+if __name__ == '__main__':
+    job_file, result_file = sys.argv[1], sys.argv[3]
+    with open(job_file, 'r') as fh:
+        job_data = json.load(fh)
+    shot_name = job_data['options']['shot_name']
+    marker = '{}.attempted'.format(job_file)
+    if shot_name.startswith('flaky') and not os.path.isfile(marker):
+        open(marker, 'w').close()
+        sys.exit(1)
+    with open(result_file, 'w') as fh:
+        json.dump({'status': 'finished', 'filename': job_data['options']['filename'], 'errors': []}, fh)
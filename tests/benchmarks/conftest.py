@@ -0,0 +1,198 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains fixtures for artellapipe-tools-playblastmanager benchmarks.
+
+Each benchmark is compared against the median time stored in baselines.json. A benchmark fails when it is slower than
+its baseline multiplied by ARTELLAPIPE_BENCHMARK_TOLERANCE (3 by default). Set ARTELLAPIPE_UPDATE_BENCHMARKS=1 to
+store current timings as the new baselines.
+"""
+
+import os
+import sys
+import json
+import time
+import types
+import importlib
+
+import pytest
+
+from tests.benchmarks import fakedcc
+
+BASELINES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines.json')
+TOLERANCE = float(os.environ.get('ARTELLAPIPE_BENCHMARK_TOLERANCE', 3.0))
+UPDATE_BASELINES = os.environ.get('ARTELLAPIPE_UPDATE_BENCHMARKS', '') == '1'
+
+# Absolute slack, in seconds, so very fast benchmarks do not fail because of timer noise
+MIN_SLACK = 0.005
+
+
+class Benchmark(object):
+    def __init__(self, baselines, results):
+        self._baselines = baselines
+        self._results = results
+
+    def __call__(self, name, fn, rounds=5, setup=None):
+        """
+        Executes given function several times and checks its median time against the stored baseline
+        :param name: str, benchmark name
+        :param fn: fn, function to measure
+        :param rounds: int
+        :param setup: fn, function executed, without being measured, before each round
+        :return: float, median time in seconds
+        """
+
+        durations = list()
+        for _ in range(rounds):
+            if setup:
+                setup()
+            start = time.time()
+            fn()
+            durations.append(time.time() - start)
+        median = sorted(durations)[len(durations) // 2]
+        self._results[name] = median
+
+        if UPDATE_BASELINES:
+            return median
+
+        # Benchmarks without baseline could never fail, so their baseline must be recorded before they are committed
+        baseline = self._baselines.get(name, None)
+        assert baseline is not None, \
+            'No baseline stored for benchmark "{}" ({:.4f}s). Run benchmarks with ARTELLAPIPE_UPDATE_BENCHMARKS=1 ' \
+            'to store it'.format(name, median)
+        assert median <= baseline * TOLERANCE + MIN_SLACK, \
+            'Benchmark "{}" regressed: {:.4f}s (baseline {:.4f}s)'.format(name, median, baseline)
+
+        return median
+
+
+@pytest.fixture(scope='session')
+def benchmark_results():
+    results = dict()
+    yield results
+
+    if UPDATE_BASELINES and results:
+        baselines = _read_baselines()
+        baselines.update(dict((name, round(value, 6)) for name, value in results.items()))
+        with open(BASELINES_FILE, 'w') as fh:
+            json.dump(baselines, fh, sort_keys=True, indent=4, separators=(',', ': '))
+            fh.write('\n')
+
+
+@pytest.fixture
+def benchmark(benchmark_results):
+    return Benchmark(_read_baselines(), benchmark_results)
+
+
+@pytest.fixture(autouse=True)
+def plugins_manifest(monkeypatch, tmpdir):
+    from artellapipe.tools.playblastmanager.core import discovery
+
+    manifest_file = str(tmpdir.join('playblast_plugins_manifest.json'))
+    monkeypatch.setattr(discovery, 'get_default_manifest_file', lambda: manifest_file)
+
+    return manifest_file
+
+
+@pytest.fixture(autouse=True)
+def presets_index(monkeypatch, tmpdir):
+    from artellapipe.tools.playblastmanager.core import presetindex
+
+    index_file = str(tmpdir.join('playblast_presets_index.json'))
+    monkeypatch.setattr(presetindex, 'get_default_index_file', lambda: index_file)
+
+    return index_file
+
+
+@pytest.fixture(scope='module', autouse=True)
+def tpdcc():
+    """
+    Returns tpDcc module. If tpDcc is not installed, stand-in modules are used while benchmarks are executed, so
+    benchmarks that do not need Qt also run in plain environments without a DCC
+    """
+
+    try:
+        import tpDcc
+        yield tpDcc
+        return
+    except ImportError:
+        pass
+
+    loaded_modules = set(sys.modules.keys())
+    tpdcc_modules = fakedcc.create_tpdcc_modules()
+    sys.modules.update(tpdcc_modules)
+    try:
+        yield tpdcc_modules['tpDcc']
+    finally:
+        # Modules imported while the stand-in was installed are unloaded, so other tests do not use the stand-in
+        _unload_modules(loaded_modules)
+
+
+@pytest.fixture
+def fake_dcc(monkeypatch, tpdcc):
+    tp = tpdcc
+    dcc = fakedcc.FakeDcc()
+    monkeypatch.setattr(tp, 'Dcc', dcc)
+    monkeypatch.setattr(tp, 'is_maya', lambda: False)
+
+    return dcc
+
+
+@pytest.fixture(scope='session')
+def qt_app():
+    pytest.importorskip('Qt')
+    # Widgets are built without a display, so benchmarks also run in headless machines
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    from Qt.QtWidgets import QApplication
+
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture(scope='module')
+def tool_framework(tpdcc, qt_app):
+    """
+    Installs stand-ins of the tpDcc Qt widgets and of the artellapipe framework classes that cannot be imported, so
+    the tool widgets can be built headless in environments without a DCC
+    """
+
+    loaded_modules = set(sys.modules.keys())
+    patcher = pytest.MonkeyPatch()
+    for module_name, attributes in fakedcc.create_framework_attributes().items():
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError:
+            module = types.ModuleType(module_name)
+            sys.modules[module_name] = module
+            parent_name, _, child_name = module_name.rpartition('.')
+            if parent_name:
+                patcher.setattr(sys.modules[parent_name], child_name, module, raising=False)
+        for attribute_name, value in attributes.items():
+            if not hasattr(module, attribute_name):
+                patcher.setattr(module, attribute_name, value, raising=False)
+    try:
+        yield
+    finally:
+        patcher.undo()
+        _unload_modules(loaded_modules)
+
+
+def _unload_modules(loaded_modules):
+    """
+    Unloads modules that are not included in the given module names
+    :param loaded_modules: set(str)
+    """
+
+    for module_name in sorted(set(sys.modules.keys()) - loaded_modules, reverse=True):
+        sys.modules.pop(module_name, None)
+        parent_name, _, child_name = module_name.rpartition('.')
+        parent = sys.modules.get(parent_name, None)
+        if parent is not None and getattr(parent, child_name, None) is not None:
+            delattr(parent, child_name)
+
+
+def _read_baselines():
+    if not os.path.isfile(BASELINES_FILE):
+        return dict()
+    with open(BASELINES_FILE, 'r') as fh:
+        return json.load(fh)
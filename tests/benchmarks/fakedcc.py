@@ -0,0 +1,397 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains a stand-in DCC backend used to benchmark artellapipe-tools-playblastmanager without Maya
+"""
+
+import os
+import sys
+import types
+import struct
+import zlib
+import contextlib
+from collections import OrderedDict
+
+
+# Synthetic images are cached, so benchmarks measure the tool and not the compression of the stand-in frames
+_PNG_CACHE = dict()
+
+
+def _png_data(width, height, value):
+    """
+    Returns the data of a PNG image filled with the given gray value. Images are cached by size and value
+    """
+
+    key = (width, height, value % 256)
+    if key not in _PNG_CACHE:
+        _PNG_CACHE[key] = _create_png_data(width, height, value % 256)
+
+    return _PNG_CACHE[key]
+
+
+def _create_png_data(width, height, value):
+    """
+    Creates the data of a PNG image filled with the given gray value
+    """
+
+    def _chunk(chunk_type, data):
+        chunk = chunk_type + data
+        return struct.pack('>I', len(data)) + chunk + struct.pack('>I', zlib.crc32(chunk) & 0xffffffff)
+
+    row = b'\x00' + bytes(bytearray([value] * width * 3))
+    header = struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)
+
+    return b''.join([
+        b'\x89PNG\r\n\x1a\n', _chunk(b'IHDR', header), _chunk(b'IDAT', zlib.compress(row * height)),
+        _chunk(b'IEND', b'')])
+
+
+def create_tpdcc_modules():
+    """
+    Returns stand-in modules of the tpDcc functions used by the tool core, so benchmarks that do not need Qt can be
+    executed in environments where tpDcc is not installed. tp.Dcc is replaced by FakeDcc in the fake_dcc fixture
+    :return: dict(str, module), modules by name
+    """
+
+    def _clean_path(file_path):
+        return os.path.normpath(file_path).replace('\\', '/')
+
+    def _split_path(file_path):
+        dir_name, file_name = os.path.split(file_path)
+        base_name, ext = os.path.splitext(file_name)
+        return dir_name, base_name, ext
+
+    def _get_files(root_folder, full_path=False, **kwargs):
+        if not os.path.isdir(root_folder):
+            return list()
+        files = [file_name for file_name in sorted(os.listdir(root_folder))
+                 if os.path.isfile(os.path.join(root_folder, file_name))]
+        return [os.path.join(root_folder, file_name) for file_name in files] if full_path else files
+
+    tpdcc = types.ModuleType('tpDcc')
+    tpdcc.is_maya = lambda: False
+    tpdcc.Dcc = FakeDcc()
+    libs = types.ModuleType('tpDcc.libs')
+    python_libs = types.ModuleType('tpDcc.libs.python')
+    path = types.ModuleType('tpDcc.libs.python.path')
+    path.clean_path = _clean_path
+    path.join_path = lambda *args: _clean_path(os.path.join(*args))
+    path.split_path = _split_path
+    folder = types.ModuleType('tpDcc.libs.python.folder')
+    folder.get_files = _get_files
+    osplatform = types.ModuleType('tpDcc.libs.python.osplatform')
+    osplatform.open_file = lambda file_path: None
+    python = types.ModuleType('tpDcc.libs.python.python')
+    python.is_python2 = lambda: sys.version_info[0] == 2
+    python.force_list = lambda value: list(value) if isinstance(value, (list, tuple)) else [value]
+
+    tpdcc.libs = libs
+    libs.python = python_libs
+    python_libs.path = path
+    python_libs.folder = folder
+    python_libs.osplatform = osplatform
+    python_libs.python = python
+
+    return dict(
+        (module.__name__, module) for module in (tpdcc, libs, python_libs, path, folder, osplatform, python))
+
+
+def create_framework_attributes():
+    """
+    Returns stand-in attributes of the tpDcc Qt widgets and of the artellapipe framework classes used by the tool
+    widgets, so the tool can be built headless in environments where they are not installed. Attributes are only
+    installed in modules, or attributes, that cannot be imported
+    :return: OrderedDict(str, dict), stand-in attributes by module name. Parent modules are listed before their children
+    """
+
+    from Qt.QtCore import Qt, Signal
+    from Qt.QtGui import QIcon, QPixmap
+    from Qt.QtWidgets import (
+        QWidget, QFrame, QLabel, QCheckBox, QLineEdit, QPushButton, QToolButton, QComboBox, QSpinBox, QDoubleSpinBox,
+        QGroupBox, QStackedWidget, QMenu, QDialog, QVBoxLayout, QHBoxLayout, QGridLayout)
+
+    class _ResourcesMgr(object):
+        def icon(self, name, **kwargs):
+            return QIcon()
+
+        def pixmap(self, name, **kwargs):
+            return QPixmap()
+
+    class _ClassProperty(property):
+        def __get__(self, instance, owner):
+            return self.fget(owner)
+
+    class BaseWidget(QWidget):
+        def __init__(self, parent=None, **kwargs):
+            super(BaseWidget, self).__init__(parent=parent)
+            self.main_layout = self.get_main_layout()
+            self.setLayout(self.main_layout)
+            self.ui()
+            self.setup_signals()
+
+        def get_main_layout(self):
+            main_layout = QVBoxLayout()
+            main_layout.setContentsMargins(2, 2, 2, 2)
+            main_layout.setSpacing(2)
+            return main_layout
+
+        def ui(self):
+            pass
+
+        def setup_signals(self):
+            pass
+
+    class BaseMenu(QMenu):
+        def __init__(self, exclusive=True, parent=None):
+            super(BaseMenu, self).__init__(parent)
+            self._exclusive = exclusive
+
+    class ClickLabel(QLabel):
+        clicked = Signal()
+
+        def mousePressEvent(self, event):
+            self.clicked.emit()
+            super(ClickLabel, self).mousePressEvent(event)
+
+    class BaseToolButton(QToolButton):
+        def image(self, name):
+            self.setIcon(QIcon())
+            return self
+
+        def icon_only(self):
+            self.setToolButtonStyle(Qt.ToolButtonIconOnly)
+            return self
+
+    class DividerLayout(QHBoxLayout):
+        def __init__(self):
+            super(DividerLayout, self).__init__()
+            self.addWidget(_get_horizontal_separator_widget())
+
+    class AccordionStyle(object):
+        MAYA = 'maya'
+
+    class AccordionWidget(QWidget):
+        def __init__(self, parent=None):
+            super(AccordionWidget, self).__init__(parent)
+            self.rollout_style = AccordionStyle.MAYA
+            self.setLayout(QVBoxLayout())
+
+        def add_item(self, title, widget, collapsed=False):
+            item = QGroupBox(title)
+            item_layout = QVBoxLayout()
+            item.setLayout(item_layout)
+            item_layout.addWidget(widget)
+            # Collapsed items are not shown, so widgets that are built when shown are not built
+            widget.setVisible(not collapsed)
+            self.layout().addWidget(item)
+            return item
+
+    class SlidingStackedWidget(QStackedWidget):
+        def slide_in_index(self, index):
+            self.setCurrentIndex(index)
+
+    class ArtellaDialog(QDialog):
+        def __init__(self, parent=None, **kwargs):
+            super(ArtellaDialog, self).__init__(parent)
+
+    class ToolWidget(BaseWidget):
+        def __init__(self, project, config, settings, parent=None):
+            self._project = project
+            self._config = config
+            self._settings = settings
+            super(ToolWidget, self).__init__(parent=parent)
+
+        @property
+        def project(self):
+            return self._project
+
+        @property
+        def config(self):
+            return self._config
+
+        @property
+        def settings(self):
+            return self._settings
+
+    def _get_horizontal_separator_widget():
+        separator = QFrame()
+        separator.setFrameShape(QFrame.HLine)
+        separator.setFrameShadow(QFrame.Sunken)
+        return separator
+
+    @contextlib.contextmanager
+    def _empty_decorator_context():
+        yield
+
+    return OrderedDict([
+        ('tpDcc', {'ResourcesMgr': _ResourcesMgr}),
+        ('tpDcc.libs.python.python', {'classproperty': _ClassProperty}),
+        ('tpDcc.libs.python.decorators', {'empty_decorator_context': _empty_decorator_context}),
+        ('tpDcc.libs.python.fileio', {'open_browser': lambda file_path: None}),
+        ('tpDcc.libs.python.folder', {'open_folder': lambda folder_path: None}),
+        ('tpDcc.libs.qt', dict()),
+        ('tpDcc.libs.qt.core', dict()),
+        ('tpDcc.libs.qt.core.base', {'BaseWidget': BaseWidget}),
+        ('tpDcc.libs.qt.core.menu', {'BaseMenu': BaseMenu}),
+        ('tpDcc.libs.qt.widgets', dict()),
+        ('tpDcc.libs.qt.widgets.layouts', {
+            'VerticalLayout': QVBoxLayout, 'HorizontalLayout': QHBoxLayout, 'GridLayout': QGridLayout}),
+        ('tpDcc.libs.qt.widgets.label', {'BaseLabel': QLabel, 'ClickLabel': ClickLabel}),
+        ('tpDcc.libs.qt.widgets.checkbox', {'BaseCheckBox': QCheckBox}),
+        ('tpDcc.libs.qt.widgets.lineedit', {'BaseLineEdit': QLineEdit}),
+        ('tpDcc.libs.qt.widgets.dividers', {
+            'DividerLayout': DividerLayout, 'get_horizontal_separator_widget': _get_horizontal_separator_widget}),
+        ('tpDcc.libs.qt.widgets.buttons', {
+            'BaseButton': QPushButton, 'BaseToolButton': BaseToolButton, 'QPushButton': QPushButton}),
+        ('tpDcc.libs.qt.widgets.combobox', {'BaseComboBox': QComboBox}),
+        ('tpDcc.libs.qt.widgets.spinbox', {'BaseSpinBox': QSpinBox, 'BaseDoubleSpinBox': QDoubleSpinBox}),
+        ('tpDcc.libs.qt.widgets.accordion', {'AccordionWidget': AccordionWidget, 'AccordionStyle': AccordionStyle}),
+        ('tpDcc.libs.qt.widgets.stack', {'SlidingStackedWidget': SlidingStackedWidget}),
+        ('tpDcc.libs.qt.widgets.color', {'ColorPicker': QPushButton}),
+        ('artellapipe', {'ToolWidget': ToolWidget}),
+        ('artellapipe.widgets', dict()),
+        ('artellapipe.widgets.dialog', {'ArtellaDialog': ArtellaDialog}),
+    ])
+
+
+class FakeDcc(object):
+    """
+    Implements the tp.Dcc functions used by the tool. Scene state is stored in memory and captures write
+    synthetic frames
+    """
+
+    def __init__(self, start_frame=1, end_frame=24, cameras=None):
+        self.start_frame = start_frame
+        self.end_frame = end_frame
+        self.current_frame = start_frame
+        self.cameras = cameras or ['persp', 'shot_cam']
+        self.scene = '/projects/test/seq_01/shot_010/shot_010_anim.ma'
+        self.captures = list()
+
+    def scene_name(self):
+        return self.scene
+
+    def open_file(self, file_path, force=False):
+        self.scene = file_path
+
+    def get_time_slider_range(self):
+        return self.start_frame, self.end_frame
+
+    def get_current_frame(self):
+        return self.current_frame
+
+    def set_current_frame(self, frame):
+        self.current_frame = frame
+
+    def list_nodes(self, node_name=None, node_type=None, full_path=True):
+        if node_type == 'camera':
+            return ['|{0}|{0}Shape'.format(camera) for camera in self.cameras]
+        return list()
+
+    def shape_transform(self, shapes):
+        return [shape.rsplit('|', 1)[0] for shape in shapes]
+
+    def node_short_name(self, node):
+        return node.split('|')[-1]
+
+    def node_long_name(self, node):
+        return node if node.startswith('|') else '|{}'.format(node)
+
+    def object_exists(self, node):
+        return node.split('|')[-1].replace('Shape', '') in self.cameras
+
+    def look_through_camera(self, camera):
+        pass
+
+    def get_attribute_value(self, node, attribute_name):
+        return 0.0
+
+    def get_playblast_formats(self):
+        return ['avi', 'image', 'qt']
+
+    def get_playblast_compressions(self, playblast_format=None):
+        if playblast_format == 'image':
+            return ['jpg', 'png', 'tif']
+        return ['H.264', 'none']
+
+    def get_renderers(self):
+        return {'Viewport 2.0': 'vp2Renderer', 'Legacy Default Viewport': 'base_OpenGL_Renderer'}
+
+    def get_default_render_resolution_width(self):
+        return 1920
+
+    def get_default_render_resolution_height(self):
+        return 1080
+
+    def get_viewport_resolution_width(self):
+        return 1280
+
+    def get_viewport_resolution_height(self):
+        return 720
+
+    def select_folder_dialog(self, title='', start_directory=None):
+        return start_directory
+
+    def capture_scene(self, filename, start_frame=None, end_frame=None, frame=None, width=64, height=36,
+                      compression='png', **kwargs):
+        """
+        Writes a synthetic image per captured frame
+        """
+
+        frames = frame or list(range(start_frame or self.start_frame, (end_frame or self.end_frame) + 1))
+        target_dir = os.path.dirname(filename)
+        if target_dir and not os.path.isdir(target_dir):
+            os.makedirs(target_dir)
+        for frame_number in frames:
+            frame_file = '{}.{}.png'.format(filename, str(frame_number).zfill(4))
+            with open(frame_file, 'wb') as fh:
+                fh.write(_png_data(width, height, frame_number))
+        self.captures.append(dict(kwargs, filename=filename, frame=frames))
+
+        return '{}.####.png'.format(filename)
+
+
+class FakePlayblastsMgr(object):
+    """
+    Stand-in of the project playblasts manager that captures using given DCC
+    """
+
+    def __init__(self, dcc, presets_paths=None):
+        self._dcc = dcc
+        self._presets_paths = presets_paths or list()
+        self._tokens = dict()
+        self.config = dict()
+
+    def get_presets_paths(self):
+        return self._presets_paths
+
+    def register_token(self, name, fn, label=None):
+        self._tokens[name] = fn
+
+    def get_project_rule_token(self, rule):
+        return rule
+
+    def parse_current_scene(self):
+        return {'start_frame': self._dcc.start_frame, 'end_frame': self._dcc.end_frame, 'sound': None}
+
+    def capture_scene(self, **options):
+        options.setdefault('start_frame', self._dcc.start_frame)
+        options.setdefault('end_frame', self._dcc.end_frame)
+        return self._dcc.capture_scene(**options)
+
+
+class FakeMediaMgr(object):
+    """
+    Stand-in of the project media manager that creates temporary folders inside a root folder
+    """
+
+    def __init__(self, root):
+        self._root = root
+        self._index = 0
+
+    def create_temp_path(self, name):
+        self._index += 1
+        temp_path = os.path.join(self._root, 'temp_{}_{}'.format(name, self._index))
+        os.makedirs(temp_path)
+        return temp_path
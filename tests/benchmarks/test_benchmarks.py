@@ -0,0 +1,227 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains benchmarks for artellapipe-tools-playblastmanager
+"""
+
+import json
+import shutil
+
+import pytest
+
+from tests.benchmarks import fakedcc
+
+# Plugins that only depend on tp.Dcc functions implemented by the stand-in DCC
+DCC_PLUGINS = (
+    'TimeRange', 'Camera', 'Resolution', 'Codec', 'Renderer', 'PanZoom', 'Options', 'Stamp')
+
+
+class _FakeProject(object):
+    name = 'Test'
+
+    def __init__(self, root):
+        self._root = root
+
+    def get_path(self):
+        return self._root
+
+
+class _FakeConfig(dict):
+    def get(self, key, default=None):
+        return super(_FakeConfig, self).get(key, default)
+
+
+def _get_manager_class():
+    from artellapipe.tools.playblastmanager.widgets import playblastmanager
+
+    return playblastmanager.PlayblastManager
+
+
+def _discover_plugins():
+    manager_class = _get_manager_class()
+
+    # Plugin discovery does not need the widget to be initialized
+    return manager_class._get_plugins(manager_class.__new__(manager_class))
+
+
+def _create_plugins(project):
+    all_plugins = dict((plugin_class.id, plugin_class) for plugin_class in _discover_plugins().values())
+
+    return [all_plugins[plugin_id](project=project, config=_FakeConfig()) for plugin_id in DCC_PLUGINS]
+
+
+def _create_manager(project):
+    return _get_manager_class()(
+        project=project, config=_FakeConfig(plugins=list(DCC_PLUGINS)), settings=None, parent=None)
+
+
+def _write_presets(presets_dir, preset, count=1):
+    for i in range(count):
+        presets_dir.join('preset_{}.json'.format(str(i).zfill(2))).write(json.dumps(preset))
+
+
+@pytest.fixture
+def presets_dir(tmpdir):
+    return tmpdir.mkdir('presets')
+
+
+@pytest.fixture
+def playblasts_mgr(monkeypatch, tool_framework, fake_dcc, presets_dir):
+    import artellapipe
+
+    playblasts_mgr = fakedcc.FakePlayblastsMgr(fake_dcc, presets_paths=[str(presets_dir)])
+    monkeypatch.setattr(artellapipe, 'PlayblastsMgr', lambda: playblasts_mgr, raising=False)
+
+    return playblasts_mgr
+
+
+@pytest.fixture
+def upload_queue(monkeypatch, tool_framework, tmpdir):
+    from artellapipe.tools.playblastmanager.core import uploads
+
+    # Queue worker is not started, so benchmarks do not upload anything nor modify the journal of the user
+    queue = uploads.UploadQueue(journal_file=str(tmpdir.join('playblast_uploads.json')))
+    monkeypatch.setattr(uploads, 'get_upload_queue', lambda: queue)
+
+    return queue
+
+
+def _get_outputs(plugins, outputs_cache=None):
+    from artellapipe.tools.playblastmanager.core import outputscache
+
+    manager_class = _get_manager_class()
+    manager = manager_class.__new__(manager_class)
+    manager._plugins = plugins
+    manager._outputs_cache = outputs_cache or outputscache.OutputsCache()
+
+    return manager.get_outputs()
+
+
+def _engine(fake_dcc, root):
+    from artellapipe.tools.playblastmanager.core import engine
+
+    return engine.PlayblastEngine(
+        playblasts_mgr=fakedcc.FakePlayblastsMgr(fake_dcc), media_mgr=fakedcc.FakeMediaMgr(root))
+
+
+def test_engine_capture(benchmark, fake_dcc, tmpdir):
+    from artellapipe.tools.playblastmanager.core import engine
+
+    capture_engine = _engine(fake_dcc, str(tmpdir))
+    options = {'start_frame': 1, 'end_frame': 48, 'format': 'image', 'compression': 'png'}
+    out_dir = str(tmpdir.join('out'))
+
+    def _capture():
+        job = capture_engine.run(engine.PlayblastJob(options, output_dir=out_dir))
+        assert job.succeeded
+
+    benchmark('engine_capture', _capture, setup=lambda: shutil.rmtree(out_dir, ignore_errors=True))
+
+
+def test_filename_allocation(benchmark, tmpdir):
+    from artellapipe.tools.playblastmanager.core import naming
+
+    allocator = naming.FilenameAllocator(str(tmpdir))
+
+    def _allocate():
+        for _ in range(100):
+            allocator.allocate()
+
+    benchmark('filename_allocation', _allocate)
+
+
+def test_plugin_discovery(benchmark, tool_framework, fake_dcc):
+    benchmark('plugin_discovery', _discover_plugins)
+
+
+def test_tool_startup(benchmark, qt_app, playblasts_mgr, upload_queue, presets_dir, tmpdir):
+    """
+    Measures PlayblastManager construction: widgets, presets, preview, plugins discovery through the manifest and
+    active preset loading
+    """
+
+    project = _FakeProject(str(tmpdir))
+    _write_presets(presets_dir, {'Codec': {'format': 'image', 'compression': 'png'}}, count=20)
+
+    def _startup():
+        manager = _create_manager(project)
+        assert len(manager._plugins) == len(DCC_PLUGINS)
+        manager.deleteLater()
+
+    benchmark('tool_startup', _startup, setup=qt_app.processEvents)
+
+
+def test_get_outputs_aggregation(benchmark, tool_framework, fake_dcc, tmpdir):
+    from artellapipe.tools.playblastmanager.core import outputscache
+
+    plugins = _create_plugins(_FakeProject(str(tmpdir)))
+    outputs_cache = outputscache.OutputsCache()
+    for playblast_plugin in plugins:
+        outputs_cache.register_plugin(playblast_plugin)
+
+    def _aggregate():
+        for _ in range(20):
+            _get_outputs(plugins, outputs_cache)
+
+    benchmark('get_outputs_aggregation', _aggregate)
+
+
+def test_get_inputs_aggregation(benchmark, tool_framework, fake_dcc, tmpdir):
+    plugins = _create_plugins(_FakeProject(str(tmpdir)))
+
+    def _aggregate():
+        for _ in range(20):
+            for playblast_plugin in plugins:
+                playblast_plugin.get_inputs(as_preset=True)
+
+    benchmark('get_inputs_aggregation', _aggregate)
+
+
+def test_preset_loading(benchmark, tool_framework, fake_dcc, presets_dir, tmpdir):
+    from artellapipe.tools.playblastmanager.core import presetindex
+    from artellapipe.tools.playblastmanager.widgets import presets
+
+    plugins = _create_plugins(_FakeProject(str(tmpdir)))
+    preset = dict((playblast_plugin.id, playblast_plugin.get_inputs(as_preset=True)) for playblast_plugin in plugins)
+    _write_presets(presets_dir, preset, count=20)
+
+    def _load_presets():
+        presets_index = presetindex.get_index()
+        for preset_file in presets.PlayblastPreset.discover_presets(paths=[str(presets_dir)]):
+            preset_inputs = presets_index.read_preset(preset_file)
+            for playblast_plugin in plugins:
+                playblast_plugin.apply_inputs(preset_inputs.get(playblast_plugin.id, dict()))
+
+    benchmark('preset_loading', _load_presets)
+
+
+def test_capture_path(benchmark, qt_app, playblasts_mgr, upload_queue, presets_dir, tmpdir, monkeypatch):
+    """
+    Measures PlayblastManager._on_capture: validation, outputs aggregation, capture stages in the main thread and
+    the rest of stages in the capture thread
+    """
+
+    from artellapipe.tools.playblastmanager.core import engine
+    from artellapipe.tools.playblastmanager.widgets import playblastmanager
+
+    # Active preset is loaded when the tool is built, so frames are captured as images
+    _write_presets(presets_dir, {'Codec': {'format': 'image', 'compression': 'png'}})
+    manager = _create_manager(_FakeProject(str(tmpdir)))
+
+    media_mgr = fakedcc.FakeMediaMgr(str(tmpdir))
+    engine_class = engine.PlayblastEngine
+    monkeypatch.setattr(
+        playblastmanager.engine, 'PlayblastEngine',
+        lambda **kwargs: engine_class(playblasts_mgr=playblasts_mgr, media_mgr=media_mgr, **kwargs))
+    out_dir = str(tmpdir.join('out_playblasts'))
+
+    def _capture():
+        assert manager._on_capture() is not False
+        capture_thread = manager._capture_thread
+        assert capture_thread
+        capture_thread.wait()
+        assert capture_thread.job.succeeded
+        qt_app.processEvents()
+
+    benchmark('capture_path', _capture, setup=lambda: shutil.rmtree(out_dir, ignore_errors=True))
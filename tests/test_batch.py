@@ -0,0 +1,149 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-tools-playblastmanager batch captures
+"""
+
+import os
+import sys
+import json
+
+import pytest
+
+pytest.importorskip('tpDcc')
+
+import artellapipe
+from artellapipe.tools.playblastmanager.core import batch, engine, worker
+
+
+@pytest.fixture
+def batch_capture(tmpdir, monkeypatch):
+    monkeypatch.setattr(batch, 'WORKER_MODULE', 'tests._batch_worker')
+    monkeypatch.setenv('PYTHONPATH', os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return batch.BatchCapture({'format': 'image'}, str(tmpdir), workers=2, retries=1, executable=sys.executable)
+
+
+def test_batch_captures_all_shots(batch_capture):
+    for i in range(3):
+        batch_capture.add_shot('shot_{}'.format(i), 'scene_{}.ma'.format(i))
+    statuses = list()
+    batch_capture.run(callback=lambda batch_shot: statuses.append(batch_shot.status))
+
+    assert batch_capture.get_status() == dict(('shot_{}'.format(i), engine.JobStatus.FINISHED) for i in range(3))
+    assert statuses.count(engine.JobStatus.RUNNING) == 3
+
+
+def test_batch_retries_failed_shots(batch_capture):
+    flaky_shot = batch_capture.add_shot('flaky_shot', 'scene.ma')
+    batch_capture.run()
+
+    assert flaky_shot.status == engine.JobStatus.FINISHED
+    assert flaky_shot.attempts == 2
+    assert flaky_shot.errors
+
+
+def test_batch_resets_shots_before_running_again(batch_capture):
+    flaky_shot = batch_capture.add_shot('flaky_shot', 'scene.ma')
+    batch_capture.run()
+    statuses = list()
+    batch_capture.run(callback=lambda batch_shot: statuses.append(batch_shot.status))
+
+    assert statuses.count(engine.JobStatus.RUNNING) == 2
+    assert flaky_shot.status == engine.JobStatus.FINISHED
+    assert flaky_shot.attempts == 2
+
+
+@pytest.fixture
+def shot_scenes(monkeypatch):
+    """
+    Fakes DCC scenes and project shots used by workers to resolve the options of each shot
+    """
+
+    scenes = {
+        'shot_a.ma': {'start_frame': 1, 'end_frame': 10, 'sound': 'shot_a.wav',
+                      'cameras': ['|persp', '|shot_a_cam', '|shot_b_cam']},
+        'shot_b.ma': {'start_frame': 101, 'end_frame': 150, 'sound': None, 'cameras': ['|persp', '|shot_b_cam']},
+        'empty.ma': {'start_frame': 1, 'end_frame': 10, 'sound': None, 'cameras': ['|persp', '|top']}
+    }
+    opened_scene = dict()
+
+    class _FakeDcc(object):
+        @staticmethod
+        def open_file(file_path, force=False):
+            opened_scene['scene'] = file_path
+
+        @staticmethod
+        def list_nodes(node_type=None):
+            return ['{}Shape'.format(camera) for camera in scenes[opened_scene['scene']]['cameras']]
+
+        @staticmethod
+        def shape_transform(shapes):
+            return [shape[:-len('Shape')] for shape in shapes]
+
+        @staticmethod
+        def node_short_name(node):
+            return node.split('|')[-1]
+
+        @staticmethod
+        def object_exists(node):
+            return node in scenes[opened_scene['scene']]['cameras']
+
+    class _FakePlayblastsMgr(object):
+        def parse_current_scene(self):
+            scene = dict(scenes[opened_scene['scene']])
+            scene.pop('cameras')
+            scene['camera'] = None
+            return scene
+
+    class _FakeShotsMgr(object):
+        def find_shot(self, shot_name):
+            return None
+
+    import tpDcc as tp
+    monkeypatch.setattr(tp, 'Dcc', _FakeDcc)
+    monkeypatch.setattr(artellapipe, 'PlayblastsMgr', _FakePlayblastsMgr, raising=False)
+    monkeypatch.setattr(artellapipe, 'ShotsMgr', _FakeShotsMgr, raising=False)
+
+    return scenes, opened_scene
+
+
+def test_batch_workers_resolve_scene_options_per_shot(tmpdir, shot_scenes):
+    scenes, opened_scene = shot_scenes
+
+    class _InProcessBatchCapture(batch.BatchCapture):
+        def run_worker(self, job_data, job_name):
+            job_file = str(tmpdir.join('{}.json'.format(job_name)))
+            with open(job_file, 'w') as fh:
+                json.dump(job_data, fh)
+            opened_scene['scene'] = job_data['scene']
+            resolved_options[job_name] = worker.resolve_scene_options(worker.read_job_file(job_file)['options'])
+            return {'status': engine.JobStatus.FINISHED, 'filename': None, 'errors': list()}
+
+    resolved_options = dict()
+    # Options retrieved from the scene opened in the UI
+    ui_options = {'format': 'image', 'start_frame': 1, 'end_frame': 10, 'frame': None, 'camera': '|shot_a_cam',
+                  'sound': 'shot_a.wav'}
+    batch_capture = _InProcessBatchCapture(ui_options, str(tmpdir), executable=sys.executable)
+    batch_capture.add_shot('shot_a', 'shot_a.ma')
+    batch_capture.add_shot('shot_b', 'shot_b.ma')
+    batch_capture.run()
+
+    for shot_name, scene in (('shot_a', 'shot_a.ma'), ('shot_b', 'shot_b.ma')):
+        for key in ('start_frame', 'end_frame', 'sound'):
+            assert resolved_options[shot_name][key] == scenes[scene][key]
+        assert resolved_options[shot_name]['camera'] == '|{}_cam'.format(shot_name)
+        assert resolved_options[shot_name]['format'] == 'image'
+
+
+def test_worker_fails_shots_without_camera(tmpdir, shot_scenes):
+    job_file = str(tmpdir.join('job.json'))
+    result_file = str(tmpdir.join('result.json'))
+    with open(job_file, 'w') as fh:
+        json.dump({'scene': 'empty.ma', 'options': {'format': 'image', 'shot_name': 'shot_c'}}, fh)
+
+    assert worker.main([job_file, '--result', result_file]) == 1
+    with open(result_file, 'r') as fh:
+        result = json.load(fh)
+    assert result['status'] == engine.JobStatus.FAILED
+    assert 'shot_c' in result['errors'][0]
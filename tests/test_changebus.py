@@ -0,0 +1,56 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-tools-playblastmanager options change bus
+"""
+
+import pytest
+
+pytest.importorskip('Qt')
+
+from Qt.QtCore import QCoreApplication
+
+from artellapipe.tools.playblastmanager.core import changebus
+
+
+@pytest.fixture(scope='module')
+def qt_app():
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+def test_changes_are_merged_per_plugin(qt_app):
+    emitted = list()
+    bus = changebus.OptionsChangeBus(interval=1000, max_wait=10000)
+    bus.optionsChanged.connect(emitted.append)
+
+    for _ in range(20):
+        bus.notify('Resolution')
+    bus.notify('DisplayOptions')
+    bus.notify('Resolution')
+    assert not emitted
+    assert bus.has_pending()
+
+    bus.flush()
+    assert emitted == [['Resolution', 'DisplayOptions']]
+    assert not bus.has_pending()
+
+    bus.flush()
+    assert len(emitted) == 1
+
+
+def test_changes_are_emitted_after_max_wait(qt_app, monkeypatch):
+    emitted = list()
+    current_time = [100.0]
+    monkeypatch.setattr(changebus.time, 'time', lambda: current_time[0])
+    bus = changebus.OptionsChangeBus(interval=1000, max_wait=500)
+    bus.optionsChanged.connect(emitted.append)
+
+    bus.notify('Resolution')
+    current_time[0] += 0.2
+    bus.notify('Resolution')
+    assert not emitted
+
+    current_time[0] += 0.4
+    bus.notify('Resolution')
+    assert emitted == [['Resolution']]
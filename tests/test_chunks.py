@@ -0,0 +1,51 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-tools-playblastmanager chunked captures
+"""
+
+import os
+
+import pytest
+
+pytest.importorskip('tpDcc')
+
+from artellapipe.tools.playblastmanager.core import chunks
+
+
+def test_split_frame_range():
+    assert chunks.split_frame_range(1, 10, chunk_size=4) == [(1, 4), (5, 8), (9, 10)]
+    assert chunks.split_frame_range(1, 10, chunks=2) == [(1, 5), (6, 10)]
+    assert chunks.split_frame_range(10, 1, chunk_size=4) == []
+
+
+def test_stitch_segments_discards_overlapped_frames(tmpdir):
+    segments = list()
+    for chunk_index, (start_frame, end_frame, overlap) in enumerate([(1, 3, 0), (4, 6, 2)]):
+        chunk_dir = tmpdir.mkdir('chunk_{}'.format(chunk_index))
+        segment_files = list()
+        for frame in range(start_frame - overlap, end_frame + 1):
+            segment_file = chunk_dir.join('shot.{}.png'.format(str(frame).zfill(4)))
+            segment_file.write(str(chunk_index))
+            segment_files.append(str(segment_file))
+        segments.append((segment_files, start_frame, end_frame))
+
+    stitched = chunks.stitch_segments(segments, str(tmpdir.join('out')), 'shot')
+
+    assert [os.path.basename(stitched_file) for stitched_file in stitched] == [
+        'shot.{}.png'.format(str(frame).zfill(4)) for frame in range(1, 7)]
+    assert [open(stitched_file).read() for stitched_file in stitched] == ['0', '0', '0', '1', '1', '1']
+
+
+def test_chunks_only_capture_their_own_frames(tmpdir, monkeypatch):
+    chunked_capture = chunks.ChunkedCapture(
+        {'start_frame': 1, 'end_frame': 10, 'frame': [9, 2, 3, 4, 12], 'format': 'image', 'camera': 'shot_cam'},
+        'scene.ma', str(tmpdir), chunk_size=3, executable='mayapy')
+    monkeypatch.setattr(chunked_capture.batch, 'run', lambda callback=None: None)
+
+    chunked_capture.run()
+
+    assert chunked_capture.get_chunks() == [(2, 4), (8, 10), (11, 12)]
+    assert [shot.options['frame'] for shot in chunked_capture.batch.shots] == [[2, 3, 4], [9], [12]]
+    assert all(shot.options['camera'] == 'shot_cam' for shot in chunked_capture.batch.shots)
@@ -0,0 +1,59 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-tools-playblastmanager plugins discovery
+"""
+
+import os
+import sys
+import json
+
+import pytest
+
+from artellapipe.tools.playblastmanager.core import discovery
+
+FOO_MODULE = 'discovery_test_foo'
+BAR_MODULE = 'discovery_test_bar'
+
+
+@pytest.fixture
+def plugins_folder(tmpdir):
+    folder = tmpdir.mkdir('plugins')
+    folder.join('{}.py'.format(FOO_MODULE)).write('class FooPlugin(Exception):\n    id = "Foo"\n')
+    folder.join('{}.py'.format(BAR_MODULE)).write('class BarPlugin(Exception):\n    id = "Bar"\n')
+    yield str(folder)
+    for module_name in (FOO_MODULE, BAR_MODULE):
+        sys.modules.pop(module_name, None)
+
+
+def test_manifest_only_imports_requested_plugins(plugins_folder, tmpdir):
+    manifest_file = str(tmpdir.join('manifest.json'))
+
+    plugins = discovery.get_plugins([plugins_folder], Exception, manifest_file=manifest_file)
+    assert sorted(plugins.keys()) == ['BarPlugin', 'FooPlugin']
+    with open(manifest_file, 'r') as fh:
+        manifest = json.load(fh)
+    modules = manifest['folders'][plugins_folder]['modules']
+    assert sorted(module['name'] for module in modules.values()) == [BAR_MODULE, FOO_MODULE]
+
+    for module_name in (FOO_MODULE, BAR_MODULE):
+        sys.modules.pop(module_name)
+    plugins = discovery.get_plugins([plugins_folder], Exception, plugin_ids=['Foo'], manifest_file=manifest_file)
+    assert list(plugins.keys()) == ['FooPlugin']
+    assert FOO_MODULE in sys.modules
+    assert BAR_MODULE not in sys.modules
+
+
+def test_manifest_is_rebuilt_when_plugin_files_change(plugins_folder, tmpdir):
+    manifest_file = str(tmpdir.join('manifest.json'))
+    discovery.get_plugins([plugins_folder], Exception, manifest_file=manifest_file)
+
+    foo_file = os.path.join(plugins_folder, '{}.py'.format(FOO_MODULE))
+    with open(foo_file, 'a') as fh:
+        fh.write('\n\nclass BazPlugin(Exception):\n    id = "Baz"\n')
+    mtime = os.path.getmtime(foo_file) + 10
+    os.utime(foo_file, (mtime, mtime))
+
+    plugins = discovery.get_plugins([plugins_folder], Exception, plugin_ids=['Baz'], manifest_file=manifest_file)
+    assert list(plugins.keys()) == ['BazPlugin']
@@ -0,0 +1,298 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-tools-playblastmanager headless engine
+"""
+
+import os
+
+import pytest
+
+pytest.importorskip('tpDcc')
+
+from artellapipe.tools.playblastmanager.core import engine
+
+
+class _FakeMediaMgr(object):
+    def __init__(self, root):
+        self._root = root
+
+    def create_temp_path(self, name):
+        temp_path = os.path.join(self._root, 'temp_{}'.format(name))
+        os.makedirs(temp_path)
+        return temp_path
+
+
+class _FakePlayblastsMgr(object):
+    def __init__(self):
+        self.captures = list()
+
+    def capture_scene(self, **options):
+        self.captures.append(dict(options))
+        out_file = '{}.mov'.format(options['filename'])
+        with open(out_file, 'w') as fh:
+            fh.write('movie')
+        return out_file
+
+
+class _FakeImagePlayblastsMgr(_FakePlayblastsMgr):
+    def capture_scene(self, **options):
+        self.captures.append(dict(options))
+        for frame in options.get('frame', None) or range(options['start_frame'], options['end_frame'] + 1):
+            with open('{}.{}.png'.format(options['filename'], str(frame).zfill(4)), 'w') as fh:
+                fh.write('frame')
+        return '{}.####.png'.format(options['filename'])
+
+
+class _FakeFingerprinter(object):
+    def __init__(self, fingerprints):
+        self.fingerprints = fingerprints
+
+    def get_fingerprints(self, frames, options):
+        return dict((frame, self.fingerprints[frame]) for frame in frames)
+
+
+def _list_playblasts(folder):
+    return sorted(file_name for file_name in os.listdir(folder) if not file_name.startswith('.'))
+
+
+def _engine(tmpdir):
+    return engine.PlayblastEngine(playblasts_mgr=_FakePlayblastsMgr(), media_mgr=_FakeMediaMgr(str(tmpdir)))
+
+
+def test_run_moves_capture_to_output_folder(tmpdir):
+    out_dir = str(tmpdir.mkdir('out'))
+    job = engine.PlayblastJob({'start_frame': 1, 'end_frame': 10}, output_dir=out_dir)
+    _engine(tmpdir).run(job)
+
+    assert job.succeeded
+    assert job.options['filename'] == [os.path.join(out_dir, 'playblast_0.mov').replace('\\', '/')]
+    assert os.path.isfile(job.options['filename'][0])
+    assert not os.path.isdir(job.temp_dir)
+
+
+def test_stream_capture_with_unsupported_codec_captures_movie(tmpdir, monkeypatch):
+    monkeypatch.setattr(engine.streaming, 'get_ffmpeg_executable', lambda: 'ffmpeg')
+    out_dir = str(tmpdir.mkdir('out'))
+    capture_engine = _engine(tmpdir)
+    options = {'start_frame': 1, 'end_frame': 3, 'format': 'qt', 'compression': 'Sorenson Video 3',
+               'stream_capture': True}
+    job = capture_engine.run(engine.PlayblastJob(options, output_dir=out_dir))
+
+    assert job.succeeded
+    assert capture_engine.playblasts_mgr.captures[0]['format'] == 'qt'
+    assert capture_engine.playblasts_mgr.captures[0]['compression'] == 'Sorenson Video 3'
+
+
+def test_stream_capture_with_sound_captures_movie(tmpdir, monkeypatch):
+    monkeypatch.setattr(engine.streaming, 'get_ffmpeg_executable', lambda: 'ffmpeg')
+    out_dir = str(tmpdir.mkdir('out'))
+    capture_engine = _engine(tmpdir)
+    options = {'start_frame': 1, 'end_frame': 3, 'format': 'qt', 'compression': 'H.264', 'sound': 'audio1',
+               'stream_capture': True}
+    job = capture_engine.run(engine.PlayblastJob(options, output_dir=out_dir))
+
+    assert job.succeeded
+    assert capture_engine.playblasts_mgr.captures[0]['format'] == 'qt'
+    assert capture_engine.playblasts_mgr.captures[0]['sound'] == 'audio1'
+
+
+def test_run_without_output_dir_fails(tmpdir):
+    job = engine.PlayblastJob({}, output_dir=None)
+    _engine(tmpdir).run(job)
+
+    assert job.status == engine.JobStatus.FAILED
+    assert job.errors
+
+
+def test_stream_capture_moves_frames_while_capturing(tmpdir):
+    out_dir = str(tmpdir.mkdir('out'))
+    playblasts_mgr = _FakeImagePlayblastsMgr()
+    capture_engine = engine.PlayblastEngine(playblasts_mgr=playblasts_mgr, media_mgr=_FakeMediaMgr(str(tmpdir)))
+    options = {'start_frame': 1, 'end_frame': 5, 'format': 'image', 'compression': 'jpg', 'stream_capture': True}
+    job = capture_engine.run(engine.PlayblastJob(options, output_dir=out_dir))
+
+    assert job.succeeded
+    assert _list_playblasts(out_dir) == ['playblast_0.{}.png'.format(str(i).zfill(4)) for i in range(1, 6)]
+    assert playblasts_mgr.captures[0]['viewer'] is False
+
+
+def test_stream_capture_opens_viewer_once_frames_are_moved(tmpdir, monkeypatch):
+    opened_files = list()
+    monkeypatch.setattr(engine.osplatform, 'open_file', opened_files.append)
+    out_dir = str(tmpdir.mkdir('out'))
+    playblasts_mgr = _FakeImagePlayblastsMgr()
+    capture_engine = engine.PlayblastEngine(playblasts_mgr=playblasts_mgr, media_mgr=_FakeMediaMgr(str(tmpdir)))
+    options = {'start_frame': 1, 'end_frame': 3, 'format': 'image', 'compression': 'png', 'stream_capture': True,
+               'viewer': True}
+    job = capture_engine.run(engine.PlayblastJob(options, output_dir=out_dir))
+
+    assert job.succeeded
+    assert playblasts_mgr.captures[0]['viewer'] is False
+    assert opened_files == [os.path.join(out_dir, 'playblast_0.0001.png')]
+
+
+def test_cancel_stops_at_stage_boundary_and_removes_temp_files(tmpdir):
+    out_dir = str(tmpdir.mkdir('out'))
+    capture_engine = _engine(tmpdir)
+    job = capture_engine.run(
+        engine.PlayblastJob({'start_frame': 1, 'end_frame': 10}, output_dir=out_dir),
+        stages=capture_engine.CAPTURE_STAGES)
+    assert job.succeeded
+
+    started_stages = list()
+
+    def _on_stage_started(job, stage_name, stage_index, total_stages):
+        started_stages.append(stage_name)
+        job.cancel()
+
+    capture_engine.run(job, stages=capture_engine.POST_CAPTURE_STAGES, stage_callback=_on_stage_started)
+
+    assert started_stages == ['stamp']
+    assert job.status == engine.JobStatus.CANCELLED
+    assert not os.path.isdir(job.temp_dir)
+    assert not _list_playblasts(out_dir)
+
+
+def test_incremental_capture_only_captures_changed_frames(tmpdir):
+    out_dir = str(tmpdir.mkdir('out'))
+    playblasts_mgr = _FakeImagePlayblastsMgr()
+    fingerprinter = _FakeFingerprinter(dict((frame, 'a') for frame in range(1, 6)))
+    capture_engine = engine.PlayblastEngine(
+        playblasts_mgr=playblasts_mgr, media_mgr=_FakeMediaMgr(str(tmpdir)), fingerprinter=fingerprinter)
+    options = {
+        'start_frame': 1, 'end_frame': 5, 'format': 'image', 'incremental_capture': True,
+        'cache_dir': str(tmpdir.join('cache')), 'filename': os.path.join(out_dir, 'shot')}
+
+    capture_engine.run(engine.PlayblastJob(options))
+    fingerprinter.fingerprints[3] = 'b'
+    job = capture_engine.run(engine.PlayblastJob(options))
+
+    assert job.succeeded
+    assert [capture['frame'] for capture in playblasts_mgr.captures] == [[1, 2, 3, 4, 5], [3]]
+    assert sorted(os.listdir(out_dir)) == ['shot.{}.png'.format(str(i).zfill(4)) for i in range(1, 6)]
+
+
+def test_burnin_stamps_frames_instead_of_project_stamp(tmpdir, monkeypatch):
+    stamped_frames = list()
+
+    class _FakeStamper(object):
+        def stamp_files(self, frame_files, frame_numbers):
+            stamped_frames.extend(frame_numbers)
+
+    class _BurnInEngine(engine.PlayblastEngine):
+        def create_stamper(self, job, frames):
+            return _FakeStamper()
+
+    monkeypatch.setattr(engine.stamper, 'is_available', lambda: True)
+    out_dir = str(tmpdir.mkdir('out'))
+    capture_engine = _BurnInEngine(playblasts_mgr=_FakeImagePlayblastsMgr(), media_mgr=_FakeMediaMgr(str(tmpdir)))
+    options = {'start_frame': 1, 'end_frame': 3, 'format': 'image', 'enable_stamp': True, 'stamp_burnin': True}
+    job = capture_engine.run(engine.PlayblastJob(options, output_dir=out_dir))
+
+    assert job.succeeded
+    assert stamped_frames == [1, 2, 3]
+    assert _list_playblasts(out_dir) == ['playblast_0.{}.png'.format(str(i).zfill(4)) for i in range(1, 4)]
+
+
+def test_burnin_movie_is_uploaded_to_tracker(tmpdir, monkeypatch):
+    class _FakeStamper(object):
+        def stamp_files(self, frame_files, frame_numbers):
+            pass
+
+    class _BurnInEngine(engine.PlayblastEngine):
+        def create_stamper(self, job, frames):
+            return _FakeStamper()
+
+    class _FakeUploadQueue(object):
+        def __init__(self):
+            self.uploads = list()
+
+        def enqueue(self, preview_file, *args, **kwargs):
+            self.uploads.append(preview_file)
+
+    def _encode_sequence(sequence_files, movie_file, codec_args, fps=24):
+        with open(movie_file, 'w') as fh:
+            fh.write('movie')
+        return movie_file
+
+    monkeypatch.setattr(engine.stamper, 'is_available', lambda: True)
+    monkeypatch.setattr(engine.streaming, 'get_ffmpeg_executable', lambda: 'ffmpeg')
+    monkeypatch.setattr(engine.streaming, 'encode_sequence', _encode_sequence)
+    out_dir = str(tmpdir.mkdir('out'))
+    upload_queue = _FakeUploadQueue()
+    capture_engine = _BurnInEngine(
+        playblasts_mgr=_FakeImagePlayblastsMgr(), media_mgr=_FakeMediaMgr(str(tmpdir)), upload_queue=upload_queue)
+    options = {
+        'start_frame': 1, 'end_frame': 3, 'format': 'qt', 'compression': 'H.264', 'enable_stamp': True,
+        'stamp_burnin': True, 'tracker_enable': True}
+    job = capture_engine.run(engine.PlayblastJob(options, output_dir=out_dir))
+
+    assert job.succeeded
+    assert job.filename == os.path.join(out_dir, 'playblast_0.mov').replace('\\', '/')
+    assert upload_queue.uploads == [job.filename]
+    assert os.path.isfile(job.filename)
+
+
+def test_burnin_movie_is_encoded_at_scene_frame_rate(tmpdir, monkeypatch):
+    encoded_fps = list()
+
+    class _FakeStamper(object):
+        def stamp_files(self, frame_files, frame_numbers):
+            pass
+
+    class _BurnInEngine(engine.PlayblastEngine):
+        def create_stamper(self, job, frames):
+            return _FakeStamper()
+
+    def _encode_sequence(sequence_files, movie_file, codec_args, fps=24):
+        encoded_fps.append(fps)
+        with open(movie_file, 'w') as fh:
+            fh.write('movie')
+        return movie_file
+
+    monkeypatch.setattr(engine, 'get_scene_fps', lambda: 25)
+    monkeypatch.setattr(engine.stamper, 'is_available', lambda: True)
+    monkeypatch.setattr(engine.streaming, 'get_ffmpeg_executable', lambda: 'ffmpeg')
+    monkeypatch.setattr(engine.streaming, 'encode_sequence', _encode_sequence)
+    capture_engine = _BurnInEngine(playblasts_mgr=_FakeImagePlayblastsMgr(), media_mgr=_FakeMediaMgr(str(tmpdir)))
+    options = {'start_frame': 1, 'end_frame': 3, 'format': 'qt', 'compression': 'H.264', 'enable_stamp': True,
+               'stamp_burnin': True}
+    job = capture_engine.run(engine.PlayblastJob(options, output_dir=str(tmpdir.mkdir('out'))))
+
+    assert job.succeeded
+    assert job.fps == 25
+    assert encoded_fps == [25]
+
+
+def test_burnin_sink_stamps_frames_in_batches():
+    stamped_batches = list()
+    processed_frames = list()
+
+    class _FakeStamper(object):
+        batch_size = 2
+
+        def stamp_files(self, frame_files, frame_numbers):
+            stamped_batches.append(list(frame_numbers))
+
+    class _FakeSink(engine.streaming.FrameSink):
+        def process(self, frame_file):
+            processed_frames.append(frame_file)
+
+    sink = engine.stamper.BurnInFrameSink(_FakeStamper(), _FakeSink(), frame_numbers=[10, 11, 12])
+    for frame_file in ('a', 'b', 'c'):
+        sink.process(frame_file)
+    sink.close()
+
+    assert stamped_batches == [[10, 11], [12]]
+    assert processed_frames == ['a', 'b', 'c']
+
+
+def test_run_records_stage_timings(tmpdir):
+    out_dir = str(tmpdir.mkdir('out'))
+    job = _engine(tmpdir).run(engine.PlayblastJob({'start_frame': 1, 'end_frame': 10}, output_dir=out_dir))
+
+    stages = [record['stage'] for record in job.timings if not record['parent']]
+    assert stages == list(engine.PlayblastEngine.STAGES)
+    assert [record['parent'] for record in job.timings if record['stage'] == 'capture_scene'] == ['capture']
@@ -0,0 +1,63 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-tools-playblastmanager incremental captures cache
+"""
+
+import os
+import time
+
+import pytest
+
+pytest.importorskip('tpDcc')
+
+from artellapipe.tools.playblastmanager.core import incremental
+
+
+def _cache_shot(cache_dir, shot_name, frame_file, last_used=None, **kwargs):
+    frame_cache = incremental.FrameCache(cache_dir, shot_name, **kwargs)
+    frame_cache.store(1, 'fingerprint', frame_file)
+    frame_cache.save()
+    if last_used is not None:
+        manifest_path = os.path.join(frame_cache.cache_dir, frame_cache.MANIFEST_NAME)
+        os.utime(manifest_path, (last_used, last_used))
+    return frame_cache
+
+
+@pytest.fixture
+def frame_file(tmpdir):
+    frame_file = tmpdir.join('frame.png')
+    frame_file.write('x' * 100)
+    return str(frame_file)
+
+
+def test_shots_not_captured_recently_are_removed(tmpdir, frame_file):
+    cache_dir = str(tmpdir.join('cache'))
+    old_cache = _cache_shot(cache_dir, 'shot_a', frame_file, last_used=time.time() - 100)
+    recent_cache = _cache_shot(cache_dir, 'shot_b', frame_file, last_used=time.time() - 10)
+    _cache_shot(cache_dir, 'shot_c', frame_file, max_age=50)
+
+    assert not os.path.isdir(old_cache.cache_dir)
+    assert not recent_cache.get_changed_frames({1: 'fingerprint'})
+
+
+def test_least_recently_captured_shots_are_removed_when_cache_is_full(tmpdir, frame_file):
+    cache_dir = str(tmpdir.join('cache'))
+    now = time.time()
+    shot_caches = [_cache_shot(cache_dir, 'shot_{}'.format(i), frame_file, last_used=now - 10 + i) for i in range(3)]
+    # Each shot uses 100 bytes of frames plus its manifest, so only the frames of two shots fit in the cache
+    current_cache = _cache_shot(cache_dir, 'shot_3', frame_file, max_bytes=400)
+
+    assert [os.path.isdir(shot_cache.cache_dir) for shot_cache in shot_caches] == [False, False, True]
+    assert not current_cache.get_changed_frames({1: 'fingerprint'})
+
+
+def test_frames_not_stored_in_manifest_are_removed(tmpdir, frame_file):
+    frame_cache = _cache_shot(str(tmpdir.join('cache')), 'shot_a', frame_file)
+    jpg_file = tmpdir.join('frame.jpg')
+    jpg_file.write('x')
+    frame_cache.store(1, 'other_fingerprint', str(jpg_file))
+    frame_cache.save()
+
+    assert sorted(os.listdir(frame_cache.cache_dir)) == ['frame.1.jpg', frame_cache.MANIFEST_NAME]
@@ -0,0 +1,42 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-tools-playblastmanager file name allocation
+"""
+
+import os
+import threading
+
+from artellapipe.tools.playblastmanager.core import naming
+
+
+def test_allocate_sequential_names(tmpdir):
+    allocator = naming.FilenameAllocator(str(tmpdir))
+
+    assert [os.path.basename(allocator.allocate()) for _ in range(3)] == [
+        'playblast_0', 'playblast_1', 'playblast_2']
+
+
+def test_allocate_skips_existing_playblasts(tmpdir):
+    tmpdir.join('playblast_4.mov').write('')
+    tmpdir.join('other.mov').write('')
+
+    assert os.path.basename(naming.FilenameAllocator(str(tmpdir)).allocate()) == 'playblast_5'
+
+
+def test_allocate_unique_names_across_concurrent_sessions(tmpdir):
+    names = list()
+
+    def _allocate():
+        allocator = naming.FilenameAllocator(str(tmpdir))
+        for _ in range(20):
+            names.append(allocator.allocate())
+
+    threads = [threading.Thread(target=_allocate) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(set(names)) == 80
@@ -0,0 +1,78 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-tools-playblastmanager plugin outputs cache
+"""
+
+import pytest
+
+pytest.importorskip('tpDcc')
+
+from artellapipe.tools.playblastmanager.core import outputscache
+
+
+class _FakeSignal(object):
+    def __init__(self):
+        self._callbacks = list()
+
+    def connect(self, callback):
+        self._callbacks.append(callback)
+
+    def emit(self, *args):
+        for callback in self._callbacks:
+            callback(*args)
+
+
+class _FakePlugin(object):
+    cache_outputs = True
+    scene_events = ('timeChanged',)
+
+    def __init__(self, plugin_id):
+        self.id = plugin_id
+        self.optionsChanged = _FakeSignal()
+        self.calls = 0
+
+    def get_outputs(self):
+        self.calls += 1
+        return {'camera_options': {'displayGateMask': False}, 'calls': self.calls}
+
+
+def test_outputs_are_cached_until_options_change():
+    playblast_plugin = _FakePlugin('TimeRange')
+    outputs_cache = outputscache.OutputsCache()
+    outputs_cache.register_plugin(playblast_plugin)
+
+    outputs = outputs_cache.get_outputs(playblast_plugin)
+    outputs['camera_options']['overscan'] = 1.0
+    assert outputs_cache.get_outputs(playblast_plugin) == {'camera_options': {'displayGateMask': False}, 'calls': 1}
+
+    playblast_plugin.optionsChanged.emit()
+    assert outputs_cache.get_outputs(playblast_plugin)['calls'] == 2
+
+
+def test_scene_events_only_invalidate_dependent_plugins():
+    time_plugin = _FakePlugin('TimeRange')
+    camera_plugin = _FakePlugin('Camera')
+    camera_plugin.scene_events = tuple()
+    outputs_cache = outputscache.OutputsCache()
+    for playblast_plugin in (time_plugin, camera_plugin):
+        outputs_cache.register_plugin(playblast_plugin)
+        outputs_cache.get_outputs(playblast_plugin)
+
+    assert 'timeChanged' in outputs_cache.get_scene_events()
+    outputs_cache.on_scene_event('timeChanged')
+    assert outputs_cache.get_outputs(time_plugin)['calls'] == 2
+    assert outputs_cache.get_outputs(camera_plugin)['calls'] == 1
+
+    outputs_cache.on_scene_event('SceneOpened')
+    assert outputs_cache.get_outputs(camera_plugin)['calls'] == 2
+
+
+def test_uncached_plugins_are_always_queried():
+    playblast_plugin = _FakePlugin('Save')
+    playblast_plugin.cache_outputs = False
+    outputs_cache = outputscache.OutputsCache()
+
+    outputs_cache.get_outputs(playblast_plugin)
+    assert outputs_cache.get_outputs(playblast_plugin)['calls'] == 2
@@ -0,0 +1,62 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-tools-playblastmanager base plugins
+"""
+
+import pytest
+
+pytest.importorskip('Qt')
+pytest.importorskip('tpDcc.libs.qt')
+
+from Qt.QtCore import Signal
+from Qt.QtWidgets import QApplication, QWidget
+
+from artellapipe.tools.playblastmanager.core import plugin
+
+
+@pytest.fixture(scope='module')
+def qt_app():
+    return QApplication.instance() or QApplication([])
+
+
+class _FakePlugin(QWidget):
+    id = 'Fake'
+    label = 'Fake'
+    collapsed = True
+    cache_outputs = True
+    scene_events = ('timeChanged',)
+    labelChanged = Signal(str)
+    optionsChanged = Signal()
+    instances = 0
+
+    def __init__(self, project, config, parent=None):
+        super(_FakePlugin, self).__init__(parent)
+        _FakePlugin.instances += 1
+        self.inputs = dict()
+
+    def get_outputs(self):
+        return {'fake': self.inputs.get('value', None)}
+
+    def get_inputs(self, as_preset=False):
+        return dict(self.inputs)
+
+    def update_inputs(self, attrs_dict):
+        self.inputs = dict(attrs_dict)
+
+
+def test_lazy_plugin_is_built_when_outputs_are_requested(qt_app):
+    _FakePlugin.instances = 0
+    lazy_plugin = plugin.LazyPlayblastPlugin(_FakePlugin, project=None, config=dict())
+
+    assert lazy_plugin.id == 'Fake'
+    assert lazy_plugin.scene_events == ('timeChanged',)
+    lazy_plugin.update_inputs({'value': 10})
+    assert not lazy_plugin.loaded
+    assert _FakePlugin.instances == 0
+
+    assert lazy_plugin.get_outputs() == {'fake': 10}
+    assert lazy_plugin.loaded
+    assert lazy_plugin.get_outputs() == {'fake': 10}
+    assert _FakePlugin.instances == 1
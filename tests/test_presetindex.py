@@ -0,0 +1,104 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-tools-playblastmanager presets index
+"""
+
+import os
+import json
+
+import pytest
+
+from artellapipe.tools.playblastmanager.core import presetindex
+
+
+@pytest.fixture
+def presets_folder(tmpdir):
+    folder = tmpdir.mkdir('presets')
+    folder.join('default.json').write(json.dumps({'Resolution': {'width': 1920}}))
+    folder.join('broken.json').write('{')
+    folder.join('_private.json').write(json.dumps({}))
+    folder.join('empty.json').write('')
+    return str(folder)
+
+
+def test_only_valid_presets_are_indexed(presets_folder, tmpdir):
+    index_file = str(tmpdir.join('index.json'))
+    presets = presetindex.PresetsIndex(index_file).get_presets([presets_folder])
+
+    assert [preset['label'] for preset in presets] == ['default']
+    with open(index_file, 'r') as fh:
+        files = json.load(fh)['files']
+    assert sorted(os.path.basename(file_path) for file_path in files) == ['broken.json', 'default.json', 'empty.json']
+
+
+def test_index_is_replaced_without_leaving_temporary_files(presets_folder, tmpdir):
+    index_folder = tmpdir.mkdir('index')
+    index_file = str(index_folder.join('index.json'))
+    presetindex.PresetsIndex(index_file).get_presets([presets_folder])
+    with open(os.path.join(presets_folder, 'other.json'), 'w') as fh:
+        json.dump({'Resolution': {'width': 1280}}, fh)
+    presetindex.PresetsIndex(index_file).get_presets([presets_folder])
+
+    assert os.listdir(str(index_folder)) == ['index.json']
+    with open(index_file, 'r') as fh:
+        assert len(json.load(fh)['files']) == 4
+
+
+def test_unchanged_presets_are_not_read_again(presets_folder, tmpdir):
+    index_file = str(tmpdir.join('index.json'))
+    presetindex.PresetsIndex(index_file).get_presets([presets_folder])
+
+    # Contents are broken keeping size and modification time, so the preset is only valid if it is not read again
+    preset_file = os.path.join(presets_folder, 'default.json')
+    stat = os.stat(preset_file)
+    with open(preset_file, 'w') as fh:
+        fh.write('x' * stat.st_size)
+    os.utime(preset_file, (stat.st_atime, stat.st_mtime))
+
+    index = presetindex.PresetsIndex(index_file)
+    assert [preset['label'] for preset in index.get_presets([presets_folder])] == ['default']
+    assert index.validate(preset_file)
+    assert not index.validate(os.path.join(presets_folder, 'broken.json'))
+
+
+def test_modified_presets_are_read_again(presets_folder, tmpdir):
+    index = presetindex.PresetsIndex(str(tmpdir.join('index.json')))
+    preset_file = os.path.join(presets_folder, 'default.json')
+    assert index.read_preset(preset_file) == {'Resolution': {'width': 1920}}
+
+    with open(preset_file, 'w') as fh:
+        json.dump({'Resolution': {'width': 1280, 'height': 720}}, fh)
+    os.utime(preset_file, (os.path.getatime(preset_file), os.path.getmtime(preset_file) + 10))
+
+    assert index.read_preset(preset_file) == {'Resolution': {'width': 1280, 'height': 720}}
+    assert [preset['label'] for preset in index.get_presets([presets_folder])] == ['default']
+
+    os.remove(preset_file)
+    assert index.get_presets([presets_folder]) == list()
+
+
+def test_updated_presets_are_notified_only_if_contents_change(presets_folder, tmpdir):
+    index = presetindex.PresetsIndex(str(tmpdir.join('index.json')))
+    index.get_presets([presets_folder])
+    preset_file = os.path.join(presets_folder, 'default.json')
+    stat = os.stat(preset_file)
+
+    os.utime(preset_file, (stat.st_atime, stat.st_mtime + 10))
+    assert index.update_presets([presets_folder]) == {'added': list(), 'updated': list(), 'removed': list()}
+
+    with open(preset_file, 'w') as fh:
+        json.dump({'Resolution': {'width': 1280}}, fh)
+    os.utime(preset_file, (stat.st_atime, stat.st_mtime + 20))
+    with open(os.path.join(presets_folder, 'new.json'), 'w') as fh:
+        json.dump({}, fh)
+    os.remove(os.path.join(presets_folder, 'broken.json'))
+
+    changes = index.update_presets([presets_folder])
+    assert [entry['label'] for entry in changes['updated']] == ['default']
+    assert [entry['label'] for entry in changes['added']] == ['new']
+    assert changes['removed'] == list()
+
+    os.remove(preset_file)
+    assert index.update_presets([presets_folder])['removed'] == [preset_file]
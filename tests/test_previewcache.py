@@ -0,0 +1,103 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-tools-playblastmanager previews cache
+"""
+
+import os
+
+from artellapipe.tools.playblastmanager.core import snapshot, previewcache
+
+
+def test_previews_are_cached_by_options_and_frame():
+    cache = previewcache.PreviewCache(max_size=2)
+    options = snapshot.PlayblastOptions({'camera': 'persp', 'viewport_options': {'grid': False}})
+
+    cache.add(cache.get_key(options, 1, 'shot.ma'), 'frame_1')
+    same_options = snapshot.PlayblastOptions(options.to_dict())
+    assert cache.get(cache.get_key(same_options, 1, 'shot.ma')) == 'frame_1'
+    assert cache.get(cache.get_key(same_options, 2, 'shot.ma')) is None
+    assert cache.get(cache.get_key(options.replace(camera='shot_cam'), 1, 'shot.ma')) is None
+
+
+def test_least_recently_used_previews_are_removed():
+    cache = previewcache.PreviewCache(max_size=2)
+    cache.add('a', 1)
+    cache.add('b', 2)
+    cache.get('a')
+    cache.add('c', 3)
+
+    assert 'a' in cache and 'c' in cache
+    assert 'b' not in cache
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_scratch_folder_is_reused():
+    scratch_folder = previewcache.get_scratch_folder()
+
+    assert os.path.isdir(scratch_folder)
+    assert previewcache.get_scratch_folder() == scratch_folder
+
+
+def test_filmstrip_frames_are_evenly_spaced():
+    options = snapshot.PlayblastOptions({'start_frame': 1, 'end_frame': 101})
+
+    assert previewcache.get_filmstrip_frames(options, 5) == [1, 26, 51, 76, 101]
+    assert previewcache.get_filmstrip_frames(options.replace(end_frame=3), 5) == [1, 2, 3]
+    assert previewcache.get_filmstrip_frames(options.replace(frame=[10, 5, 20]), 2) == [5, 20]
+    assert previewcache.get_filmstrip_frames(snapshot.PlayblastOptions(), 5) == list()
+
+
+def test_previews_are_removed_when_memory_limit_is_exceeded():
+    cache = previewcache.PreviewCache(max_size=None, max_bytes=10, get_size=len)
+    cache.add('a', 'xxxx')
+    cache.add('b', 'xxxx')
+    cache.add('c', 'xxxx')
+
+    assert 'a' not in cache
+    assert 'b' in cache and 'c' in cache
+    assert cache.total_bytes == 8
+
+
+def test_time_range_changes_keep_cached_frames():
+    cache = previewcache.PreviewCache()
+    options = snapshot.PlayblastOptions({'camera': 'persp', 'start_frame': 1, 'end_frame': 100})
+    cache.add(cache.get_key(options, 50, 'shot.ma'), 'frame_50')
+
+    assert cache.get(cache.get_key(options.replace(start_frame=25), 50, 'shot.ma')) == 'frame_50'
+    assert cache.get(cache.get_key(options.replace(camera='shot_cam'), 50, 'shot.ma')) is None
+
+
+def test_scene_previews_are_removed_without_removing_other_scenes():
+    cache = previewcache.PreviewCache(max_size=None, max_bytes=100, get_size=len)
+    options = snapshot.PlayblastOptions({'camera': 'persp'})
+    cache.add(cache.get_key(options, 1, 'shot_a.ma'), 'a1')
+    cache.add(cache.get_key(options, 2, 'shot_a.ma'), 'a2')
+    cache.add(cache.get_key(options, 1, 'shot_b.ma'), 'b1')
+
+    cache.remove_scene('shot_a.ma')
+
+    assert len(cache) == 1
+    assert cache.get(cache.get_key(options, 1, 'shot_b.ma')) == 'b1'
+    assert cache.total_bytes == 2
+
+
+def test_render_budget_lowers_resolution_of_slow_renders():
+    budget = previewcache.RenderBudget(time_budget=0.2, min_scale=0.25)
+    assert budget.get_size(320, 180) == (320, 180)
+
+    budget.update(0.5)
+    assert budget.get_size(320, 180) == (160, 90)
+    budget.update(0.5)
+    budget.update(0.5)
+    assert budget.scale == 0.25
+
+    # A fast render at quarter resolution would still be too slow at half resolution
+    budget.update(0.09)
+    assert budget.scale == 0.25
+    budget.update(0.02)
+    assert budget.scale == 0.5
+    budget.reset()
+    assert budget.scale == 1.0
@@ -0,0 +1,46 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-tools-playblastmanager startup profiler
+"""
+
+import json
+
+from artellapipe.tools.playblastmanager.core import profiler
+
+
+def test_startup_report_lists_plugin_stages(tmpdir, monkeypatch):
+    report_file = str(tmpdir.join('startup.json'))
+    monkeypatch.setenv(profiler.PROFILE_STARTUP_ENV, report_file)
+
+    startup_profiler = profiler.StartupProfiler()
+    with startup_profiler.activate(), startup_profiler.measure('__init__'):
+        with profiler.get_active_profiler().measure('ui', plugin='Camera', parent='__init__'):
+            cameras = [list(range(100)) for _ in range(100)]
+    assert profiler.get_active_profiler() is not startup_profiler
+    report = startup_profiler.finish(name='PlayblastManager')
+
+    assert cameras
+    assert list(report['summary'].keys()) == ['__init__', 'ui/Camera']
+    assert report['total'] == report['summary']['__init__']
+    if profiler.tracemalloc:
+        assert report['allocations']['ui/Camera'] > 0
+    with open(report_file, 'r') as fh:
+        assert json.load(fh)['name'] == 'PlayblastManager'
+
+    table = profiler.format_report(report, top=1)
+    assert len(table.splitlines()) == 3
+    assert profiler.main([report_file, '--sort', 'allocated']) == 0
+
+
+def test_disabled_profiler_only_records_time(monkeypatch):
+    monkeypatch.delenv(profiler.PROFILE_STARTUP_ENV, raising=False)
+
+    startup_profiler = profiler.StartupProfiler()
+    with startup_profiler.measure('register_tokens'):
+        pass
+
+    assert not startup_profiler.enabled
+    assert startup_profiler.records[0]['allocated'] is None
+    assert startup_profiler.finish()['allocations'] == dict()
@@ -0,0 +1,60 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-tools-playblastmanager options snapshots
+"""
+
+import pickle
+
+import pytest
+
+from artellapipe.tools.playblastmanager.core import snapshot
+
+
+def test_snapshots_are_immutable_and_hashable():
+    options = snapshot.PlayblastOptions(
+        {'frame': [1, 2, 3], 'camera_options': {'overscan': 1.0}, 'display_options': {'background': (0.6, 0.6, 0.6)}})
+
+    assert options['frame'] == (1, 2, 3)
+    assert isinstance(options['camera_options'], snapshot.PlayblastOptions)
+    with pytest.raises(TypeError):
+        options['width'] = 960
+    with pytest.raises(AttributeError):
+        options.width = 960
+
+    same_options = snapshot.PlayblastOptions(options.to_dict())
+    assert same_options == options
+    assert hash(same_options) == hash(options)
+    assert {options: 'cached'}[same_options] == 'cached'
+    assert pickle.loads(pickle.dumps(options)) == options
+
+
+def test_to_dict_returns_mutable_copy():
+    source = {'frame': [1, 2], 'camera_options': {'overscan': 1.0}, 'background': (0.6, 0.6, 0.6)}
+    options = snapshot.PlayblastOptions(source)
+
+    result = options.to_dict()
+    assert result == source
+    assert isinstance(result['frame'], list)
+    assert isinstance(result['background'], tuple)
+    result['camera_options']['overscan'] = 2.0
+    assert options['camera_options']['overscan'] == 1.0
+
+
+def test_merge_updates_nested_options_and_shares_unchanged_values():
+    options = snapshot.PlayblastOptions.from_outputs([
+        {'camera': 'persp', 'camera_options': {'overscan': 1.0, 'displayGateMask': False},
+         'viewport_options': {'grid': False}},
+        None,
+        {'camera_options': {'overscan': 1.3}, 'width': 960}])
+
+    assert options.to_dict() == {
+        'camera': 'persp', 'camera_options': {'overscan': 1.3, 'displayGateMask': False},
+        'viewport_options': {'grid': False}, 'width': 960}
+
+    changed = options.replace(width=1920)
+    assert changed['width'] == 1920
+    assert options['width'] == 960
+    assert changed['viewport_options'] is options['viewport_options']
+    assert changed != options
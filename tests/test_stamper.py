@@ -0,0 +1,43 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-tools-playblastmanager burn-in stamper
+"""
+
+import pytest
+
+np = pytest.importorskip('numpy')
+pytest.importorskip('tpDcc')
+
+from artellapipe.tools.playblastmanager.core import stamper
+
+
+def test_atlas_renders_texts_with_the_same_size():
+    atlas = stamper.GlyphAtlas(scale=2)
+    masks = atlas.render(['12', 'SHOT_010'])
+
+    assert masks.shape == (2, atlas.glyph_height, atlas.glyph_width * 8)
+    assert masks[0].sum() > 0
+    # Short texts are padded with blank glyphs
+    assert masks[0, :, atlas.glyph_width * 2:].sum() == 0
+
+
+def test_unknown_characters_are_rendered():
+    atlas = stamper.GlyphAtlas()
+
+    assert (atlas.render(['~'])[0] == atlas.render(['?'])[0]).all()
+
+
+def test_stamp_frames_only_modifies_text_regions():
+    frames = np.full((3, 270, 480, 3), 100, dtype=np.uint8)
+    burnin_stamper = stamper.BurnInStamper(
+        shot='shot_010', camera='|cam|camShape', date='01-01-2020', focal_lengths={1: 35.0, 2: 35.0, 3: 50.0})
+    burnin_stamper.stamp_frames(frames, [1, 2, 3])
+
+    assert (frames[:, 120:150] == 100).all()
+    assert (frames[:, :16] != 100).any(axis=(1, 2, 3)).all()
+    assert (frames[:, -16:] != 100).any(axis=(1, 2, 3)).all()
+    # Frame number and focal length change between frames
+    assert (frames[0] != frames[2]).any()
+    assert (frames[0, :16] == frames[1, :16]).all()
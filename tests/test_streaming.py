@@ -0,0 +1,104 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-tools-playblastmanager streaming captures
+"""
+
+import os
+import sys
+import stat
+
+import pytest
+
+pytest.importorskip('tpDcc')
+
+from artellapipe.tools.playblastmanager.core import streaming
+
+
+class _RecordSink(streaming.FrameSink):
+    def __init__(self, capture_dir):
+        self.capture_dir = capture_dir
+        self.frames = list()
+        self.max_pending = 0
+
+    def process(self, frame_file):
+        self.max_pending = max(self.max_pending, len(os.listdir(self.capture_dir)))
+        self.frames.append(streaming.get_frame_number(frame_file))
+        os.remove(frame_file)
+
+    def close(self):
+        return self.frames
+
+
+def _create_fake_ffmpeg(tmpdir, exit_code=0):
+    """
+    Creates an executable that, like FFmpeg, writes a lot of output before reading the frames piped into it
+    """
+
+    fake_ffmpeg = tmpdir.join('ffmpeg')
+    fake_ffmpeg.write('\n'.join([
+        '#!{}'.format(sys.executable),
+        'import sys',
+        'sys.stderr.write("ffmpeg output " * 20000)',
+        'sys.stderr.flush()',
+        'frames = sys.stdin.buffer.read() if hasattr(sys.stdin, "buffer") else sys.stdin.read()',
+        'open(sys.argv[-1], "wb").write(frames)',
+        'sys.exit({})'.format(exit_code)]))
+    os.chmod(str(fake_ffmpeg), os.stat(str(fake_ffmpeg)).st_mode | stat.S_IEXEC)
+
+    return str(fake_ffmpeg)
+
+
+def test_get_frame_number():
+    assert streaming.get_frame_number('/tmp/shot.0012.png') == 12
+    assert streaming.get_frame_number('/tmp/playblast_0.mov') is None
+
+
+def test_frame_stream_processes_frames_in_order(tmpdir):
+    capture_dir = str(tmpdir)
+    sink = _RecordSink(capture_dir)
+    frame_stream = streaming.FrameStream(capture_dir, sink, max_queued=2, poll_interval=0.001)
+    frame_stream.start()
+    for frame in range(1, 51):
+        with open(os.path.join(capture_dir, 'shot.{}.png'.format(str(frame).zfill(4))), 'w') as fh:
+            fh.write('frame')
+    frames = frame_stream.finish()
+
+    assert frames == list(range(1, 51))
+    assert not os.listdir(capture_dir)
+
+
+def test_get_movie_codec_uses_codec_options():
+    extension, codec_args = streaming.get_movie_codec({'format': 'qt', 'compression': 'H.264', 'quality': 50})
+    assert extension == '.mov'
+    assert codec_args[codec_args.index('-c:v') + 1] == 'libx264'
+    assert codec_args[codec_args.index('-crf') + 1] == '26'
+
+    extension, codec_args = streaming.get_movie_codec({'format': 'avi', 'compression': 'none'})
+    assert extension == '.avi'
+    assert codec_args == ['-c:v', 'rawvideo']
+
+    assert streaming.get_movie_codec({'format': 'qt', 'compression': 'Sorenson Video 3'}) is None
+    assert streaming.get_movie_codec({'format': 'image', 'compression': 'png'}) is None
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='Fake FFmpeg executable is a Python script')
+def test_encoder_sink_does_not_block_when_ffmpeg_output_is_not_read(tmpdir):
+    movie_file = str(tmpdir.join('shot.mov'))
+    sink = streaming.EncoderFrameSink(movie_file, ['-c:v', 'png'], ffmpeg=_create_fake_ffmpeg(tmpdir))
+    for frame in range(1, 4):
+        frame_file = tmpdir.join('shot.{}.png'.format(str(frame).zfill(4)))
+        frame_file.write_binary(b'0' * 200000)
+        sink.process(str(frame_file))
+
+    assert sink.close() == [movie_file]
+    assert os.path.getsize(movie_file) == 600000
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='Fake FFmpeg executable is a Python script')
+def test_encoder_sink_fails_when_ffmpeg_fails(tmpdir):
+    sink = streaming.EncoderFrameSink(
+        str(tmpdir.join('shot.mov')), ['-c:v', 'png'], ffmpeg=_create_fake_ffmpeg(tmpdir, exit_code=1))
+
+    assert sink.close() == list()
@@ -0,0 +1,40 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-tools-playblastmanager capture timings
+"""
+
+import json
+
+from artellapipe.tools.playblastmanager.core import timings
+
+
+def test_report_total_only_includes_top_level_stages():
+    records = list()
+    with timings.measure(records, 'get_outputs'):
+        with timings.measure(records, 'get_outputs', plugin='Cameras', parent='get_outputs'):
+            pass
+    with timings.measure(records, 'capture'):
+        with timings.measure(records, 'capture_scene', parent='capture'):
+            pass
+    report = timings.create_report(records, name='playblast_0', status='finished')
+
+    assert list(report['summary'].keys()) == ['get_outputs', 'get_outputs/Cameras', 'capture', 'capture_scene']
+    stage_durations = [record['duration'] for record in records
+                       if record['stage'] in ('get_outputs', 'capture') and not record['plugin']]
+    assert report['total'] == sum(stage_durations)
+
+
+def test_write_report_appends_json_lines(tmpdir):
+    log_file = str(tmpdir.join('logs', 'timings.jsonl'))
+    records = list()
+    with timings.measure(records, 'stamp'):
+        pass
+    timings.write_report(timings.create_report(records, name='playblast_0'), log_file)
+    timings.write_report(timings.create_report(records, name='playblast_1'), log_file)
+
+    with open(log_file, 'r') as fh:
+        lines = [json.loads(line) for line in fh.readlines()]
+    assert [line['name'] for line in lines] == ['playblast_0', 'playblast_1']
+    assert lines[0]['stage'] == 'stamp'
@@ -0,0 +1,83 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-tools-playblastmanager tracker index
+"""
+
+import pytest
+
+pytest.importorskip('tpDcc')
+
+from artellapipe.tools.playblastmanager.core import trackerindex
+
+
+class _Shot(object):
+    def __init__(self, name):
+        self._name = name
+
+    def get_id(self):
+        return '{}_id'.format(self._name)
+
+    def get_name(self):
+        return self._name
+
+
+class _Task(object):
+    def __init__(self, name):
+        self.id = '{}_id'.format(name)
+        self.name = name
+
+
+class _FakeShotsMgr(object):
+    def __init__(self):
+        self.requests = 0
+
+    def get_shots_from_sequence(self, sequence_name):
+        self.requests += 1
+        return [_Shot('shot_010'), _Shot('shot_020')]
+
+    def find_shot(self, shot_name):
+        self.requests += 1
+        return _Shot(shot_name)
+
+
+class _FakeTracker(object):
+    def __init__(self):
+        self.requests = 0
+        self.task_names = ['Layout', 'Animation']
+
+    def get_tasks_in_shot(self, shot_id):
+        self.requests += 1
+        return [_Task(task_name) for task_name in self.task_names]
+
+
+def test_lookups_are_retrieved_once():
+    shots_mgr = _FakeShotsMgr()
+    tracker = _FakeTracker()
+    tracker_index = trackerindex.TrackerIndex(tracker=tracker, shots_mgr=shots_mgr)
+
+    assert tracker_index.get_shot_names('seq_01') == ['shot_010', 'shot_020']
+    for _ in range(3):
+        assert tracker_index.get_task('seq_01', 'shot_010', 'Animation').id == 'Animation_id'
+    assert shots_mgr.requests == 1
+    assert tracker.requests == 1
+
+
+def test_missing_tasks_are_retrieved_again():
+    tracker = _FakeTracker()
+    tracker_index = trackerindex.TrackerIndex(tracker=tracker, shots_mgr=_FakeShotsMgr())
+    tracker_index.get_tasks('seq_01', 'shot_010')
+    tracker.task_names.append('Lighting')
+
+    assert tracker_index.get_task('seq_01', 'shot_010', 'Lighting')
+    assert tracker.requests == 2
+
+
+def test_expired_entries_are_retrieved_again():
+    shots_mgr = _FakeShotsMgr()
+    tracker_index = trackerindex.TrackerIndex(tracker=_FakeTracker(), shots_mgr=shots_mgr, ttl=-1)
+    tracker_index.get_shots('seq_01')
+    tracker_index.get_shots('seq_01')
+
+    assert shots_mgr.requests == 2
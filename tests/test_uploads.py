@@ -0,0 +1,146 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-tools-playblastmanager background tracker uploads
+"""
+
+import json
+import time
+
+import pytest
+
+pytest.importorskip('tpDcc')
+
+from artellapipe.tools.playblastmanager.core import uploads, trackerindex
+
+
+class _Shot(object):
+    def get_id(self):
+        return 'shot_id'
+
+    def get_name(self):
+        return 'shot_010'
+
+
+class _Task(object):
+    id = 'task_id'
+    name = 'Animation'
+
+
+class _FakeShotsMgr(object):
+    def get_shots_from_sequence(self, sequence_name):
+        return [_Shot()]
+
+    def find_shot(self, shot_name):
+        return _Shot()
+
+
+class _FakeTracker(object):
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.uploaded = list()
+
+    def get_tasks_in_shot(self, shot_id):
+        return [_Task()]
+
+    def upload_shot_task_preview(self, task_id, comment='', preview_file_path=None, status=''):
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError('Tracker not available')
+        self.uploaded.append(preview_file_path)
+        return True
+
+
+def _queue(tmpdir, tracker, **kwargs):
+    tracker_index = trackerindex.TrackerIndex(tracker=tracker, shots_mgr=_FakeShotsMgr())
+    return uploads.UploadQueue(journal_file=str(tmpdir.join('uploads.json')), tracker_index=tracker_index, **kwargs)
+
+
+def _preview_file(tmpdir):
+    preview_file = tmpdir.join('playblast_0.mov')
+    preview_file.write('movie')
+    return str(preview_file)
+
+
+def test_failed_uploads_are_retried_with_backoff(tmpdir):
+    tracker = _FakeTracker(failures=2)
+    upload_queue = _queue(tmpdir, tracker, base_delay=10.0)
+    upload_queue.enqueue(_preview_file(tmpdir), 'seq_01', 'shot_010', 'Animation')
+    now = time.time() + 1.0
+
+    assert upload_queue.process_pending(now=now) == 1
+    entry = upload_queue.journal.get_entries()[0]
+    assert entry['attempts'] == 1
+    assert entry['next_attempt'] == now + 10.0
+
+    assert upload_queue.process_pending(now=now + 5.0) == 0
+    assert upload_queue.process_pending(now=now + 10.0) == 1
+    assert upload_queue.journal.get_entries()[0]['next_attempt'] == now + 30.0
+
+    upload_queue.process_pending(now=now + 30.0)
+    assert tracker.uploaded
+    assert not upload_queue.journal.get_entries()
+
+
+def test_pending_uploads_are_resumed_by_a_new_queue(tmpdir):
+    upload_queue = _queue(tmpdir, _FakeTracker(failures=1), base_delay=0.0)
+    upload_queue.enqueue(_preview_file(tmpdir), 'seq_01', 'shot_010', 'Animation')
+    upload_queue.process_pending()
+
+    tracker = _FakeTracker()
+    _queue(tmpdir, tracker).process_pending()
+
+    assert len(tracker.uploaded) == 1
+
+
+def test_uploads_are_marked_as_failed_after_max_attempts(tmpdir):
+    uploaded = list()
+    upload_queue = _queue(tmpdir, _FakeTracker(failures=5), base_delay=0.0, max_attempts=2)
+    upload_queue.add_callback(lambda entry, result: uploaded.append(result))
+    upload_queue.enqueue(_preview_file(tmpdir), 'seq_01', 'shot_010', 'Animation')
+    upload_queue.process_pending()
+    upload_queue.process_pending()
+    upload_queue.process_pending()
+
+    assert uploaded == [False, False]
+    assert upload_queue.journal.get_entries()[0]['state'] == uploads.UploadState.FAILED
+
+
+def test_uploads_of_missing_files_fail_without_retrying(tmpdir):
+    tracker = _FakeTracker()
+    upload_queue = _queue(tmpdir, tracker, base_delay=0.0)
+    upload_queue.enqueue(str(tmpdir.join('missing.mov')), 'seq_01', 'shot_010', 'Animation')
+    upload_queue.process_pending()
+
+    assert upload_queue.process_pending() == 0
+    failed_entries = upload_queue.get_failed()
+    assert len(failed_entries) == 1
+    assert failed_entries[0]['attempts'] == 1
+    assert not tracker.uploaded
+
+
+def test_failed_uploads_are_cleared(tmpdir):
+    upload_queue = _queue(tmpdir, _FakeTracker(), base_delay=0.0)
+    upload_queue.enqueue(str(tmpdir.join('missing.mov')), 'seq_01', 'shot_010', 'Animation')
+    upload_queue.process_pending()
+    upload_queue.enqueue(_preview_file(tmpdir), 'seq_01', 'shot_010', 'Animation', comment='pending')
+
+    assert upload_queue.clear_failed() == 1
+    assert not upload_queue.get_failed()
+    assert [entry['comment'] for entry in upload_queue.journal.get_entries()] == ['pending']
+
+
+def test_upload_durations_are_logged(tmpdir):
+    timings_log = str(tmpdir.join('timings.jsonl'))
+    upload_queue = _queue(tmpdir, _FakeTracker(failures=1), base_delay=0.0, timings_log=timings_log)
+    preview_file = _preview_file(tmpdir)
+    upload_queue.enqueue(preview_file, 'seq_01', 'shot_010', 'Animation')
+    upload_queue.process_pending()
+    upload_queue.process_pending()
+
+    with open(timings_log, 'r') as fh:
+        records = [json.loads(line) for line in fh]
+    assert [(record['stage'], record['status']) for record in records] == [
+        ('upload', 'upload_failed'), ('upload', 'uploaded')]
+    assert all(record['name'] == preview_file and record['duration'] >= 0.0 for record in records)
@@ -0,0 +1,83 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-tools-playblastmanager viewport grabbing
+"""
+
+import pytest
+
+pytest.importorskip('Qt')
+pytest.importorskip('tpDcc')
+
+from artellapipe.tools.playblastmanager.core import snapshot, viewportgrab
+
+
+def _get_live_value_getter(live_options):
+    # By default, viewport is 16:9, shows ornaments and has no 2D pan/zoom
+    default_options = {
+        viewportgrab.VIEW_OPTIONS: {'size': (1280, 720), 'show_ornaments': True},
+        'camera_options': {'panZoomEnabled': False}}
+
+    def _get_live_value(group, key):
+        value = live_options.get(group, dict()).get(key, viewportgrab.MISSING)
+        if value is viewportgrab.MISSING:
+            value = default_options.get(group, dict()).get(key, viewportgrab.MISSING)
+        return value
+    return _get_live_value
+
+
+def test_view_matches_when_overrides_are_the_live_ones():
+    options = snapshot.PlayblastOptions({
+        'camera': '|shot_cam',
+        'display_options': {'background': [0.5, 0.5, 0.5], 'displayGradient': True},
+        'viewport_options': {'grid': False}})
+    live_options = {
+        'display_options': {'background': [(0.5, 0.50001, 0.5)], 'displayGradient': 1},
+        'viewport_options': {'grid': False}}
+
+    assert viewportgrab.matches_live_view(options, 'shot_cam', _get_live_value_getter(live_options))
+    assert not viewportgrab.matches_live_view(options, 'persp', _get_live_value_getter(live_options))
+
+
+def test_view_does_not_match_when_an_override_differs():
+    options = snapshot.PlayblastOptions({'viewport_options': {'grid': False, 'rendererName': 'vp2Renderer'}})
+    live_options = {'viewport_options': {'grid': True, 'rendererName': 'vp2Renderer'}}
+
+    assert not viewportgrab.matches_live_view(options, 'persp', _get_live_value_getter(live_options))
+    live_options['viewport_options']['grid'] = False
+    assert viewportgrab.matches_live_view(options, 'persp', _get_live_value_getter(live_options))
+    assert not viewportgrab.matches_live_view(
+        options.replace(camera_options={'overscan': 1.0}), 'persp', _get_live_value_getter(live_options))
+    assert not viewportgrab.matches_live_view(
+        options.replace(isolate=['pCube1']), 'persp', _get_live_value_getter(live_options))
+
+
+def test_view_does_not_match_when_aspect_ratio_differs():
+    options = snapshot.PlayblastOptions({'width': 1920, 'height': 1080})
+
+    assert viewportgrab.matches_live_view(options, 'persp', _get_live_value_getter(dict()))
+    assert viewportgrab.matches_live_view(options, 'persp', _get_live_value_getter(dict()), size=(320, 180))
+    assert not viewportgrab.matches_live_view(options, 'persp', _get_live_value_getter(dict()), size=(320, 240))
+    live_options = {viewportgrab.VIEW_OPTIONS: {'size': (1000, 1000)}}
+    assert not viewportgrab.matches_live_view(options, 'persp', _get_live_value_getter(live_options))
+
+
+def test_view_does_not_match_when_ornaments_or_pan_zoom_differ():
+    options = snapshot.PlayblastOptions({'show_ornaments': False})
+
+    assert not viewportgrab.matches_live_view(options, 'persp', _get_live_value_getter(dict()))
+    live_options = {viewportgrab.VIEW_OPTIONS: {'show_ornaments': False}}
+    assert viewportgrab.matches_live_view(options, 'persp', _get_live_value_getter(live_options))
+
+    # Playblasts do not apply the 2D pan/zoom shown by the viewport unless it is enabled for renders
+    live_options['camera_options'] = {'panZoomEnabled': True, 'renderPanZoom': False}
+    assert not viewportgrab.matches_live_view(options, 'persp', _get_live_value_getter(live_options))
+    live_options['camera_options']['renderPanZoom'] = True
+    assert viewportgrab.matches_live_view(options, 'persp', _get_live_value_getter(live_options))
+
+    pan_zoom_options = options.replace(camera_options={'panZoomEnabled': 1, 'zoom': 1.0})
+    live_options['camera_options'] = {'panZoomEnabled': True, 'renderPanZoom': False, 'zoom': 1.0}
+    assert viewportgrab.matches_live_view(pan_zoom_options, 'persp', _get_live_value_getter(live_options))
+    live_options['camera_options']['zoom'] = 0.5
+    assert not viewportgrab.matches_live_view(pan_zoom_options, 'persp', _get_live_value_getter(live_options))